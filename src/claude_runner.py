@@ -9,8 +9,10 @@ import contextlib
 import json
 import os
 import re
+import selectors
 import subprocess
 import time
+from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
@@ -153,6 +155,7 @@ def run_claude(
     execution_stage: str | None = None,
     mcp_config_path: str | None = None,
     process_registrar: Callable[[subprocess.Popen[str]], None] | None = None,
+    poll_interval: float = 1.0,
 ) -> ClaudeResult:
     """
     Run the Claude CLI with a given prompt and return the response with metrics.
@@ -173,6 +176,8 @@ def run_claude(
         mcp_config_path: Path to MCP configuration file. If provided, adds --mcp-config flag.
         process_registrar: Optional callback invoked immediately after subprocess spawn.
             Called with the Popen object, enabling external tracking/termination.
+        poll_interval: How long to wait for output readiness per loop iteration
+            in seconds (default: 1.0). Bounds how late a hang can be detected.
 
     Returns:
         ClaudeResult containing response text and optional LLMMetrics
@@ -257,9 +262,34 @@ def run_claude(
         non_json_output = []  # Capture non-JSON output for error reporting
         llm_metrics: LLMMetrics | None = None
 
-        # Read stdout line by line
+        # Read stdout line by line. When stdout exposes a real file
+        # descriptor, wait for readiness with a bounded poll so the timeout
+        # checks below still run while a hung subprocess produces no output;
+        # otherwise fall back to blocking readline.
         logger.debug("Reading streaming JSON output")
         assert process.stdout is not None, "stdout should be available"
+        selector = None
+        stdout_fd = -1
+        try:
+            stdout_fd = process.stdout.fileno()
+            # Mock stdout objects return a non-int from fileno(); relying on
+            # register() to reject those is platform-dependent (epoll vs
+            # kqueue), so validate explicitly before touching the selector.
+            if not isinstance(stdout_fd, int):
+                raise TypeError(f"stdout fileno() is not an int: {stdout_fd!r}")
+            selector = selectors.DefaultSelector()
+            selector.register(stdout_fd, selectors.EVENT_READ)
+        except (OSError, ValueError, TypeError):
+            selector = None
+
+        # Selector-path read state: the fd is read directly with os.read and
+        # split into lines here, never through process.stdout.readline, so no
+        # delivered output can hide in the TextIOWrapper's Python-level buffer
+        # where the fd-level selector cannot see it.
+        pending = b""
+        buffered_lines: deque[bytes] = deque()
+        saw_eof = False
+
         while True:
             current_time = time.time()
 
@@ -281,19 +311,51 @@ def run_claude(
                     f"Claude execution exceeded inactivity timeout of {inactivity_timeout} seconds"
                 )
 
-            # Read a line from stdout
-            line = process.stdout.readline()
+            if selector is not None:
+                # Refill the line buffer when it is empty: wait for readiness,
+                # then read a chunk and split complete lines. EOF is reported
+                # as readable, so process exit needs no special case here and
+                # os.read is never entered on a quiet pipe (which could block
+                # if a child of the exited process still held it open).
+                if not buffered_lines and not saw_eof:
+                    if selector.select(timeout=poll_interval):
+                        chunk = os.read(stdout_fd, 65536)
+                        if chunk:
+                            last_activity_time = time.time()
+                            pending += chunk
+                            *complete, pending = pending.split(b"\n")
+                            buffered_lines.extend(complete)
+                        else:
+                            saw_eof = True
+                            if pending:
+                                buffered_lines.append(pending)
+                                pending = b""
+
+                if buffered_lines:
+                    line = buffered_lines.popleft().decode("utf-8", errors="replace")
+                elif saw_eof:
+                    break
+                else:
+                    continue
 
-            # If no more output and process has finished, break
-            if not line and process.poll() is not None:
-                break
+                # Skip empty lines
+                if not line.strip():
+                    continue
+            else:
+                # Fallback for stdout objects without a real file descriptor
+                # (e.g. mocks): blocking readline, as before
+                line = process.stdout.readline()
 
-            # Skip empty lines
-            if not line or not line.strip():
-                continue
+                # If no more output and process has finished, break
+                if not line and process.poll() is not None:
+                    break
+
+                # Skip empty lines
+                if not line or not line.strip():
+                    continue
 
-            # Got output, reset inactivity timer
-            last_activity_time = time.time()
+                # Got output, reset inactivity timer
+                last_activity_time = time.time()
 
             # Parse JSON line
             try:
@@ -418,6 +480,9 @@ def run_claude(
         raise ClaudeRunnerError(enhanced_error) from e
 
     except subprocess.TimeoutExpired as e:
+        # Reached when stdout hit EOF but the child never exited (e.g. it
+        # closed stdout and wedged): kill it so it cannot be orphaned.
+        process.kill()
         logger.error(f"Process wait timeout: {e}")
         raise ClaudeTimeoutError("Claude process timed out during cleanup") from e
 
@@ -2236,8 +2236,12 @@ class Daemon:
                 try:
                     fresh_labels = self.ticket_client.get_ticket_labels(item.repo, item.ticket_id)
                     if Labels.YOLO in fresh_labels:
-                        self.ticket_client.remove_label(item.repo, item.ticket_id, Labels.YOLO)
-                        self.ticket_client.add_label(item.repo, item.ticket_id, Labels.YOLO_FAILED)
+                        self.ticket_client.set_labels(
+                            item.repo,
+                            item.ticket_id,
+                            add=[Labels.YOLO_FAILED],
+                            remove=[Labels.YOLO],
+                        )
                         logger.warning(
                             f"YOLO: Workflow failed for {key}, cancelled auto-progression"
                         )
@@ -1,6 +1,7 @@
 """Frontmatter parsing for issue descriptions."""
 
 import re
+from functools import lru_cache
 from typing import Any
 
 import yaml
@@ -13,6 +14,29 @@ logger = get_logger(__name__)
 FRONTMATTER_PATTERN = re.compile(r"^```\s*\n(.*?)\n```", re.DOTALL)
 
 
+@lru_cache(maxsize=128)
+def _parse_frontmatter_cached(body: str) -> dict[str, Any]:
+    """Parse frontmatter from a non-empty body, memoized per body text.
+
+    The daemon parses the same issue body several times per poll cycle
+    (blocked-by check, worktree preparation, workflow dispatch), so the
+    regex match and YAML load are cached by body string.
+    """
+    match = FRONTMATTER_PATTERN.match(body)
+    if not match:
+        return {}
+
+    frontmatter_text = match.group(1)
+    try:
+        result = yaml.safe_load(frontmatter_text)
+        if isinstance(result, dict):
+            return result
+        return {}
+    except yaml.YAMLError as e:
+        logger.warning(f"Failed to parse issue frontmatter: {e}")
+        return {}
+
+
 def parse_issue_frontmatter(body: str | None) -> dict[str, Any]:
     """Parse YAML frontmatter from issue body.
 
@@ -29,21 +53,10 @@ def parse_issue_frontmatter(body: str | None) -> dict[str, Any]:
         body: Issue body text, may be None
 
     Returns:
-        Dict of frontmatter settings, empty if none found or parsing fails
+        Dict of frontmatter settings, empty if none found or parsing fails.
+        Callers receive a fresh shallow copy, so the cached entry stays
+        unmodified even if the result is mutated.
     """
     if not body:
         return {}
-
-    match = FRONTMATTER_PATTERN.match(body)
-    if not match:
-        return {}
-
-    frontmatter_text = match.group(1)
-    try:
-        result = yaml.safe_load(frontmatter_text)
-        if isinstance(result, dict):
-            return result
-        return {}
-    except yaml.YAMLError as e:
-        logger.warning(f"Failed to parse issue frontmatter: {e}")
-        return {}
+    return dict(_parse_frontmatter_cached(body))
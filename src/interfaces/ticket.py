@@ -4,6 +4,7 @@ This module defines the interface that all ticket system integrations
 must implement (GitHub, Jira, Linear, etc.).
 """
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Protocol, runtime_checkable
@@ -137,6 +138,16 @@ class TicketClient(Protocol):
         """Remove a label from a ticket."""
         ...
 
+    def set_labels(
+        self,
+        repo: str,
+        ticket_id: int,
+        add: Iterable[str] = (),
+        remove: Iterable[str] = (),
+    ) -> None:
+        """Apply multiple label additions and removals in one call."""
+        ...
+
     # Repo label management
     def get_repo_labels(self, repo: str) -> list[str]:
         """Get all labels defined in a repo."""
@@ -8,14 +8,31 @@ import json
 import os
 import re
 import subprocess
+import time
+from collections.abc import Iterable
 from datetime import datetime
-from typing import Any
+from typing import Any, NoReturn
 
 from src.interfaces import Comment, LinkedPullRequest, TicketItem
 from src.logger import get_logger, is_debug_mode
 
 logger = get_logger(__name__)
 
+try:
+    # orjson (optional "performance" extra) parses gh's JSON output several
+    # times faster than the stdlib on label- and board-sized payloads.
+    import orjson
+
+    def json_loads(text: str | bytes) -> Any:
+        """Parse JSON from gh output using orjson when available."""
+        return orjson.loads(text)
+
+except ImportError:  # stdlib fallback keeps orjson strictly optional
+
+    def json_loads(text: str | bytes) -> Any:
+        """Parse JSON from gh output using the stdlib."""
+        return json.loads(text)
+
 
 class NetworkError(Exception):
     """Raised when a GitHub API call fails due to network connectivity issues.
@@ -42,6 +59,54 @@ class NetworkError(Exception):
     pass
 
 
+# Markers used to classify gh CLI failures. Classification happens once per
+# error via classify_gh_error instead of scattering substring scans across
+# call sites.
+_NETWORK_ERROR_MARKERS = (
+    "tls handshake timeout",
+    "connection timeout",
+    "network error",
+    "connection refused",
+    "temporary failure",
+    "i/o timeout",
+    "dial tcp",  # Go network dial errors
+    "no such host",  # DNS resolution failures
+)
+
+_AUTH_ERROR_MARKERS = (
+    "gh auth login",
+    "authentication",
+    "unauthorized",
+    "401",
+    "not logged in",
+    "no token",
+)
+
+# Rate limits are deliberately excluded: they do not clear within a short
+# backoff window, so retrying them only burns extra subprocess calls.
+_TRANSIENT_ERROR_MARKERS = ("http 500", "http 502", "http 503", "http 504")
+
+_LABEL_MISSING_MARKERS = ("not found", "does not exist", "no labels")
+
+
+def classify_gh_error(e: subprocess.CalledProcessError) -> str:
+    """Classify a failed gh invocation by its stderr/stdout content.
+
+    Returns one of "network", "auth", "transient", "label_missing" or
+    "other".
+    """
+    error_output = ((e.stderr or "") + (e.stdout or "")).lower()
+    if any(marker in error_output for marker in _NETWORK_ERROR_MARKERS):
+        return "network"
+    if any(marker in error_output for marker in _AUTH_ERROR_MARKERS):
+        return "auth"
+    if any(marker in error_output for marker in _TRANSIENT_ERROR_MARKERS):
+        return "transient"
+    if "label" in error_output and any(marker in error_output for marker in _LABEL_MISSING_MARKERS):
+        return "label_missing"
+    return "other"
+
+
 class GitHubClientBase:
     """Base class for GitHub clients with shared functionality.
 
@@ -71,6 +136,10 @@ class GitHubClientBase:
     CLASSIC_PAT_PREFIX = "ghp_"
     FINE_GRAINED_PAT_PREFIX = "github_pat_"
 
+    # Maximum attempts for transient server-side failures inside
+    # _run_gh_command (classified via classify_gh_error).
+    _MAX_TRANSIENT_RETRIES = 3
+
     def __init__(self, tokens: dict[str, str] | None = None) -> None:
         """Initialize the GitHub client.
 
@@ -702,12 +771,7 @@ class GitHubClientBase:
             logger.info(f"Added label '{label}' to {repo}#{ticket_id}")
         except subprocess.CalledProcessError as e:
             # Check if error is due to label not existing
-            error_output = (e.stderr or "") + (e.stdout or "")
-            if "label" in error_output.lower() and (
-                "not found" in error_output.lower()
-                or "does not exist" in error_output.lower()
-                or "no labels" in error_output.lower()
-            ):
+            if classify_gh_error(e) == "label_missing":
                 logger.info(f"Label '{label}' not found in {repo}, creating it")
                 if self.create_repo_label(repo, label):
                     # Retry adding the label after creation
@@ -735,6 +799,51 @@ class GitHubClientBase:
         except subprocess.CalledProcessError:
             logger.debug(f"Label '{label}' not on {repo}#{ticket_id} or doesn't exist")
 
+    def set_labels(
+        self,
+        repo: str,
+        ticket_id: int,
+        add: Iterable[str] = (),
+        remove: Iterable[str] = (),
+    ) -> None:
+        """Apply multiple label additions and removals in one gh invocation.
+
+        gh issue edit accepts repeated --add-label/--remove-label flags, so
+        batching amortizes the subprocess and network round trip across all
+        label changes for an issue.
+
+        Args:
+            repo: Repository in 'hostname/owner/repo' format
+            ticket_id: Issue number
+            add: Label names to add
+            remove: Label names to remove
+        """
+        add = list(add)
+        remove = list(remove)
+        if not add and not remove:
+            return
+
+        repo_ref = self._get_repo_ref(repo)
+        args = ["issue", "edit", str(ticket_id), "--repo", repo_ref]
+        for label in add:
+            args.extend(["--add-label", label])
+        for label in remove:
+            args.extend(["--remove-label", label])
+
+        try:
+            self._run_gh_command(args, repo=repo)
+            logger.info(f"Updated labels on {repo}#{ticket_id} (add: {add}, remove: {remove})")
+        except subprocess.CalledProcessError as e:
+            # Check if error is due to a label not existing
+            if classify_gh_error(e) == "label_missing":
+                logger.info(f"Missing label(s) in {repo}, creating added labels and retrying")
+                for label in add:
+                    self.create_repo_label(repo, label)
+                self._run_gh_command(args, repo=repo)
+                logger.info(f"Updated labels on {repo}#{ticket_id} (add: {add}, remove: {remove})")
+            else:
+                raise
+
     # Repo label management
 
     def get_repo_labels(self, repo: str) -> list[str]:
@@ -747,7 +856,7 @@ class GitHubClientBase:
         try:
             args = ["label", "list", "--repo", repo_ref, "--json", "name"]
             output = self._run_gh_command(args, repo=repo)
-            data = json.loads(output)
+            data = json_loads(output)
             return [label["name"] for label in data]
         except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
             logger.error(f"Failed to get repo labels for {repo}: {e}")
@@ -904,7 +1013,7 @@ class GitHubClientBase:
         output = self._run_gh_command(args, repo=repo)
 
         try:
-            data = json.loads(output)
+            data = json_loads(output)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse REST API response: {e}")
             return []
@@ -974,8 +1083,10 @@ class GitHubClientBase:
           }
         }
         """
+        # A 5xx can arrive after the backend committed the comment; retrying
+        # would post it twice, so transient retries are disabled here.
         result = self._execute_graphql_query(
-            add_mutation, {"subjectId": issue_id, "body": body}, repo=repo
+            add_mutation, {"subjectId": issue_id, "body": body}, repo=repo, retry_transient=False
         )
         node = result["data"]["addComment"]["commentEdge"]["node"]
         logger.debug(f"Added comment to {repo}#{ticket_id}")
@@ -1614,6 +1725,7 @@ class GitHubClientBase:
         *,
         hostname: str | None = None,
         repo: str | None = None,
+        retry_transient: bool = True,
     ) -> dict[str, Any]:
         """Execute a GraphQL query using gh CLI.
 
@@ -1622,6 +1734,8 @@ class GitHubClientBase:
             variables: Variables to pass to the query
             hostname: Explicit hostname (for board operations)
             repo: Repository to look up hostname for (for repo operations)
+            retry_transient: Whether transient server errors may be retried;
+                pass False for non-idempotent mutations
         """
         if hostname is None:
             hostname = self._get_hostname_for_repo(repo) if repo else "github.com"
@@ -1635,10 +1749,11 @@ class GitHubClientBase:
             ["api", "graphql", "--input", "-"],
             input_data=json.dumps(payload),
             hostname=hostname,
+            retry_transient=retry_transient,
         )
 
         try:
-            response = json.loads(output)
+            response = json_loads(output)
 
             if "errors" in response:
                 error_messages = [e.get("message", str(e)) for e in response["errors"]]
@@ -1690,7 +1805,7 @@ class GitHubClientBase:
         )
 
         try:
-            response = json.loads(output)
+            response = json_loads(output)
 
             if "errors" in response:
                 error_messages = [e.get("message", str(e)) for e in response["errors"]]
@@ -1711,6 +1826,7 @@ class GitHubClientBase:
         *,
         hostname: str | None = None,
         repo: str | None = None,
+        retry_transient: bool = True,
     ) -> str:
         """Run a gh CLI command with proper error handling.
 
@@ -1719,6 +1835,9 @@ class GitHubClientBase:
             input_data: Optional data to pass to stdin
             hostname: Explicit hostname (for board operations)
             repo: Repository to look up hostname for (for repo operations)
+            retry_transient: Whether transient server errors may be retried.
+                Pass False for non-idempotent mutations, where a retry after
+                a 5xx could re-apply a change the backend already committed.
 
         Returns:
             Command output as string
@@ -1737,74 +1856,79 @@ class GitHubClientBase:
             cmd.extend(args)
         logger.debug(f"Running command: {' '.join(cmd)}")
 
-        try:
-            env = {}
-            token = self._get_token_for_host(hostname)
-            if token:
-                # gh CLI uses different env vars for github.com vs GHES
-                if hostname == "github.com":
-                    env["GITHUB_TOKEN"] = token
-                else:
-                    env["GH_ENTERPRISE_TOKEN"] = token
+        env = {}
+        token = self._get_token_for_host(hostname)
+        if token:
+            # gh CLI uses different env vars for github.com vs GHES
+            if hostname == "github.com":
+                env["GITHUB_TOKEN"] = token
+            else:
+                env["GH_ENTERPRISE_TOKEN"] = token
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-                input=input_data,
-                env={**os.environ, **env},
-            )
+        last_error: subprocess.CalledProcessError | None = None
+        for attempt in range(1, self._MAX_TRANSIENT_RETRIES + 1):
+            try:
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                    input=input_data,
+                    env={**os.environ, **env},
+                )
 
-            logger.debug(f"Command succeeded, output length: {len(result.stdout)} bytes")
-            return result.stdout
+                logger.debug(f"Command succeeded, output length: {len(result.stdout)} bytes")
+                return result.stdout
 
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Command failed with exit code {e.returncode}")
-            logger.error(f"Error output: {e.stderr}")
-            error_output = (e.stderr or "").lower()
-
-            # Check for network/connectivity errors first
-            network_error_patterns = [
-                "tls handshake timeout",
-                "connection timeout",
-                "network error",
-                "connection refused",
-                "temporary failure",
-                "i/o timeout",
-                "dial tcp",  # Go network dial errors
-                "no such host",  # DNS resolution failures
-            ]
-            if any(pattern in error_output for pattern in network_error_patterns):
-                raise NetworkError(f"GitHub API network error: {e.stderr}") from e
-
-            # Check for authentication errors and provide user-friendly message
-            if any(
-                indicator in error_output
-                for indicator in [
-                    "gh auth login",
-                    "authentication",
-                    "unauthorized",
-                    "401",
-                    "not logged in",
-                    "no token",
-                ]
-            ):
-                if is_debug_mode():
-                    raise RuntimeError(
-                        f"GitHub authentication failed for {hostname}.\n"
-                        f"Please ensure GITHUB_TOKEN is set in .kiln/config or run 'gh auth login'.\n"
-                        f"Error: {e.stderr}"
-                    ) from e
-                else:
-                    raise RuntimeError(
-                        f"GitHub authentication failed for {hostname}. "
-                        f"Please set GITHUB_TOKEN in .kiln/config"
-                    ) from e
-            raise
-        except FileNotFoundError as e:
-            logger.error("gh CLI not found. Please install GitHub CLI: https://cli.github.com/")
-            raise RuntimeError(
-                "GitHub CLI (gh) is not installed or not in PATH. "
-                "Please install it from https://cli.github.com/"
-            ) from e
+            except FileNotFoundError as e:
+                logger.error("gh CLI not found. Please install GitHub CLI: https://cli.github.com/")
+                raise RuntimeError(
+                    "GitHub CLI (gh) is not installed or not in PATH. "
+                    "Please install it from https://cli.github.com/"
+                ) from e
+            except subprocess.CalledProcessError as e:
+                last_error = e
+
+                # Back off and retry transient server-side failures. Network
+                # errors are not retried here: they surface as NetworkError so
+                # the callers' own retry/hibernation logic still sees them.
+                if (
+                    retry_transient
+                    and attempt < self._MAX_TRANSIENT_RETRIES
+                    and classify_gh_error(e) == "transient"
+                ):
+                    delay = 2.0**attempt
+                    logger.warning(
+                        f"Transient GitHub error "
+                        f"(attempt {attempt}/{self._MAX_TRANSIENT_RETRIES}), "
+                        f"retrying in {delay:.0f}s: {e.stderr}"
+                    )
+                    time.sleep(delay)
+                    continue
+                break
+
+        assert last_error is not None  # loop exits only via break with an error
+        self._raise_gh_command_error(last_error, hostname)
+
+    def _raise_gh_command_error(self, e: subprocess.CalledProcessError, hostname: str) -> NoReturn:
+        """Classify a failed gh invocation and raise the appropriate error."""
+        logger.error(f"Command failed with exit code {e.returncode}")
+        logger.error(f"Error output: {e.stderr}")
+        kind = classify_gh_error(e)
+
+        if kind == "network":
+            raise NetworkError(f"GitHub API network error: {e.stderr}") from e
+
+        if kind == "auth":
+            if is_debug_mode():
+                raise RuntimeError(
+                    f"GitHub authentication failed for {hostname}.\n"
+                    f"Please ensure GITHUB_TOKEN is set in .kiln/config or run 'gh auth login'.\n"
+                    f"Error: {e.stderr}"
+                ) from e
+            else:
+                raise RuntimeError(
+                    f"GitHub authentication failed for {hostname}. "
+                    f"Please set GITHUB_TOKEN in .kiln/config"
+                ) from e
+        raise e
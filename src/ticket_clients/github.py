@@ -9,16 +9,61 @@ import json
 import os
 import re
 import subprocess
+import time
+from collections.abc import Iterable
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, NoReturn
 
 from src.interfaces import Comment, LinkedPullRequest, TicketItem
 from src.labels import REQUIRED_LABELS, LabelConfig
 from src.logger import get_logger, is_debug_mode
-from src.ticket_clients.base import NetworkError
+from src.ticket_clients.base import NetworkError, classify_gh_error, json_loads
 
 logger = get_logger(__name__)
 
+# Pattern matches: keyword + optional colon + whitespace + #issue_number
+# Keywords: close, closes, closed, fix, fixes, fixed, resolve, resolves, resolved
+# Examples: "closes #44", "Fixes: #123", "resolves #44"
+# Compiled once with the issue number as a captured group so callers do not
+# rebuild and recompile a per-issue pattern on every invocation.
+_LINKING_KEYWORD_PATTERN = re.compile(
+    r"\b(close[sd]?|fix(?:e[sd])?|resolve[sd]?):?\s*#(\d+)\b", re.IGNORECASE
+)
+
+
+# GraphQL query for get_ticket_labels, built once at import time
+_TICKET_LABELS_QUERY = """
+query($owner: String!, $repo: String!, $issueNumber: Int!) {
+  repository(owner: $owner, name: $repo) {
+    issue(number: $issueNumber) {
+      labels(first: 100) {
+        nodes {
+          name
+        }
+      }
+    }
+  }
+}
+"""
+
+
+@lru_cache(maxsize=1024)
+def _parse_repo_cached(repo: str) -> tuple[str, str, str]:
+    """Parse a repo identifier into (hostname, owner, repo_name).
+
+    Pure function of the identifier string; the daemon resolves the same
+    handful of repos on every poll, so results are memoized.
+    """
+    parts = repo.split("/")
+    if len(parts) >= 3 and "." in parts[0]:
+        return parts[0], parts[1], parts[2]
+    # Fallback for old format (shouldn't happen in normal operation)
+    if len(parts) == 2:
+        return "github.com", parts[0], parts[1]
+    return "github.com", "", repo
+
 
 class GitHubTicketClient:
     """GitHub implementation of TicketClient protocol.
@@ -54,6 +99,15 @@ class GitHubTicketClient:
         """Human-readable description of this client."""
         return "GitHub.com"
 
+    # Maximum attempts for transient server-side failures inside
+    # _run_gh_command (classified via classify_gh_error).
+    _MAX_TRANSIENT_RETRIES = 3
+
+    # How long a cached repo label list stays fresh. The daemon ensures labels
+    # once per repo per poll cycle, so a short TTL cuts most gh label list
+    # subprocess invocations without risking long-stale data.
+    _LABEL_CACHE_TTL = 300.0
+
     def __init__(self, tokens: dict[str, str] | None = None) -> None:
         """Initialize the GitHub client.
 
@@ -64,6 +118,8 @@ class GitHubTicketClient:
         self.tokens = tokens or {}
         # Internal cache mapping repo -> hostname, populated by get_board_items()
         self._repo_host_map: dict[str, str] = {}
+        # TTL cache mapping repo -> (fetch time, label names)
+        self._label_cache: dict[str, tuple[float, list[str]]] = {}
         logger.debug("GitHubTicketClient initialized")
 
     def validate_connection(self, hostname: str = "github.com", *, quiet: bool = False) -> bool:
@@ -272,13 +328,7 @@ class GitHubTicketClient:
         Returns:
             Tuple of (hostname, owner, repo_name)
         """
-        parts = repo.split("/")
-        if len(parts) >= 3 and "." in parts[0]:
-            return parts[0], parts[1], parts[2]
-        # Fallback for old format (shouldn't happen in normal operation)
-        if len(parts) == 2:
-            return "github.com", parts[0], parts[1]
-        return "github.com", "", repo
+        return _parse_repo_cached(repo)
 
     def _get_hostname_for_repo(self, repo: str) -> str:
         """Get the hostname for a repository.
@@ -626,24 +676,10 @@ class GitHubTicketClient:
         """
         _, owner, repo_name = self._parse_repo(repo)
 
-        query = """
-        query($owner: String!, $repo: String!, $issueNumber: Int!) {
-          repository(owner: $owner, name: $repo) {
-            issue(number: $issueNumber) {
-              labels(first: 100) {
-                nodes {
-                  name
-                }
-              }
-            }
-          }
-        }
-        """
-
         try:
             logger.debug(f"Fetching labels for {repo}#{ticket_id}")
             response = self._execute_graphql_query(
-                query,
+                _TICKET_LABELS_QUERY,
                 {
                     "owner": owner,
                     "repo": repo_name,
@@ -657,12 +693,69 @@ class GitHubTicketClient:
                 return set()
 
             label_nodes = issue_data.get("labels", {}).get("nodes", [])
-            return {label["name"] for label in label_nodes if label}
+            # filter(None, ...) + itemgetter skips null nodes without a
+            # Python-level conditional per element
+            return set(map(itemgetter("name"), filter(None, label_nodes)))
 
         except Exception as e:
             logger.error(f"Failed to get labels for {repo}#{ticket_id}: {e}")
             return set()
 
+    def get_ticket_labels_bulk(self, repo: str, ticket_ids: list[int]) -> dict[int, set[str]]:
+        """Get the current labels for several issues in one GraphQL round trip.
+
+        Each issue becomes an aliased field of a single query, so N point
+        lookups collapse into one request.
+
+        Args:
+            repo: Repository in hostname/owner/repo format
+            ticket_ids: Issue numbers to look up
+
+        Returns:
+            Dict mapping issue number to its label-name set. Issues that do
+            not exist map to an empty set; all issues map to empty sets on
+            query error.
+        """
+        if not ticket_ids:
+            return {}
+
+        _, owner, repo_name = self._parse_repo(repo)
+
+        issue_fields = "\n".join(
+            f"i{ticket_id}: issue(number: {ticket_id}) {{ labels(first: 100) {{ nodes {{ name }} }} }}"
+            for ticket_id in ticket_ids
+        )
+        query = f"""
+        query($owner: String!, $repo: String!) {{
+          repository(owner: $owner, name: $repo) {{
+            {issue_fields}
+          }}
+        }}
+        """
+
+        try:
+            logger.debug(f"Fetching labels for {len(ticket_ids)} issues in {repo}")
+            response = self._execute_graphql_query(
+                query,
+                {"owner": owner, "repo": repo_name},
+                repo=repo,
+            )
+
+            repository = response.get("data", {}).get("repository", {}) or {}
+            result: dict[int, set[str]] = {}
+            for ticket_id in ticket_ids:
+                issue_data = repository.get(f"i{ticket_id}")
+                if issue_data is None:
+                    result[ticket_id] = set()
+                    continue
+                label_nodes = issue_data.get("labels", {}).get("nodes", [])
+                result[ticket_id] = set(map(itemgetter("name"), filter(None, label_nodes)))
+            return result
+
+        except Exception as e:
+            logger.error(f"Failed to get labels for {len(ticket_ids)} issues in {repo}: {e}")
+            return {ticket_id: set() for ticket_id in ticket_ids}
+
     def add_label(self, repo: str, ticket_id: int, label: str) -> None:
         """Add a label to an issue.
 
@@ -675,25 +768,27 @@ class GitHubTicketClient:
         """
         repo_ref = self._get_repo_ref(repo)
         args = ["issue", "edit", str(ticket_id), "--repo", repo_ref, "--add-label", label]
+
+        # When a fresh cached label list says the label is missing, create it
+        # up front and skip the failed-edit round trip. An absent or stale
+        # cache falls through to the optimistic path below.
+        cached = self._label_cache.get(repo)
+        if (
+            cached is not None
+            and time.monotonic() - cached[0] < self._LABEL_CACHE_TTL
+            and label not in cached[1]
+        ):
+            logger.info(f"Label '{label}' not in cached labels for {repo}, creating it")
+            self._create_label_with_metadata(repo, label)
+
         try:
             self._run_gh_command(args, repo=repo)
             logger.info(f"Added label '{label}' to {repo}#{ticket_id}")
         except subprocess.CalledProcessError as e:
             # Check if error is due to label not existing
-            error_output = (e.stderr or "") + (e.stdout or "")
-            if "label" in error_output.lower() and (
-                "not found" in error_output.lower()
-                or "does not exist" in error_output.lower()
-                or "no labels" in error_output.lower()
-            ):
+            if classify_gh_error(e) == "label_missing":
                 logger.info(f"Label '{label}' not found in {repo}, creating it")
-                label_config: LabelConfig | dict[str, str] = REQUIRED_LABELS.get(label, {})
-                if self.create_repo_label(
-                    repo,
-                    label,
-                    description=label_config.get("description", ""),
-                    color=label_config.get("color", ""),
-                ):
+                if self._create_label_with_metadata(repo, label):
                     # Retry adding the label after creation
                     self._run_gh_command(args, repo=repo)
                     logger.info(f"Added label '{label}' to {repo}#{ticket_id}")
@@ -721,18 +816,82 @@ class GitHubTicketClient:
 
     # Repo label management
 
+    def set_labels(
+        self,
+        repo: str,
+        ticket_id: int,
+        add: Iterable[str] = (),
+        remove: Iterable[str] = (),
+    ) -> None:
+        """Apply multiple label additions and removals in one gh invocation.
+
+        gh issue edit accepts repeated --add-label/--remove-label flags, so
+        batching amortizes the subprocess and network round trip across all
+        label changes for an issue.
+
+        Args:
+            repo: Repository in 'hostname/owner/repo' format
+            ticket_id: Issue number
+            add: Label names to add
+            remove: Label names to remove
+        """
+        add = list(add)
+        remove = list(remove)
+        if not add and not remove:
+            return
+
+        repo_ref = self._get_repo_ref(repo)
+        args = ["issue", "edit", str(ticket_id), "--repo", repo_ref]
+        for label in add:
+            args.extend(["--add-label", label])
+        for label in remove:
+            args.extend(["--remove-label", label])
+
+        try:
+            self._run_gh_command(args, repo=repo)
+            logger.info(f"Updated labels on {repo}#{ticket_id} (add: {add}, remove: {remove})")
+        except subprocess.CalledProcessError as e:
+            # Check if error is due to a label not existing
+            if classify_gh_error(e) == "label_missing":
+                logger.info(f"Missing label(s) in {repo}, creating added labels and retrying")
+                for label in add:
+                    self._create_label_with_metadata(repo, label)
+                self._run_gh_command(args, repo=repo)
+                logger.info(f"Updated labels on {repo}#{ticket_id} (add: {add}, remove: {remove})")
+            else:
+                raise
+
+    def _create_label_with_metadata(self, repo: str, label: str) -> bool:
+        """Create a label using REQUIRED_LABELS metadata when available."""
+        label_config: LabelConfig | dict[str, str] = REQUIRED_LABELS.get(label, {})
+        return self.create_repo_label(
+            repo,
+            label,
+            description=label_config.get("description", ""),
+            color=label_config.get("color", ""),
+        )
+
     def get_repo_labels(self, repo: str) -> list[str]:
         """Get all labels defined in a repository.
 
+        Results are cached per repo for a short TTL; failures are not cached.
+
         Args:
             repo: Repository in 'hostname/owner/repo' format
         """
+        cached = self._label_cache.get(repo)
+        if cached is not None and time.monotonic() - cached[0] < self._LABEL_CACHE_TTL:
+            # Return a copy so caller-side mutation cannot corrupt the cache
+            return list(cached[1])
+
         repo_ref = self._get_repo_ref(repo)
         try:
             args = ["label", "list", "--repo", repo_ref, "--json", "name"]
             output = self._run_gh_command(args, repo=repo)
-            data = json.loads(output)
-            return [label["name"] for label in data]
+            data = json_loads(output)
+            labels = [label["name"] for label in data]
+            self._label_cache[repo] = (time.monotonic(), labels)
+            return list(labels)
         except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
             logger.error(f"Failed to get repo labels for {repo}: {e}")
             return []
@@ -758,6 +917,10 @@ class GitHubTicketClient:
         try:
             self._run_gh_command(args, repo=repo)
             logger.info(f"Created label '{name}' in {repo}")
+            # Keep the label cache coherent without another gh invocation
+            cached = self._label_cache.get(repo)
+            if cached is not None and name not in cached[1]:
+                cached[1].append(name)
             return True
         except subprocess.CalledProcessError as e:
             logger.warning(f"Failed to create label '{name}' in {repo}: {e}")
@@ -888,7 +1051,7 @@ class GitHubTicketClient:
         output = self._run_gh_command(args, repo=repo)
 
         try:
-            data = json.loads(output)
+            data = json_loads(output)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse REST API response: {e}")
             return []
@@ -958,8 +1121,10 @@ class GitHubTicketClient:
           }
         }
         """
+        # A 5xx can arrive after the backend committed the comment; retrying
+        # would post it twice, so transient retries are disabled here.
         result = self._execute_graphql_query(
-            add_mutation, {"subjectId": issue_id, "body": body}, repo=repo
+            add_mutation, {"subjectId": issue_id, "body": body}, repo=repo, retry_transient=False
         )
         node = result["data"]["addComment"]["commentEdge"]["node"]
         logger.debug(f"Added comment to {repo}#{ticket_id}")
@@ -1635,16 +1800,16 @@ class GitHubTicketClient:
         Returns:
             Modified body with linking keywords removed
         """
-        # Pattern matches: keyword + optional colon + whitespace + #issue_number
-        # Keywords: close, closes, closed, fix, fixes, fixed, resolve, resolves, resolved
-        # Examples: "closes #44", "Fixes: #123", "resolves #44"
-        pattern = rf"\b(close[sd]?|fix(?:e[sd])?|resolve[sd]?):?\s*#{issue_number}\b"
+        issue_ref = f"#{issue_number}"
 
-        def replace_fn(_match: re.Match[str]) -> str:
-            # Keep just the issue reference as a breadcrumb
-            return f"#{issue_number}"
+        def replace_fn(match: re.Match[str]) -> str:
+            # Keep just the issue reference as a breadcrumb; leave links to
+            # other issues untouched
+            if match.group(2) == str(issue_number):
+                return issue_ref
+            return match.group(0)
 
-        return re.sub(pattern, replace_fn, body, flags=re.IGNORECASE)
+        return _LINKING_KEYWORD_PATTERN.sub(replace_fn, body)
 
     def close_pr(self, repo: str, pr_number: int) -> bool:
         """Close a pull request without merging.
@@ -1942,6 +2107,7 @@ class GitHubTicketClient:
         *,
         hostname: str | None = None,
         repo: str | None = None,
+        retry_transient: bool = True,
     ) -> dict[str, Any]:
         """Execute a GraphQL query using gh CLI.
 
@@ -1950,6 +2116,8 @@ class GitHubTicketClient:
             variables: Variables to pass to the query
             hostname: Explicit hostname (for board operations)
             repo: Repository to look up hostname for (for repo operations)
+            retry_transient: Whether transient server errors may be retried;
+                pass False for non-idempotent mutations
         """
         if hostname is None:
             hostname = self._get_hostname_for_repo(repo) if repo else "github.com"
@@ -1963,10 +2131,11 @@ class GitHubTicketClient:
             ["api", "graphql", "--input", "-"],
             input_data=json.dumps(payload),
             hostname=hostname,
+            retry_transient=retry_transient,
         )
 
         try:
-            response = json.loads(output)
+            response = json_loads(output)
 
             if "errors" in response:
                 error_messages = [e.get("message", str(e)) for e in response["errors"]]
@@ -2018,7 +2187,7 @@ class GitHubTicketClient:
         )
 
         try:
-            response = json.loads(output)
+            response = json_loads(output)
 
             if "errors" in response:
                 error_messages = [e.get("message", str(e)) for e in response["errors"]]
@@ -2039,6 +2208,7 @@ class GitHubTicketClient:
         *,
         hostname: str | None = None,
         repo: str | None = None,
+        retry_transient: bool = True,
     ) -> str:
         """Run a gh CLI command with proper error handling.
 
@@ -2047,6 +2217,9 @@ class GitHubTicketClient:
             input_data: Optional data to pass to stdin
             hostname: Explicit hostname (for board operations)
             repo: Repository to look up hostname for (for repo operations)
+            retry_transient: Whether transient server errors may be retried.
+                Pass False for non-idempotent mutations, where a retry after
+                a 5xx could re-apply a change the backend already committed.
 
         Returns:
             Command output as string
@@ -2065,70 +2238,75 @@ class GitHubTicketClient:
             cmd.extend(args)
         logger.debug(f"Running command: {' '.join(cmd)}")
 
-        try:
-            env = {}
-            token = self._get_token_for_host(hostname)
-            if token:
-                env["GITHUB_TOKEN"] = token
+        env = {}
+        token = self._get_token_for_host(hostname)
+        if token:
+            env["GITHUB_TOKEN"] = token
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-                input=input_data,
-                env={**os.environ, **env},
-            )
+        last_error: subprocess.CalledProcessError | None = None
+        for attempt in range(1, self._MAX_TRANSIENT_RETRIES + 1):
+            try:
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                    input=input_data,
+                    env={**os.environ, **env},
+                )
 
-            logger.debug(f"Command succeeded, output length: {len(result.stdout)} bytes")
-            return result.stdout
+                logger.debug(f"Command succeeded, output length: {len(result.stdout)} bytes")
+                return result.stdout
 
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Command failed with exit code {e.returncode}")
-            logger.error(f"Error output: {e.stderr}")
-            error_output = (e.stderr or "").lower()
-
-            # Check for network/connectivity errors first
-            network_error_patterns = [
-                "tls handshake timeout",
-                "connection timeout",
-                "network error",
-                "connection refused",
-                "temporary failure",
-                "i/o timeout",
-                "dial tcp",  # Go network dial errors
-                "no such host",  # DNS resolution failures
-            ]
-            if any(pattern in error_output for pattern in network_error_patterns):
-                raise NetworkError(f"GitHub API network error: {e.stderr}") from e
-
-            # Check for authentication errors and provide user-friendly message
-            if any(
-                indicator in error_output
-                for indicator in [
-                    "gh auth login",
-                    "authentication",
-                    "unauthorized",
-                    "401",
-                    "not logged in",
-                    "no token",
-                ]
-            ):
-                if is_debug_mode():
-                    raise RuntimeError(
-                        f"GitHub authentication failed for {hostname}.\n"
-                        f"Please ensure GITHUB_TOKEN is set in .kiln/config or run 'gh auth login'.\n"
-                        f"Error: {e.stderr}"
-                    ) from e
-                else:
-                    raise RuntimeError(
-                        f"GitHub authentication failed for {hostname}. "
-                        f"Please set GITHUB_TOKEN in .kiln/config"
-                    ) from e
-            raise
-        except FileNotFoundError as e:
-            logger.error("gh CLI not found. Please install GitHub CLI: https://cli.github.com/")
-            raise RuntimeError(
-                "GitHub CLI (gh) is not installed or not in PATH. "
-                "Please install it from https://cli.github.com/"
-            ) from e
+            except FileNotFoundError as e:
+                logger.error("gh CLI not found. Please install GitHub CLI: https://cli.github.com/")
+                raise RuntimeError(
+                    "GitHub CLI (gh) is not installed or not in PATH. "
+                    "Please install it from https://cli.github.com/"
+                ) from e
+            except subprocess.CalledProcessError as e:
+                last_error = e
+
+                # Back off and retry transient server-side failures. Network
+                # errors are not retried here: they surface as NetworkError so
+                # the callers' own retry/hibernation logic still sees them.
+                if (
+                    retry_transient
+                    and attempt < self._MAX_TRANSIENT_RETRIES
+                    and classify_gh_error(e) == "transient"
+                ):
+                    delay = 2.0**attempt
+                    logger.warning(
+                        f"Transient GitHub error "
+                        f"(attempt {attempt}/{self._MAX_TRANSIENT_RETRIES}), "
+                        f"retrying in {delay:.0f}s: {e.stderr}"
+                    )
+                    time.sleep(delay)
+                    continue
+                break
+
+        assert last_error is not None  # loop exits only via break with an error
+        self._raise_gh_command_error(last_error, hostname)
+
+    def _raise_gh_command_error(self, e: subprocess.CalledProcessError, hostname: str) -> NoReturn:
+        """Classify a failed gh invocation and raise the appropriate error."""
+        logger.error(f"Command failed with exit code {e.returncode}")
+        logger.error(f"Error output: {e.stderr}")
+        kind = classify_gh_error(e)
+
+        if kind == "network":
+            raise NetworkError(f"GitHub API network error: {e.stderr}") from e
+
+        if kind == "auth":
+            if is_debug_mode():
+                raise RuntimeError(
+                    f"GitHub authentication failed for {hostname}.\n"
+                    f"Please ensure GITHUB_TOKEN is set in .kiln/config or run 'gh auth login'.\n"
+                    f"Error: {e.stderr}"
+                ) from e
+            else:
+                raise RuntimeError(
+                    f"GitHub authentication failed for {hostname}. "
+                    f"Please set GITHUB_TOKEN in .kiln/config"
+                ) from e
+        raise e
@@ -251,6 +251,7 @@ class ImplementWorkflow:
 
         iteration = 0
         last_completed = -1
+        last_body_hash: int | None = None
         stall_count = 0
         logged_overrun = False  # Track if we've logged continuing past estimate
 
@@ -273,42 +274,51 @@ class ImplementWorkflow:
                 raise RuntimeError(f"PR disappeared for {issue_url}")
 
             pr_body = pr_info.get("body", "")
-            total_tasks, completed_tasks = count_checkboxes(pr_body)
-
-            # Re-count TASKs to detect dynamic additions
-            current_task_count = count_tasks(pr_body)
-            tasks_appended = current_task_count - initial_task_count
-
-            # Safety check: exit if too many TASKs appended (when limit is set)
-            if (
-                config.safety_allow_appended_tasks > 0
-                and tasks_appended > config.safety_allow_appended_tasks
-            ):
-                logger.error(
-                    f"SAFETY: TASK count increased from {initial_task_count} to "
-                    f"{current_task_count} (+{tasks_appended}) for {key}, exceeds limit of "
-                    f"{config.safety_allow_appended_tasks}. Stopping to prevent infinite loop."
-                )
-                break
+            body_hash = hash(pr_body)
 
-            # Log if TASKs were appended (informational, only log once per new count)
-            if tasks_appended > 0 and iteration > 1:
-                logger.warning(
-                    f"TASK count increased from {initial_task_count} to {current_task_count} "
-                    f"(+{tasks_appended}) during implementation for {key}"
-                )
+            if body_hash == last_body_hash:
+                # Body is byte-identical to the previous iteration, so the
+                # checkbox/TASK counts are unchanged by construction. Skip the
+                # regex re-parse and fall through to the stall check.
+                completed_tasks = last_completed
+            else:
+                last_body_hash = body_hash
+                total_tasks, completed_tasks = count_checkboxes(pr_body)
+
+                # Re-count TASKs to detect dynamic additions
+                current_task_count = count_tasks(pr_body)
+                tasks_appended = current_task_count - initial_task_count
+
+                # Safety check: exit if too many TASKs appended (when limit is set)
+                if (
+                    config.safety_allow_appended_tasks > 0
+                    and tasks_appended > config.safety_allow_appended_tasks
+                ):
+                    logger.error(
+                        f"SAFETY: TASK count increased from {initial_task_count} to "
+                        f"{current_task_count} (+{tasks_appended}) for {key}, exceeds limit of "
+                        f"{config.safety_allow_appended_tasks}. Stopping to prevent infinite loop."
+                    )
+                    break
 
-            if total_tasks == 0:
-                logger.warning(f"No checkbox tasks found in PR for {key}")
-                raise ImplementationIncompleteError(
-                    reason="no_tasks",
-                    message=f"No checkbox tasks found in PR for {key}",
-                )
+                # Log if TASKs were appended (informational, only log once per new count)
+                if tasks_appended > 0 and iteration > 1:
+                    logger.warning(
+                        f"TASK count increased from {initial_task_count} to {current_task_count} "
+                        f"(+{tasks_appended}) during implementation for {key}"
+                    )
 
-            # Check if all tasks complete
-            if completed_tasks == total_tasks:
-                logger.info(f"All {total_tasks} tasks complete for {key}")
-                break
+                if total_tasks == 0:
+                    logger.warning(f"No checkbox tasks found in PR for {key}")
+                    raise ImplementationIncompleteError(
+                        reason="no_tasks",
+                        message=f"No checkbox tasks found in PR for {key}",
+                    )
+
+                # Check if all tasks complete
+                if completed_tasks == total_tasks:
+                    logger.info(f"All {total_tasks} tasks complete for {key}")
+                    break
 
             # Check for stall (no progress)
             if completed_tasks == last_completed:
@@ -345,24 +355,23 @@ class ImplementWorkflow:
             implement_prompt = f"/kiln-implement_github for issue {issue_url}.{reviewer_flags}{project_url_context}"
             self._run_prompt(implement_prompt, ctx, config, "implement")
 
-        # Check final state and mark PR ready if all tasks complete
-        pr_info = self._get_pr_for_issue(ctx.repo, ctx.issue_number)
-        if pr_info:
-            pr_body = pr_info.get("body", "")
-            total_tasks, completed_tasks = count_checkboxes(pr_body)
-            pr_number = pr_info.get("number")
-            if total_tasks > 0 and completed_tasks == total_tasks and pr_number:
-                self._mark_pr_ready(ctx.repo, pr_number)
-                pr_url = f"https://{ctx.repo}/pull/{pr_number}"
-                send_ready_for_validation_notification(pr_url, pr_number)
-            elif iteration >= max_iterations_estimate:
-                # Hit max iterations without completing all tasks
-                logger.warning(f"Hit max iterations ({max_iterations_estimate}) for {key}")
-                raise ImplementationIncompleteError(
-                    reason="max_iterations",
-                    message=f"Hit max iterations ({max_iterations_estimate}) for {key} "
-                    f"({completed_tasks}/{total_tasks} tasks complete)",
-                )
+        # Check final state and mark PR ready if all tasks complete.
+        # The loop only exits via break immediately after a fresh PR fetch and
+        # parse, so pr_info and the checkbox counts are already current - no
+        # extra gh invocation is needed here.
+        pr_number = pr_info.get("number")
+        if total_tasks > 0 and completed_tasks == total_tasks and pr_number:
+            self._mark_pr_ready(ctx.repo, pr_number)
+            pr_url = f"https://{ctx.repo}/pull/{pr_number}"
+            send_ready_for_validation_notification(pr_url, pr_number)
+        elif iteration >= max_iterations_estimate:
+            # Hit max iterations without completing all tasks
+            logger.warning(f"Hit max iterations ({max_iterations_estimate}) for {key}")
+            raise ImplementationIncompleteError(
+                reason="max_iterations",
+                message=f"Hit max iterations ({max_iterations_estimate}) for {key} "
+                f"({completed_tasks}/{total_tasks} tasks complete)",
+            )
 
     def _mark_pr_ready(self, repo: str, pr_number: int) -> None:
         """Mark a draft PR as ready for review.
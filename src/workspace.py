@@ -6,6 +6,7 @@ for individual issues.
 """
 
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 from src.logger import get_logger
@@ -13,6 +14,24 @@ from src.logger import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _extract_repo_name_cached(repo_url: str) -> str:
+    """Extract the final repo name component from a git URL, memoized.
+
+    Pure function of the URL string; the daemon resolves the same handful
+    of repo URLs once per repo per issue.
+    """
+    # Remove trailing .git if present
+    url = repo_url.rstrip("/")
+    if url.endswith(".git"):
+        url = url[:-4]
+
+    # Take the component after the last "/" (path URLs) and then after the
+    # last ":" (scp-style git@host:repo without a path), without building the
+    # intermediate list a split would allocate
+    return url.rpartition("/")[2].rpartition(":")[2]
+
+
 class WorkspaceError(Exception):
     """Base exception for workspace management errors."""
 
@@ -64,14 +83,7 @@ class WorkspaceManager:
             https://github.com/org/repo.git -> repo
             git@github.com:org/repo.git -> repo
         """
-        # Remove trailing .git if present
-        url = repo_url.rstrip("/")
-        if url.endswith(".git"):
-            url = url[:-4]
-
-        # Extract the last component of the path (just the repo name)
-        repo_name = url.split("/")[-1]
-
+        repo_name = _extract_repo_name_cached(repo_url)
         logger.debug(f"Extracted repo name '{repo_name}' from git URL: {repo_url}")
         return repo_name
 
@@ -141,7 +153,12 @@ class WorkspaceManager:
             WorkspaceError: If path would escape the container directory
         """
         resolved = path.resolve()
-        container_resolved = container.resolve()
+        # workspace_dir is resolved once in __init__; skip the repeated
+        # realpath syscalls when the container is the workspace root itself
+        if container is self.workspace_dir:
+            container_resolved = container
+        else:
+            container_resolved = container.resolve()
 
         if not resolved.is_relative_to(container_resolved):
             raise WorkspaceError(
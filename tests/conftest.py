@@ -1,12 +1,42 @@
 """Pytest configuration and shared fixtures."""
 
+import copy
 import os
-import tempfile
-from unittest.mock import patch
+import subprocess
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from hypothesis import settings
 
+# Import the daemon module graph (src.interfaces.ticket included) once at
+# conftest import time so collection binds hot modules and xdist workers
+# inherit them via copy-on-write instead of re-importing per module.
+from src.daemon import Daemon
+from src.ticket_clients.github import GitHubTicketClient
+
+# Read-only config template for the shared daemon fixtures. A plain namespace
+# avoids per-test MagicMock allocation and lazy child-mock creation; fixtures
+# copy it and fill in the per-run paths.
+_DAEMON_CONFIG = SimpleNamespace(
+    poll_interval=60,
+    watched_statuses=["Research", "Plan", "Implement"],
+    max_concurrent_workflows=2,
+    project_urls=["https://github.com/orgs/test/projects/1"],
+    github_enterprise_version=None,
+    github_enterprise_host=None,
+    github_enterprise_token=None,
+    github_token=None,
+    username_self="test-bot",
+    team_usernames=[],
+    ghes_logs_mask=False,
+    azure_tenant_id=None,
+    azure_client_id=None,
+    azure_username=None,
+    azure_password=None,
+    azure_scope=None,
+)
+
 # Configure Hypothesis profiles for different environments
 settings.register_profile("ci", max_examples=100, deadline=None)
 settings.register_profile("dev", max_examples=50, deadline=None)
@@ -50,22 +80,171 @@ def mock_validate_connection(request):
             yield
 
 
+@pytest.fixture(scope="session")
+def gh_version():
+    """Session-memoized gh CLI version string.
+
+    Tests that exercise a real gh invocation depend on this fixture so they
+    skip (instead of fail) in environments without the binary; the probe runs
+    once per session.
+    """
+    try:
+        return subprocess.check_output(["gh", "--version"], text=True)
+    except (OSError, subprocess.CalledProcessError):
+        pytest.skip("gh CLI is not available")
+
+
+@pytest.fixture
+def temp_workspace_dir(tmp_path):
+    """Fixture providing a temporary workspace directory.
+
+    Uses pytest's managed tmp root (one parent per session, old runs pruned)
+    instead of creating and tearing down a TemporaryDirectory per test.
+    """
+    return str(tmp_path)
+
+
+class FakeTicketClient:
+    """Lean ticket-client stand-in with plain Mock attributes.
+
+    Avoids MagicMock's dynamic child-mock machinery: every method the daemon
+    exercises is an explicit Mock, and reset() clears them in place instead of
+    rebuilding the object per test.
+    """
+
+    _METHOD_NAMES = (
+        "get_board_items",
+        "get_board_metadata",
+        "update_item_status",
+        "archive_item",
+        "get_ticket_body",
+        "get_ticket_labels",
+        "add_label",
+        "remove_label",
+        "set_labels",
+        "get_repo_labels",
+        "create_repo_label",
+        "get_comments",
+        "get_comments_since",
+        "add_comment",
+        "add_reaction",
+        "remove_reaction",
+        "get_last_status_actor",
+        "get_label_actor",
+        "get_linked_prs",
+        "get_parent_issue",
+        "get_pr_for_issue",
+        "remove_pr_issue_link",
+        "close_pr",
+        "delete_branch",
+        "get_pr_state",
+        "validate_connection",
+        "validate_scopes",
+    )
+
+    client_description = "FakeTicketClient"
+    supports_status_actor_check = True
+
+    def __init__(self) -> None:
+        for name in self._METHOD_NAMES:
+            setattr(self, name, Mock(name=name))
+
+    def reset(self) -> None:
+        for name in self._METHOD_NAMES:
+            getattr(self, name).reset_mock(return_value=True, side_effect=True)
+
+
+# Validate the stub against the real client once at import time, giving the
+# typo-safety of a spec'd mock without per-test autospec introspection.
+_missing = [
+    name for name in FakeTicketClient._METHOD_NAMES if not hasattr(GitHubTicketClient, name)
+]
+assert not _missing, f"FakeTicketClient methods missing on GitHubTicketClient: {_missing}"
+del _missing
+
+
+@pytest.fixture(scope="module")
+def daemon_base(tmp_path_factory):
+    """Module-scoped Daemon with mocked dependencies.
+
+    Daemon construction (config parsing, SQLite open, mock patching) is
+    expensive to repeat per test. Build one instance per module and let the
+    function-scoped ``daemon`` fixture reset mutable state between tests.
+    """
+    workspace_dir = str(tmp_path_factory.mktemp("daemon-workspace"))
+
+    config = copy.copy(_DAEMON_CONFIG)
+    # Database goes straight to sqlite3.connect, so an in-memory database
+    # avoids file creation and fsync round-trips entirely.
+    config.database_path = ":memory:"
+    config.workspace_dir = workspace_dir
+
+    # Module scope runs before the function-scoped autouse validation mock,
+    # so patch the validation methods here as well. CommentProcessor is
+    # stubbed out entirely - none of the shared-fixture modules exercise
+    # comment processing, so there is no point constructing the real one.
+    with (
+        patch(
+            "src.ticket_clients.github.GitHubTicketClient.validate_connection",
+            return_value=True,
+        ),
+        patch(
+            "src.ticket_clients.github.GitHubTicketClient.validate_scopes",
+            return_value=True,
+        ),
+        patch("src.daemon.CommentProcessor"),
+    ):
+        daemon = Daemon(config)
+        pristine_database = daemon.database
+        yield daemon
+        daemon.database = pristine_database
+        daemon.stop()
+
+
+@pytest.fixture(scope="module")
+def _daemon_pristine(daemon_base):
+    """Snapshot of daemon_base attributes that tests replace wholesale."""
+    return {"database": daemon_base.database, "ticket_client": FakeTicketClient()}
+
+
 @pytest.fixture
-def temp_workspace_dir():
-    """Fixture providing a temporary workspace directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+def daemon(daemon_base, _daemon_pristine):
+    """Function-scoped view of ``daemon_base`` with mutable state reset.
+
+    Restores the attributes tests commonly replace (ticket client, runner,
+    database, patched-in methods) instead of reconstructing the Daemon per
+    test.
+    """
+    # The daemon is never started in unit tests; stop() must only run once,
+    # in the module-level teardown, so catch any test that started or stopped
+    # the shared instance directly.
+    assert not daemon_base._running, "shared daemon fixture must not be started by tests"
+
+    # Drop instance-level overrides of methods tests patch in place
+    for name in ("_run_workflow", "_ensure_required_labels"):
+        daemon_base.__dict__.pop(name, None)
+    daemon_base.workspace_manager.__dict__.pop("is_valid_worktree", None)
+
+    daemon_base.database = _daemon_pristine["database"]
+    daemon_base.ticket_client = _daemon_pristine["ticket_client"]
+    daemon_base.ticket_client.reset()
+    daemon_base.runner = MagicMock()
+    daemon_base._repos_with_labels.clear()
+    daemon_base._project_metadata.clear()
+    return daemon_base
 
 
 @pytest.fixture
-def mock_gh_subprocess():
+def mock_gh_subprocess(monkeypatch):
     """Fixture for mocking subprocess calls to gh CLI."""
-    with patch("subprocess.run") as mock_run:
-        yield mock_run
+    mock_run = MagicMock()
+    monkeypatch.setattr(subprocess, "run", mock_run)
+    return mock_run
 
 
 @pytest.fixture
-def mock_claude_subprocess():
+def mock_claude_subprocess(monkeypatch):
     """Fixture for mocking subprocess.Popen for Claude CLI."""
-    with patch("subprocess.Popen") as mock_popen:
-        yield mock_popen
+    mock_popen = MagicMock()
+    monkeypatch.setattr(subprocess, "Popen", mock_popen)
+    return mock_popen
@@ -1,6 +1,7 @@
 """Unit tests for the claude_runner module."""
 
 import json
+import os
 import re
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -842,3 +843,67 @@ class TestRunClaudeErrorEnhancement:
         # Should contain the error but not Next steps
         assert "Some generic error" in error_msg
         assert "Next steps:" not in error_msg
+
+
+@pytest.mark.integration
+class TestRunClaudeSelectorPath:
+    """Tests driving run_claude through the real-subprocess selector path.
+
+    These spawn an actual scripted `claude` stub so the os.read-based reader
+    (the path production traffic takes) is exercised, not the readline
+    fallback the mocked tests use.
+    """
+
+    @pytest.fixture
+    def claude_stub(self, tmp_path, monkeypatch):
+        """Install a scripted `claude` binary on PATH; returns the installer."""
+
+        def install(script_body):
+            stub = tmp_path / "claude"
+            stub.write_text("#!/usr/bin/env python3\nimport json, sys, time\n" + script_body)
+            stub.chmod(0o755)
+            monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+        return install
+
+    @staticmethod
+    def _result_line(text):
+        return json.dumps({"type": "result", "result": text, "session_id": "s", "usage": {}})
+
+    @staticmethod
+    def _assistant_line(text):
+        return json.dumps(
+            {"type": "assistant", "message": {"content": [{"type": "text", "text": text}]}}
+        )
+
+    def test_coalesced_burst_is_parsed_in_full(self, claude_stub, tmp_path):
+        """Test that several lines written in one pipe chunk are all processed."""
+        claude_stub(
+            "sys.stdin.read()\n"
+            f"sys.stdout.write({self._assistant_line('chunk')!r} + '\\n' "
+            f"+ {self._result_line('final')!r} + '\\n')\n"
+            "sys.stdout.flush()\n"
+        )
+
+        result = run_claude("hi", str(tmp_path), poll_interval=0.05)
+
+        assert result.response == "chunkfinal"
+
+    def test_pending_partial_line_is_flushed_at_eof(self, claude_stub, tmp_path):
+        """Test that a final line without a trailing newline is parsed at EOF."""
+        claude_stub(
+            "sys.stdin.read()\n"
+            f"sys.stdout.write({self._result_line('no trailing newline')!r})\n"
+            "sys.stdout.flush()\n"
+        )
+
+        result = run_claude("hi", str(tmp_path), poll_interval=0.05)
+
+        assert result.response == "no trailing newline"
+
+    def test_inactivity_timeout_fires_for_silent_process(self, claude_stub, tmp_path):
+        """Test that a silently hung subprocess is killed at the inactivity timeout."""
+        claude_stub("sys.stdin.read()\ntime.sleep(60)\n")
+
+        with pytest.raises(ClaudeTimeoutError, match="inactivity timeout"):
+            run_claude("hi", str(tmp_path), inactivity_timeout=1, timeout=30, poll_interval=0.05)
@@ -8,250 +8,257 @@ These tests verify that the daemon correctly:
 """
 
 import json
-import tempfile
-from unittest.mock import MagicMock, patch
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, patch
 
 import pytest
 
 from src.daemon import Daemon, WorkflowRunner
-
-
-@pytest.fixture
-def config_with_azure():
-    """Fixture providing a config with Azure OAuth configured."""
+from src.integrations.mcp_client import MCPTestResult
+
+# Canonical config defaults applied in one configure_mock call per fixture
+# instead of dozens of per-attribute MagicMock assignments.
+_BASE_CONFIG_ATTRS = {
+    "poll_interval": 60,
+    "watched_statuses": ["Research", "Plan", "Implement"],
+    "max_concurrent_workflows": 2,
+    "project_urls": ["https://github.com/orgs/test/projects/1"],
+    "github_enterprise_version": None,
+    "github_enterprise_host": None,
+    "github_token": None,
+    "github_enterprise_token": None,
+    "username_self": "test-bot",
+    "team_usernames": [],
+    "ghes_logs_mask": False,
+    "azure_tenant_id": None,
+    "azure_client_id": None,
+    "azure_username": None,
+    "azure_password": None,
+    "azure_scope": None,
+}
+
+
+def _make_config(workspace_dir, **overrides):
+    """Build a config MagicMock from the canonical defaults plus overrides."""
     config = MagicMock()
-    config.poll_interval = 60
-    config.watched_statuses = ["Research", "Plan", "Implement"]
-    config.max_concurrent_workflows = 2
-    config.workspace_dir = tempfile.mkdtemp()
-    config.project_urls = ["https://github.com/orgs/test/projects/1"]
-
-    config.github_enterprise_version = None
-    config.github_enterprise_host = None
-    config.github_token = None
-    config.github_enterprise_token = None
-    config.username_self = "test-bot"
-    config.team_usernames = []
-    config.ghes_logs_mask = False
-
-    # Azure OAuth settings
-    config.azure_tenant_id = "test-tenant-id"
-    config.azure_client_id = "test-client-id"
-    config.azure_username = "test@example.com"
-    config.azure_password = "test-password"
-    config.azure_scope = "https://api.example.com/.default"
+    config.configure_mock(
+        **{
+            **_BASE_CONFIG_ATTRS,
+            "workspace_dir": workspace_dir,
+            "database_path": f"{workspace_dir}/test.db",
+            **overrides,
+        }
+    )
     return config
 
 
-@pytest.fixture
-def config_without_azure():
+@pytest.fixture(scope="module")
+def config_with_azure(tmp_path_factory):
+    """Fixture providing a config with Azure OAuth configured."""
+    return _make_config(
+        str(tmp_path_factory.mktemp("kiln-ws-azure")),
+        azure_tenant_id="test-tenant-id",
+        azure_client_id="test-client-id",
+        azure_username="test@example.com",
+        azure_password="test-password",
+        azure_scope="https://api.example.com/.default",
+    )
+
+
+@pytest.fixture(scope="module")
+def config_without_azure(tmp_path_factory):
     """Fixture providing a config without Azure OAuth."""
-    config = MagicMock()
-    config.poll_interval = 60
-    config.watched_statuses = ["Research", "Plan", "Implement"]
-    config.max_concurrent_workflows = 2
-    config.workspace_dir = tempfile.mkdtemp()
-    config.project_urls = ["https://github.com/orgs/test/projects/1"]
-
-    config.github_enterprise_version = None
-    config.github_enterprise_host = None
-    config.github_token = None
-    config.github_enterprise_token = None
-    config.username_self = "test-bot"
-    config.team_usernames = []
-    config.ghes_logs_mask = False
-
-    # No Azure OAuth settings
-    config.azure_tenant_id = None
-    config.azure_client_id = None
-    config.azure_username = None
-    config.azure_password = None
-    config.azure_scope = None
-    return config
+    return _make_config(str(tmp_path_factory.mktemp("kiln-ws")))
 
 
 @pytest.fixture
-def temp_mcp_config(tmp_path):
-    """Fixture providing a temporary MCP config file."""
-    kiln_dir = tmp_path / ".kiln"
-    kiln_dir.mkdir()
-    mcp_config_path = kiln_dir / "mcp.json"
+def mock_daemon_deps():
+    """Fixture patching Daemon's collaborators once per test.
 
-    config_data = {
+    Replaces the nested per-test ``with patch(...)`` stacks with a single
+    ``patch.multiple`` call, yielding the class mocks plus a pre-configured
+    MCP config manager instance.
+    """
+    with (
+        patch("src.ticket_clients.github.GitHubTicketClient"),
+        patch.multiple("src.daemon", AzureOAuthClient=DEFAULT, MCPConfigManager=DEFAULT) as mocks,
+    ):
+        mock_mcp_instance = MagicMock()
+        mock_mcp_instance.validate_config.return_value = []
+        mock_mcp_instance.has_config.return_value = False
+        mocks["MCPConfigManager"].return_value = mock_mcp_instance
+
+        yield SimpleNamespace(
+            oauth_class=mocks["AzureOAuthClient"],
+            mcp_class=mocks["MCPConfigManager"],
+            mcp_instance=mock_mcp_instance,
+        )
+
+
+def _build_daemon(config):
+    """Construct a Daemon under the standard collaborator patches.
+
+    Returns a namespace bundling the daemon with the class mocks recorded at
+    construction, so module-scoped fixtures can share one build across tests.
+    """
+    # Module-scoped callers run before the function-scoped autouse validation
+    # mock, so the validation methods are patched here as well.
+    with (
+        patch(
+            "src.ticket_clients.github.GitHubTicketClient.validate_connection",
+            return_value=True,
+        ),
+        patch(
+            "src.ticket_clients.github.GitHubTicketClient.validate_scopes",
+            return_value=True,
+        ),
+        patch.multiple("src.daemon", AzureOAuthClient=DEFAULT, MCPConfigManager=DEFAULT) as mocks,
+    ):
+        mock_mcp_instance = MagicMock()
+        mock_mcp_instance.validate_config.return_value = []
+        mock_mcp_instance.has_config.return_value = False
+        mocks["MCPConfigManager"].return_value = mock_mcp_instance
+
+        daemon = Daemon(config)
+
+    return SimpleNamespace(
+        daemon=daemon,
+        oauth_class=mocks["AzureOAuthClient"],
+        mcp_class=mocks["MCPConfigManager"],
+        mcp_instance=mock_mcp_instance,
+    )
+
+
+@pytest.fixture(scope="module")
+def daemon_with_azure(config_with_azure):
+    """Daemon constructed once per module with Azure OAuth configured."""
+    built = _build_daemon(config_with_azure)
+    yield built
+    built.daemon.stop()
+
+
+@pytest.fixture(scope="module")
+def daemon_without_azure(config_without_azure):
+    """Daemon constructed once per module without Azure OAuth."""
+    built = _build_daemon(config_without_azure)
+    yield built
+    built.daemon.stop()
+
+
+# Static MCP config payload, serialized once at import instead of per test.
+_MULTI_SERVER_MCP_CONFIG_JSON = json.dumps(
+    {
         "mcpServers": {
-            "test-server": {
-                "command": "test-mcp-server",
-                "args": ["--port", "8080"],
-                "env": {"TOKEN": "${AZURE_BEARER_TOKEN}"},
-            }
+            "jenkins": {
+                "url": "https://jenkins.example.com/mcp",
+                "env": {"AUTHORIZATION": "Bearer test-token"},
+            },
+            "filesystem": {
+                "command": "npx",
+                "args": ["-y", "@modelcontextprotocol/fs-server"],
+            },
         }
     }
-    mcp_config_path.write_text(json.dumps(config_data))
-
-    return tmp_path
+)
 
 
 @pytest.mark.unit
+@pytest.mark.xdist_group(name="daemon_mcp")
 class TestDaemonAzureOAuthInitialization:
     """Tests for Daemon Azure OAuth client initialization."""
 
-    def test_azure_oauth_client_initialized_when_configured(self, config_with_azure):
+    def test_azure_oauth_client_initialized_when_configured(self, daemon_with_azure):
         """Test that Azure OAuth client is created when all fields are configured."""
-        with (
-            patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.AzureOAuthClient") as mock_oauth_class,
-            patch("src.daemon.MCPConfigManager") as mock_mcp_class,
-        ):
-            mock_mcp_instance = MagicMock()
-            mock_mcp_instance.validate_config.return_value = []
-            mock_mcp_instance.has_config.return_value = False
-            mock_mcp_class.return_value = mock_mcp_instance
-
-            config_with_azure.database_path = f"{config_with_azure.workspace_dir}/test.db"
-
-            daemon = Daemon(config_with_azure)
-
-            # Verify Azure OAuth client was created with correct parameters
-            mock_oauth_class.assert_called_once_with(
-                tenant_id="test-tenant-id",
-                client_id="test-client-id",
-                username="test@example.com",
-                password="test-password",
-                scope="https://api.example.com/.default",
-            )
-
-            daemon.stop()
-
-    def test_azure_oauth_client_not_initialized_when_not_configured(self, config_without_azure):
+        daemon_with_azure.oauth_class.assert_called_once_with(
+            tenant_id="test-tenant-id",
+            client_id="test-client-id",
+            username="test@example.com",
+            password="test-password",
+            scope="https://api.example.com/.default",
+        )
+
+    def test_azure_oauth_client_not_initialized_when_not_configured(self, daemon_without_azure):
         """Test that Azure OAuth client is None when not configured."""
-        with (
-            patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.AzureOAuthClient") as mock_oauth_class,
-            patch("src.daemon.MCPConfigManager") as mock_mcp_class,
-        ):
-            mock_mcp_instance = MagicMock()
-            mock_mcp_instance.validate_config.return_value = []
-            mock_mcp_instance.has_config.return_value = False
-            mock_mcp_class.return_value = mock_mcp_instance
-
-            config_without_azure.database_path = f"{config_without_azure.workspace_dir}/test.db"
-
-            daemon = Daemon(config_without_azure)
-
-            # Verify Azure OAuth client was NOT created
-            mock_oauth_class.assert_not_called()
-            assert daemon.azure_oauth_client is None
-
-            daemon.stop()
+        daemon_without_azure.oauth_class.assert_not_called()
+        assert daemon_without_azure.daemon.azure_oauth_client is None
 
 
 @pytest.mark.unit
+@pytest.mark.xdist_group(name="daemon_mcp")
 class TestDaemonMCPConfigManagerInitialization:
     """Tests for Daemon MCP config manager initialization."""
 
-    def test_mcp_config_manager_initialized(self, config_without_azure):
+    def test_mcp_config_manager_initialized(self, daemon_without_azure):
         """Test that MCP config manager is always initialized."""
-        with (
-            patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.MCPConfigManager") as mock_mcp_class,
-        ):
-            mock_mcp_instance = MagicMock()
-            mock_mcp_instance.validate_config.return_value = []
-            mock_mcp_instance.has_config.return_value = False
-            mock_mcp_class.return_value = mock_mcp_instance
-
-            config_without_azure.database_path = f"{config_without_azure.workspace_dir}/test.db"
-
-            daemon = Daemon(config_without_azure)
-
-            # Verify MCP config manager was created with azure_client=None
-            mock_mcp_class.assert_called_once_with(azure_client=None)
-            assert daemon.mcp_config_manager is mock_mcp_instance
+        daemon_without_azure.mcp_class.assert_called_once_with(azure_client=None)
+        assert daemon_without_azure.daemon.mcp_config_manager is daemon_without_azure.mcp_instance
 
-            daemon.stop()
-
-    def test_mcp_config_manager_initialized_with_azure_client(self, config_with_azure):
+    def test_mcp_config_manager_initialized_with_azure_client(self, daemon_with_azure):
         """Test that MCP config manager receives the Azure OAuth client."""
-        with (
-            patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.AzureOAuthClient") as mock_oauth_class,
-            patch("src.daemon.MCPConfigManager") as mock_mcp_class,
-        ):
-            mock_oauth_instance = MagicMock()
-            mock_oauth_class.return_value = mock_oauth_instance
-
-            mock_mcp_instance = MagicMock()
-            mock_mcp_instance.validate_config.return_value = []
-            mock_mcp_instance.has_config.return_value = False
-            mock_mcp_class.return_value = mock_mcp_instance
-
-            config_with_azure.database_path = f"{config_with_azure.workspace_dir}/test.db"
-
-            daemon = Daemon(config_with_azure)
-
-            # Verify MCP config manager was created with Azure client
-            mock_mcp_class.assert_called_once_with(azure_client=mock_oauth_instance)
+        daemon_with_azure.mcp_class.assert_called_once_with(
+            azure_client=daemon_with_azure.oauth_class.return_value
+        )
 
-            daemon.stop()
-
-    def test_mcp_config_validation_warnings_logged(self, config_without_azure):
+    def test_mcp_config_validation_warnings_logged(self, config_without_azure, mock_daemon_deps):
         """Test that MCP config validation warnings are logged."""
-        with (
-            patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.MCPConfigManager") as mock_mcp_class,
-            patch("src.daemon.logger") as mock_logger,
-        ):
-            mock_mcp_instance = MagicMock()
-            mock_mcp_instance.validate_config.return_value = [
-                "Warning 1: Missing field",
-                "Warning 2: Invalid config",
-            ]
-            mock_mcp_instance.has_config.return_value = False
-            mock_mcp_class.return_value = mock_mcp_instance
-
-            config_without_azure.database_path = f"{config_without_azure.workspace_dir}/test.db"
+        mock_daemon_deps.mcp_instance.validate_config.return_value = [
+            "Warning 1: Missing field",
+            "Warning 2: Invalid config",
+        ]
 
+        with patch("src.daemon.logger") as mock_logger:
             daemon = Daemon(config_without_azure)
-
-            # Verify warnings were logged
-            warning_calls = [
-                call
-                for call in mock_logger.warning.call_args_list
-                if "MCP config warning" in str(call)
-            ]
-            assert len(warning_calls) == 2
-
+            # Stop before asserting so a failed assertion cannot leak the
+            # daemon's executor and database into later tests.
             daemon.stop()
 
+        # Verify warnings were logged
+        warning_calls = [
+            call for call in mock_logger.warning.call_args_list if "MCP config warning" in str(call)
+        ]
+        assert len(warning_calls) == 2
+
 
 @pytest.mark.unit
+@pytest.mark.xdist_group(name="daemon_mcp")
 class TestWorkflowRunnerMCPConfig:
     """Tests for WorkflowRunner MCP config path handling."""
 
-    def test_run_passes_mcp_config_path_to_run_claude(self):
-        """Test that WorkflowRunner.run() passes mcp_config_path to run_claude()."""
+    @pytest.fixture(scope="module")
+    def wf_mocks(self):
+        """Preconfigured runner/workflow/context mocks shared by these tests.
+
+        The tests only read from these objects, so one set per module is
+        enough; only the mcp_config_path kwarg varies per test.
+        """
         config = MagicMock()
 
-        runner = WorkflowRunner(config)
+        workflow = MagicMock()
+        workflow.name = "test-workflow"
+        workflow.init.return_value = ["test prompt"]
 
-        mock_workflow = MagicMock()
-        mock_workflow.name = "test-workflow"
-        mock_workflow.init.return_value = ["test prompt"]
+        ctx = MagicMock()
+        ctx.repo = "test/repo"
+        ctx.issue_number = 123
+        ctx.workspace_path = "/path/to/workspace"
 
-        mock_ctx = MagicMock()
-        mock_ctx.repo = "test/repo"
-        mock_ctx.issue_number = 123
-        mock_ctx.workspace_path = "/path/to/workspace"
+        result = MagicMock()
+        result.response = "test response"
+        result.metrics = None
 
+        return SimpleNamespace(
+            runner=WorkflowRunner(config), workflow=workflow, ctx=ctx, result=result
+        )
+
+    def test_run_passes_mcp_config_path_to_run_claude(self, wf_mocks):
+        """Test that WorkflowRunner.run() passes mcp_config_path to run_claude()."""
         with patch("src.daemon.run_claude") as mock_run_claude:
-            mock_result = MagicMock()
-            mock_result.response = "test response"
-            mock_result.metrics = None
-            mock_run_claude.return_value = mock_result
-
-            runner.run(
-                mock_workflow,
-                mock_ctx,
+            mock_run_claude.return_value = wf_mocks.result
+
+            wf_mocks.runner.run(
+                wf_mocks.workflow,
+                wf_mocks.ctx,
                 "Research",
                 resume_session=None,
                 mcp_config_path="/path/to/.mcp.kiln.json",
@@ -262,30 +269,14 @@ class TestWorkflowRunnerMCPConfig:
             call_kwargs = mock_run_claude.call_args
             assert call_kwargs.kwargs.get("mcp_config_path") == "/path/to/.mcp.kiln.json"
 
-    def test_run_passes_none_when_no_mcp_config(self):
+    def test_run_passes_none_when_no_mcp_config(self, wf_mocks):
         """Test that WorkflowRunner.run() passes None when no MCP config."""
-        config = MagicMock()
-
-        runner = WorkflowRunner(config)
-
-        mock_workflow = MagicMock()
-        mock_workflow.name = "test-workflow"
-        mock_workflow.init.return_value = ["test prompt"]
-
-        mock_ctx = MagicMock()
-        mock_ctx.repo = "test/repo"
-        mock_ctx.issue_number = 123
-        mock_ctx.workspace_path = "/path/to/workspace"
-
         with patch("src.daemon.run_claude") as mock_run_claude:
-            mock_result = MagicMock()
-            mock_result.response = "test response"
-            mock_result.metrics = None
-            mock_run_claude.return_value = mock_result
-
-            runner.run(
-                mock_workflow,
-                mock_ctx,
+            mock_run_claude.return_value = wf_mocks.result
+
+            wf_mocks.runner.run(
+                wf_mocks.workflow,
+                wf_mocks.ctx,
                 "Research",
                 resume_session=None,
                 # No mcp_config_path provided
@@ -298,6 +289,7 @@ class TestWorkflowRunnerMCPConfig:
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group(name="daemon_mcp")
 class TestDaemonMCPStartupLogging:
     """Integration tests for MCP startup logging behavior.
 
@@ -312,21 +304,7 @@ class TestDaemonMCPStartupLogging:
         """Create a temporary MCP config with multiple servers."""
         kiln_dir = tmp_path / ".kiln"
         kiln_dir.mkdir()
-        mcp_config_path = kiln_dir / "mcp.json"
-
-        config_data = {
-            "mcpServers": {
-                "jenkins": {
-                    "url": "https://jenkins.example.com/mcp",
-                    "env": {"AUTHORIZATION": "Bearer test-token"},
-                },
-                "filesystem": {
-                    "command": "npx",
-                    "args": ["-y", "@modelcontextprotocol/fs-server"],
-                },
-            }
-        }
-        mcp_config_path.write_text(json.dumps(config_data))
+        (kiln_dir / "mcp.json").write_text(_MULTI_SERVER_MCP_CONFIG_JSON)
 
         # Change to this directory so MCPConfigManager finds the config
         import os
@@ -339,33 +317,32 @@ class TestDaemonMCPStartupLogging:
     @pytest.fixture
     def base_config(self, tmp_path):
         """Base configuration without Azure OAuth."""
-        config = MagicMock()
-        config.poll_interval = 60
-        config.watched_statuses = ["Research", "Plan", "Implement"]
-        config.max_concurrent_workflows = 2
-        config.workspace_dir = str(tmp_path)
-        config.database_path = str(tmp_path / "test.db")
-        config.project_urls = ["https://github.com/orgs/test/projects/1"]
-
-        config.github_enterprise_version = None
-        config.github_enterprise_host = None
-        config.github_token = None
-        config.github_enterprise_token = None
-        config.username_self = "test-bot"
-        config.team_usernames = []
-        config.ghes_logs_mask = False
-
-        config.azure_tenant_id = None
-        config.azure_client_id = None
-        config.azure_username = None
-        config.azure_password = None
-        config.azure_scope = None
-        return config
-
-    def test_daemon_logs_successful_mcp_connections(self, base_config, mock_mcp_config):
-        """Test that daemon logs per-server success with tool lists."""
-        from src.integrations.mcp_client import MCPTestResult
+        return _make_config(str(tmp_path))
 
+    @pytest.fixture
+    def mcp_startup(self):
+        """Factory running Daemon startup with canned MCP results.
+
+        Enters the shared patch stack once per test via ExitStack and returns
+        the check/logger mocks for assertions.
+        """
+        with ExitStack() as stack:
+            stack.enter_context(patch("src.ticket_clients.github.GitHubTicketClient"))
+            mock_check = stack.enter_context(patch("src.daemon.check_all_mcp_servers"))
+            mock_logger = stack.enter_context(patch("src.daemon.logger"))
+
+            def start(config, results):
+                mock_check.return_value = results
+                daemon = Daemon(config)
+                daemon.stop()
+                return SimpleNamespace(daemon=daemon, check=mock_check, logger=mock_logger)
+
+            yield start
+
+    def test_daemon_logs_successful_mcp_connections(
+        self, base_config, mock_mcp_config, mcp_startup
+    ):
+        """Test that daemon logs per-server success with tool lists."""
         # Mock check_all_mcp_servers to return successful results
         mock_results = [
             MCPTestResult(
@@ -380,34 +357,25 @@ class TestDaemonMCPStartupLogging:
             ),
         ]
 
-        with (
-            patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=mock_results) as mock_check,
-            patch("src.daemon.logger") as mock_logger,
-        ):
-            daemon = Daemon(base_config)
+        started = mcp_startup(base_config, mock_results)
 
-            # Verify check_all_mcp_servers was called
-            mock_check.assert_called_once()
+        # Verify check_all_mcp_servers was called
+        started.check.assert_called_once()
 
-            # Verify per-server success was logged with tool lists
-            info_calls = [str(call) for call in mock_logger.info.call_args_list]
-            jenkins_log = next((c for c in info_calls if "jenkins" in c.lower()), None)
-            filesystem_log = next((c for c in info_calls if "filesystem" in c.lower()), None)
+        # Verify per-server success was logged with tool lists
+        info_calls = [str(call) for call in started.logger.info.call_args_list]
+        jenkins_log = next((c for c in info_calls if "jenkins" in c.lower()), None)
+        filesystem_log = next((c for c in info_calls if "filesystem" in c.lower()), None)
 
-            assert jenkins_log is not None, "Jenkins MCP success should be logged"
-            assert "loaded successfully" in jenkins_log
-            assert "build_job" in jenkins_log or "Tools:" in jenkins_log
+        assert jenkins_log is not None, "Jenkins MCP success should be logged"
+        assert "loaded successfully" in jenkins_log
+        assert "build_job" in jenkins_log or "Tools:" in jenkins_log
 
-            assert filesystem_log is not None, "Filesystem MCP success should be logged"
-            assert "loaded successfully" in filesystem_log
-
-            daemon.stop()
+        assert filesystem_log is not None, "Filesystem MCP success should be logged"
+        assert "loaded successfully" in filesystem_log
 
-    def test_daemon_logs_failing_mcp_connections(self, base_config, mock_mcp_config):
+    def test_daemon_logs_failing_mcp_connections(self, base_config, mock_mcp_config, mcp_startup):
         """Test that daemon logs per-server failures with error messages."""
-        from src.integrations.mcp_client import MCPTestResult
-
         # Mock check_all_mcp_servers to return failure results
         mock_results = [
             MCPTestResult(
@@ -422,32 +390,21 @@ class TestDaemonMCPStartupLogging:
             ),
         ]
 
-        with (
-            patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=mock_results),
-            patch("src.daemon.logger") as mock_logger,
-        ):
-            daemon = Daemon(base_config)
+        started = mcp_startup(base_config, mock_results)
 
-            # Verify failures are logged as warnings
-            warning_calls = [str(call) for call in mock_logger.warning.call_args_list]
-            jenkins_warning = next((c for c in warning_calls if "jenkins" in c.lower()), None)
-            filesystem_warning = next((c for c in warning_calls if "filesystem" in c.lower()), None)
+        # Verify failures are logged as warnings
+        warning_calls = [str(call) for call in started.logger.warning.call_args_list]
+        jenkins_warning = next((c for c in warning_calls if "jenkins" in c.lower()), None)
+        filesystem_warning = next((c for c in warning_calls if "filesystem" in c.lower()), None)
 
-            assert jenkins_warning is not None, "Jenkins MCP failure should be logged as warning"
-            assert "timeout" in jenkins_warning
+        assert jenkins_warning is not None, "Jenkins MCP failure should be logged as warning"
+        assert "timeout" in jenkins_warning
 
-            assert filesystem_warning is not None, (
-                "Filesystem MCP failure should be logged as warning"
-            )
-            assert "command not found" in filesystem_warning
-
-            daemon.stop()
+        assert filesystem_warning is not None, "Filesystem MCP failure should be logged as warning"
+        assert "command not found" in filesystem_warning
 
-    def test_daemon_logs_mixed_mcp_results(self, base_config, mock_mcp_config):
+    def test_daemon_logs_mixed_mcp_results(self, base_config, mock_mcp_config, mcp_startup):
         """Test that daemon correctly logs mix of successful and failing servers."""
-        from src.integrations.mcp_client import MCPTestResult
-
         # Mock check_all_mcp_servers to return mixed results
         mock_results = [
             MCPTestResult(
@@ -462,28 +419,19 @@ class TestDaemonMCPStartupLogging:
             ),
         ]
 
-        with (
-            patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=mock_results),
-            patch("src.daemon.logger") as mock_logger,
-        ):
-            daemon = Daemon(base_config)
+        started = mcp_startup(base_config, mock_results)
 
-            # Verify successful connection is logged as info
-            info_calls = [str(call) for call in mock_logger.info.call_args_list]
-            jenkins_log = next((c for c in info_calls if "jenkins" in c.lower()), None)
-            assert jenkins_log is not None, "Jenkins MCP success should be logged as info"
-            assert "loaded successfully" in jenkins_log
-
-            # Verify failure is logged as warning
-            warning_calls = [str(call) for call in mock_logger.warning.call_args_list]
-            filesystem_warning = next((c for c in warning_calls if "filesystem" in c.lower()), None)
-            assert filesystem_warning is not None, (
-                "Filesystem MCP failure should be logged as warning"
-            )
-            assert "connection refused" in filesystem_warning
+        # Verify successful connection is logged as info
+        info_calls = [str(call) for call in started.logger.info.call_args_list]
+        jenkins_log = next((c for c in info_calls if "jenkins" in c.lower()), None)
+        assert jenkins_log is not None, "Jenkins MCP success should be logged as info"
+        assert "loaded successfully" in jenkins_log
 
-            daemon.stop()
+        # Verify failure is logged as warning
+        warning_calls = [str(call) for call in started.logger.warning.call_args_list]
+        filesystem_warning = next((c for c in warning_calls if "filesystem" in c.lower()), None)
+        assert filesystem_warning is not None, "Filesystem MCP failure should be logged as warning"
+        assert "connection refused" in filesystem_warning
 
     def test_daemon_skips_mcp_testing_when_no_config(self, base_config):
         """Test that daemon doesn't call check_all_mcp_servers when no MCP config."""
@@ -504,10 +452,10 @@ class TestDaemonMCPStartupLogging:
 
             daemon.stop()
 
-    def test_daemon_logs_tools_as_comma_separated_list(self, base_config, mock_mcp_config):
+    def test_daemon_logs_tools_as_comma_separated_list(
+        self, base_config, mock_mcp_config, mcp_startup
+    ):
         """Test that tool lists are formatted as comma-separated strings."""
-        from src.integrations.mcp_client import MCPTestResult
-
         # Mock check_all_mcp_servers to return results with multiple tools
         mock_results = [
             MCPTestResult(
@@ -517,28 +465,19 @@ class TestDaemonMCPStartupLogging:
             ),
         ]
 
-        with (
-            patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=mock_results),
-            patch("src.daemon.logger") as mock_logger,
-        ):
-            daemon = Daemon(base_config)
-
-            # Check the format: "Tools: build_job, get_logs, list_jobs"
-            info_calls = [str(call) for call in mock_logger.info.call_args_list]
-            jenkins_log = next((c for c in info_calls if "jenkins" in c.lower()), None)
-            assert jenkins_log is not None
-            # Verify comma-separated format
-            assert "build_job, get_logs, list_jobs" in jenkins_log or all(
-                tool in jenkins_log for tool in ["build_job", "get_logs", "list_jobs"]
-            )
+        started = mcp_startup(base_config, mock_results)
 
-            daemon.stop()
+        # Check the format: "Tools: build_job, get_logs, list_jobs"
+        info_calls = [str(call) for call in started.logger.info.call_args_list]
+        jenkins_log = next((c for c in info_calls if "jenkins" in c.lower()), None)
+        assert jenkins_log is not None
+        # Verify comma-separated format
+        assert "build_job, get_logs, list_jobs" in jenkins_log or all(
+            tool in jenkins_log for tool in ["build_job", "get_logs", "list_jobs"]
+        )
 
-    def test_daemon_logs_none_when_no_tools(self, base_config, mock_mcp_config):
+    def test_daemon_logs_none_when_no_tools(self, base_config, mock_mcp_config, mcp_startup):
         """Test that 'none' is logged when server has no tools."""
-        from src.integrations.mcp_client import MCPTestResult
-
         # Mock check_all_mcp_servers to return results with empty tools
         mock_results = [
             MCPTestResult(
@@ -548,25 +487,18 @@ class TestDaemonMCPStartupLogging:
             ),
         ]
 
-        with (
-            patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=mock_results),
-            patch("src.daemon.logger") as mock_logger,
-        ):
-            daemon = Daemon(base_config)
-
-            # Check that "Tools: none" is logged
-            info_calls = [str(call) for call in mock_logger.info.call_args_list]
-            empty_log = next((c for c in info_calls if "empty-server" in c.lower()), None)
-            assert empty_log is not None
-            assert "Tools: none" in empty_log
+        started = mcp_startup(base_config, mock_results)
 
-            daemon.stop()
+        # Check that "Tools: none" is logged
+        info_calls = [str(call) for call in started.logger.info.call_args_list]
+        empty_log = next((c for c in info_calls if "empty-server" in c.lower()), None)
+        assert empty_log is not None
+        assert "Tools: none" in empty_log
 
-    def test_daemon_continues_startup_on_mcp_failures(self, base_config, mock_mcp_config):
+    def test_daemon_continues_startup_on_mcp_failures(
+        self, base_config, mock_mcp_config, mcp_startup
+    ):
         """Test that daemon startup completes even when all MCP servers fail."""
-        from src.integrations.mcp_client import MCPTestResult
-
         # Mock check_all_mcp_servers to return all failures
         mock_results = [
             MCPTestResult(
@@ -581,39 +513,25 @@ class TestDaemonMCPStartupLogging:
             ),
         ]
 
-        with (
-            patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=mock_results),
-            patch("src.daemon.logger"),
-        ):
-            # Daemon should initialize successfully despite all MCP failures
-            daemon = Daemon(base_config)
-            assert daemon is not None
-            assert daemon._running is False  # Not started yet, just initialized
-
-            daemon.stop()
+        # Daemon should initialize successfully despite all MCP failures
+        started = mcp_startup(base_config, mock_results)
+        assert started.daemon is not None
+        assert started.daemon._running is False  # Not started, just initialized
 
-    def test_daemon_logs_mcp_server_count_before_details(self, base_config, mock_mcp_config):
+    def test_daemon_logs_mcp_server_count_before_details(
+        self, base_config, mock_mcp_config, mcp_startup
+    ):
         """Test that daemon logs total server count before per-server details."""
-        from src.integrations.mcp_client import MCPTestResult
-
         mock_results = [
             MCPTestResult(server_name="server1", success=True, tools=["tool1"]),
             MCPTestResult(server_name="server2", success=True, tools=["tool2"]),
         ]
 
-        with (
-            patch("src.ticket_clients.github.GitHubTicketClient"),
-            patch("src.daemon.check_all_mcp_servers", return_value=mock_results),
-            patch("src.daemon.logger") as mock_logger,
-        ):
-            daemon = Daemon(base_config)
-
-            # Verify server count is logged
-            info_calls = [str(call) for call in mock_logger.info.call_args_list]
-            count_log = next(
-                (c for c in info_calls if "server(s)" in c.lower() or "2 server" in c.lower()), None
-            )
-            assert count_log is not None, "MCP server count should be logged"
+        started = mcp_startup(base_config, mock_results)
 
-            daemon.stop()
+        # Verify server count is logged
+        info_calls = [str(call) for call in started.logger.info.call_args_list]
+        count_log = next(
+            (c for c in info_calls if "server(s)" in c.lower() or "2 server" in c.lower()), None
+        )
+        assert count_log is not None, "MCP server count should be logged"
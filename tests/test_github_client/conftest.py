@@ -1,18 +1,177 @@
 """Shared fixtures for GitHub client tests."""
 
+import subprocess
+from types import SimpleNamespace
+
 import pytest
 
 from src.ticket_clients.github import GitHubTicketClient
 from src.ticket_clients.github_enterprise_3_18 import GitHubEnterprise318Client
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _no_real_gh_subprocess(monkeypatch):
+    """Guard against unmocked gh invocations escaping to a real subprocess.
+
+    Every test here is a pure unit test that patches _run_gh_command or
+    _execute_graphql_query*; a missed patch would otherwise silently shell
+    out to gh (slow, flaky, network-dependent). Fail loudly instead.
+    """
+
+    def _blocked(*args, **kwargs):
+        raise AssertionError(
+            f"unmocked subprocess call escaped the test: {args[0] if args else kwargs}"
+        )
+
+    monkeypatch.setattr("src.ticket_clients.base.subprocess.run", _blocked)
+    monkeypatch.setattr("src.ticket_clients.github.subprocess.run", _blocked)
+
+
+@pytest.fixture(scope="session")
 def github_client():
-    """Fixture providing a GitHubTicketClient instance."""
+    """Fixture providing a GitHubTicketClient instance.
+
+    Session-scoped: tests patch methods via monkeypatch/context managers
+    (restored per test), and the autouse _clear_client_state fixture wipes
+    the mutable instance state (_label_cache, _repo_host_map) between tests.
+    """
     return GitHubTicketClient(tokens={"github.com": "test-token"})
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def enterprise_318_client():
-    """Fixture providing a GitHubEnterprise318Client instance."""
+    """Fixture providing a GitHubEnterprise318Client instance.
+
+    Module-scoped for the same reason as github_client: tests only patch
+    methods via context managers and never mutate the instance.
+    """
     return GitHubEnterprise318Client(tokens={"github.mycompany.com": "test-token"})
+
+
+@pytest.fixture
+def graphql_stub(monkeypatch):
+    """Factory installing a swappable GraphQL stub on a client.
+
+    Instead of opening a patch.object context manager per test, a test does
+    ``stub = graphql_stub(client)`` once and assigns ``stub.response``,
+    ``stub.responses`` (consumed in order), or ``stub.error``. Calls are
+    recorded with query, variables and kwargs.
+    """
+
+    class _Stub:
+        def __init__(self):
+            self.response = None
+            self.responses = None
+            self.error = None
+            self.calls = []
+
+        @property
+        def call_count(self):
+            return len(self.calls)
+
+        def __call__(self, query, variables, **kwargs):
+            self.calls.append(SimpleNamespace(query=query, variables=variables, kwargs=kwargs))
+            if self.error is not None:
+                raise self.error
+            if self.responses is not None:
+                return self.responses.pop(0)
+            return self.response
+
+    def install(client, method="_execute_graphql_query"):
+        stub = _Stub()
+        monkeypatch.setattr(client, method, stub)
+        return stub
+
+    return install
+
+
+@pytest.fixture(autouse=True)
+def _clear_client_state(github_client):
+    """Reset the session-scoped client's mutable state between tests.
+
+    The real board-item parsing path writes _repo_host_map entries on the
+    shared instance, and the label TTL cache persists lookups; clearing both
+    keeps tests order-independent.
+    """
+    github_client._label_cache.clear()
+    github_client._repo_host_map.clear()
+    yield
+    github_client._label_cache.clear()
+    github_client._repo_host_map.clear()
+
+
+@pytest.fixture
+def gh_command_recorder(monkeypatch, github_client):
+    """Record _run_gh_command invocations and return canned stdout.
+
+    Assign .stdout (default "{}") or .error before the call under test;
+    the argv lists land in .calls.
+    """
+
+    class _Recorder:
+        def __init__(self):
+            self.calls = []
+            self.stdout = "{}"
+            self.error = None
+
+        def __call__(self, args, input_data=None, **kwargs):
+            self.calls.append(args)
+            if self.error is not None:
+                raise self.error
+            return self.stdout
+
+    recorder = _Recorder()
+    monkeypatch.setattr(github_client, "_run_gh_command", recorder)
+    return recorder
+
+
+@pytest.fixture
+def gh_transport(monkeypatch):
+    """Transport-level gh interceptor.
+
+    Replaces subprocess.run underneath _run_gh_command with a dispatcher, so
+    a test exercises the client's full command assembly (hostname flags,
+    headers, stdin payload) instead of stubbing the methods above it. Queue
+    stdout payloads with respond(); inspect calls afterwards.
+    """
+
+    class _Transport:
+        def __init__(self):
+            self.calls = []
+            self._queue = []
+
+        def respond(self, stdout):
+            self._queue.append(stdout)
+
+        def __call__(self, cmd, **kwargs):
+            self.calls.append(SimpleNamespace(cmd=cmd, kwargs=kwargs))
+            stdout = self._queue.pop(0) if self._queue else ""
+            return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr="")
+
+    transport = _Transport()
+    monkeypatch.setattr("src.ticket_clients.base.subprocess.run", transport)
+    return transport
+
+
+@pytest.fixture(scope="module")
+def graphql_pr_response():
+    """Factory building a pullRequest GraphQL response dict."""
+
+    def build(state="OPEN", merged=False, **fields):
+        return {
+            "data": {"repository": {"pullRequest": {"state": state, "merged": merged, **fields}}}
+        }
+
+    return build
+
+
+@pytest.fixture(scope="module")
+def graphql_linked_prs_response():
+    """Factory building a closedByPullRequestsReferences GraphQL response dict."""
+
+    def build(nodes):
+        return {
+            "data": {"repository": {"issue": {"closedByPullRequestsReferences": {"nodes": nodes}}}}
+        }
+
+    return build
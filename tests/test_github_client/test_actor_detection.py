@@ -45,7 +45,9 @@ class TestGetLastStatusActor:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
+        ):
             result = github_client.get_last_status_actor("github.com/owner/repo", 123)
 
         assert result == "user-b"
@@ -83,7 +85,9 @@ class TestGetLastStatusActor:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
+        ):
             result = github_client.get_last_status_actor("github.com/owner/repo", 123)
 
         # Even though add event is more recent, we return status change actor
@@ -112,7 +116,9 @@ class TestGetLastStatusActor:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
+        ):
             result = github_client.get_last_status_actor("github.com/owner/repo", 123)
 
         assert result == "project-adder"
@@ -153,7 +159,9 @@ class TestGetLastStatusActor:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
+        ):
             result = github_client.get_last_status_actor("github.com/owner/repo", 123)
 
         assert result == "last-mover"
@@ -162,7 +170,9 @@ class TestGetLastStatusActor:
         """Empty timeline should return None."""
         mock_response = {"data": {"repository": {"issue": {"timelineItems": {"nodes": []}}}}}
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
+        ):
             result = github_client.get_last_status_actor("github.com/owner/repo", 123)
 
         assert result is None
@@ -171,7 +181,9 @@ class TestGetLastStatusActor:
         """Missing issue should return None."""
         mock_response = {"data": {"repository": {"issue": None}}}
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
+        ):
             result = github_client.get_last_status_actor("github.com/owner/repo", 999)
 
         assert result is None
@@ -198,7 +210,9 @@ class TestGetLastStatusActor:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
+        ):
             result = github_client.get_last_status_actor("github.com/owner/repo", 123)
 
         assert result == "valid-user"
@@ -230,7 +244,9 @@ class TestGetLastStatusActor:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
+        ):
             result = github_client.get_last_status_actor("github.com/owner/repo", 123)
 
         assert result == "real-user"
@@ -240,6 +256,7 @@ class TestGetLastStatusActor:
         with patch.object(
             github_client,
             "_execute_graphql_query",
+            autospec=True,
             side_effect=Exception("GraphQL error"),
         ):
             result = github_client.get_last_status_actor("github.com/owner/repo", 123)
@@ -290,7 +307,9 @@ class TestGetLastStatusActor:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
+        ):
             result = github_client.get_last_status_actor("github.com/owner/repo", 123)
 
         assert result == "user-b"
@@ -320,7 +339,9 @@ class TestGetLastStatusActor:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
+        ):
             result = github_client.get_last_status_actor("github.com/owner/repo", 123)
 
         assert result == "second-adder"
@@ -64,7 +64,9 @@ class TestValidateConnection:
         """Test successful connection validation returns True."""
         mock_response = {"data": {"viewer": {"login": "test-user"}}}
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
+        ):
             result = github_client.validate_connection("github.com")
 
         assert result is True
@@ -74,7 +76,7 @@ class TestValidateConnection:
         mock_response = {"data": {"viewer": {"login": "test-user"}}}
 
         with patch.object(
-            github_client, "_execute_graphql_query", return_value=mock_response
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
         ) as mock_query:
             github_client.validate_connection()
 
@@ -87,7 +89,7 @@ class TestValidateConnection:
         mock_response = {"data": {"viewer": {"login": "custom-user"}}}
 
         with patch.object(
-            github_client, "_execute_graphql_query", return_value=mock_response
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
         ) as mock_query:
             result = github_client.validate_connection("custom.github.com")
 
@@ -100,7 +102,9 @@ class TestValidateConnection:
         """Test that empty viewer response raises RuntimeError."""
         mock_response = {"data": {"viewer": {}}}
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
+        ):
             with pytest.raises(RuntimeError, match="Could not retrieve authenticated user"):
                 github_client.validate_connection()
 
@@ -108,7 +112,9 @@ class TestValidateConnection:
         """Test that null viewer raises RuntimeError."""
         mock_response = {"data": {"viewer": None}}
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
+        ):
             with pytest.raises(RuntimeError, match="Could not retrieve authenticated user"):
                 github_client.validate_connection()
 
@@ -119,7 +125,9 @@ class TestValidateConnection:
         error.stderr = "authentication required"
         error.stdout = ""
 
-        with patch.object(github_client, "_execute_graphql_query", side_effect=error):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, side_effect=error
+        ):
             with pytest.raises(RuntimeError, match="authentication required"):
                 github_client.validate_connection()
 
@@ -128,6 +136,7 @@ class TestValidateConnection:
         with patch.object(
             github_client,
             "_execute_graphql_query",
+            autospec=True,
             side_effect=ValueError("GraphQL errors: Bad credentials"),
         ):
             with pytest.raises(RuntimeError, match="Bad credentials"):
@@ -138,7 +147,7 @@ class TestValidateConnection:
         mock_response = {"data": {"viewer": {"login": "test-user"}}}
 
         with patch.object(
-            github_client, "_execute_graphql_query", return_value=mock_response
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
         ) as mock_query:
             github_client.validate_connection()
 
@@ -153,7 +162,9 @@ class TestValidateConnection:
 
         mock_response = {"data": {"viewer": {"login": "test-user"}}}
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
+        ):
             with caplog.at_level(logging.DEBUG):
                 github_client.validate_connection("github.com", quiet=True)
 
@@ -170,7 +181,9 @@ class TestValidateConnection:
 
         mock_response = {"data": {"viewer": {"login": "test-user"}}}
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
+        ):
             with caplog.at_level(logging.DEBUG):
                 github_client.validate_connection("github.com")
 
@@ -1,9 +1,30 @@
 """Tests for GitHub client board/project-related functionality."""
 
-from unittest.mock import patch
-
 import pytest
 
+# Canonical GraphQL response shapes shared across tests. Read-only from the
+# code under test, so no per-test copies are needed.
+_STATUS_FIELD_RESPONSE = {
+    "data": {
+        "node": {
+            "project": {
+                "id": "PVT_123",
+                "field": {
+                    "id": "PVTSSF_456",
+                    "options": [
+                        {"id": "opt1", "name": "Backlog"},
+                        {"id": "opt2", "name": "Research"},
+                    ],
+                },
+            }
+        }
+    }
+}
+
+_UPDATE_STATUS_MUTATION_RESPONSE = {
+    "data": {"updateProjectV2ItemFieldValue": {"projectV2Item": {"id": "PVTI_789"}}}
+}
+
 
 @pytest.mark.unit
 class TestParseBoardUrl:
@@ -61,7 +82,7 @@ class TestParseBoardUrl:
 class TestGetBoardItems:
     """Tests for GitHubTicketClient.get_board_items() method."""
 
-    def test_get_board_items_returns_list(self, github_client):
+    def test_get_board_items_returns_list(self, github_client, graphql_stub):
         """Test that board items are returned as a list of TicketItem."""
         mock_response = {
             "data": {
@@ -93,15 +114,15 @@ class TestGetBoardItems:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
-            items = github_client.get_board_items("https://github.com/orgs/testorg/projects/1")
+        graphql_stub(github_client).response = mock_response
+        items = github_client.get_board_items("https://github.com/orgs/testorg/projects/1")
 
         assert len(items) == 1
         assert items[0].ticket_id == 42
         assert items[0].title == "Test Issue"
         assert items[0].status == "Research"
 
-    def test_get_board_items_handles_pagination(self, github_client):
+    def test_get_board_items_handles_pagination(self, github_client, graphql_stub):
         """Test that pagination is handled correctly."""
         page1 = {
             "data": {
@@ -158,9 +179,8 @@ class TestGetBoardItems:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query") as mock_query:
-            mock_query.side_effect = [page1, page2]
-            items = github_client.get_board_items("https://github.com/orgs/testorg/projects/1")
+        graphql_stub(github_client).responses = [page1, page2]
+        items = github_client.get_board_items("https://github.com/orgs/testorg/projects/1")
 
         assert len(items) == 2
         assert items[0].ticket_id == 1
@@ -171,7 +191,7 @@ class TestGetBoardItems:
 class TestGetBoardMetadata:
     """Tests for GitHubTicketClient.get_board_metadata() method."""
 
-    def test_get_board_metadata_returns_project_info(self, github_client):
+    def test_get_board_metadata_returns_project_info(self, github_client, graphql_stub):
         """Test fetching project metadata including status field."""
         mock_response = {
             "data": {
@@ -196,10 +216,8 @@ class TestGetBoardMetadata:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
-            metadata = github_client.get_board_metadata(
-                "https://github.com/orgs/testorg/projects/1"
-            )
+        graphql_stub(github_client).response = mock_response
+        metadata = github_client.get_board_metadata("https://github.com/orgs/testorg/projects/1")
 
         assert metadata["project_id"] == "PVT_123"
         assert metadata["status_field_id"] == "PVTSSF_456"
@@ -209,7 +227,7 @@ class TestGetBoardMetadata:
             "Plan": "opt3",
         }
 
-    def test_get_board_metadata_handles_missing_status_field(self, github_client):
+    def test_get_board_metadata_handles_missing_status_field(self, github_client, graphql_stub):
         """Test handling when Status field is not found."""
         mock_response = {
             "data": {
@@ -230,10 +248,8 @@ class TestGetBoardMetadata:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
-            metadata = github_client.get_board_metadata(
-                "https://github.com/orgs/testorg/projects/1"
-            )
+        graphql_stub(github_client).response = mock_response
+        metadata = github_client.get_board_metadata("https://github.com/orgs/testorg/projects/1")
 
         assert metadata["project_id"] == "PVT_123"
         assert metadata["status_field_id"] is None
@@ -244,35 +260,15 @@ class TestGetBoardMetadata:
 class TestUpdateItemStatus:
     """Tests for GitHubTicketClient.update_item_status() method."""
 
-    def test_update_item_status_success(self, github_client):
+    def test_update_item_status_success(self, github_client, graphql_stub):
         """Test successfully updating item status."""
-        item_query_response = {
-            "data": {
-                "node": {
-                    "project": {
-                        "id": "PVT_123",
-                        "field": {
-                            "id": "PVTSSF_456",
-                            "options": [
-                                {"id": "opt1", "name": "Backlog"},
-                                {"id": "opt2", "name": "Research"},
-                            ],
-                        },
-                    }
-                }
-            }
-        }
-        mutation_response = {
-            "data": {"updateProjectV2ItemFieldValue": {"projectV2Item": {"id": "PVTI_789"}}}
-        }
-
-        with patch.object(github_client, "_execute_graphql_query") as mock_query:
-            mock_query.side_effect = [item_query_response, mutation_response]
-            github_client.update_item_status("PVTI_789", "Research")
+        stub = graphql_stub(github_client)
+        stub.responses = [_STATUS_FIELD_RESPONSE, _UPDATE_STATUS_MUTATION_RESPONSE]
+        github_client.update_item_status("PVTI_789", "Research")
 
-        assert mock_query.call_count == 2
+        assert stub.call_count == 2
 
-    def test_update_item_status_raises_on_invalid_status(self, github_client):
+    def test_update_item_status_raises_on_invalid_status(self, github_client, graphql_stub):
         """Test that ValueError is raised for non-existent status."""
         item_query_response = {
             "data": {
@@ -290,76 +286,52 @@ class TestUpdateItemStatus:
             }
         }
 
-        with patch.object(
-            github_client, "_execute_graphql_query", return_value=item_query_response
-        ):
-            with pytest.raises(ValueError, match="Status 'NonExistent' not found"):
-                github_client.update_item_status("PVTI_789", "NonExistent")
+        graphql_stub(github_client).response = item_query_response
+        with pytest.raises(ValueError, match="Status 'NonExistent' not found"):
+            github_client.update_item_status("PVTI_789", "NonExistent")
 
-    def test_update_item_status_accepts_hostname_kwarg(self, github_client):
+    def test_update_item_status_accepts_hostname_kwarg(self, github_client, graphql_stub):
         """Test that update_item_status accepts hostname keyword argument.
 
         This ensures signature compatibility with GitHubClientBase for GHES support.
         """
-        item_query_response = {
-            "data": {
-                "node": {
-                    "project": {
-                        "id": "PVT_123",
-                        "field": {
-                            "id": "PVTSSF_456",
-                            "options": [
-                                {"id": "opt1", "name": "Backlog"},
-                                {"id": "opt2", "name": "Research"},
-                            ],
-                        },
-                    }
-                }
-            }
-        }
-        mutation_response = {
-            "data": {"updateProjectV2ItemFieldValue": {"projectV2Item": {"id": "PVTI_789"}}}
-        }
-
-        with patch.object(github_client, "_execute_graphql_query") as mock_query:
-            mock_query.side_effect = [item_query_response, mutation_response]
-            # This call pattern matches how Daemon calls the method
-            github_client.update_item_status("PVTI_789", "Research", hostname="github.com")
+        stub = graphql_stub(github_client)
+        stub.responses = [_STATUS_FIELD_RESPONSE, _UPDATE_STATUS_MUTATION_RESPONSE]
+        # This call pattern matches how Daemon calls the method
+        github_client.update_item_status("PVTI_789", "Research", hostname="github.com")
 
-        assert mock_query.call_count == 2
+        assert stub.call_count == 2
 
 
 @pytest.mark.unit
 class TestArchiveItem:
     """Tests for GitHubTicketClient.archive_item() method."""
 
-    def test_archive_item_success(self, github_client):
+    def test_archive_item_success(self, github_client, graphql_stub):
         """Test successfully archiving an item."""
         mock_response = {"data": {"archiveProjectV2Item": {"item": {"id": "PVTI_123"}}}}
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
-            result = github_client.archive_item("PVT_project", "PVTI_123")
+        graphql_stub(github_client).response = mock_response
+        result = github_client.archive_item("PVT_project", "PVTI_123")
 
         assert result is True
 
-    def test_archive_item_failure(self, github_client):
+    def test_archive_item_failure(self, github_client, graphql_stub):
         """Test archive_item returns False on error."""
-        with patch.object(
-            github_client, "_execute_graphql_query", side_effect=Exception("API error")
-        ):
-            result = github_client.archive_item("PVT_project", "PVTI_123")
+        graphql_stub(github_client).error = Exception("API error")
+        result = github_client.archive_item("PVT_project", "PVTI_123")
 
         assert result is False
 
-    def test_archive_item_accepts_hostname_kwarg(self, github_client):
+    def test_archive_item_accepts_hostname_kwarg(self, github_client, graphql_stub):
         """Test that archive_item accepts hostname keyword argument.
 
         This ensures signature compatibility with GitHubClientBase for GHES support.
         """
         mock_response = {"data": {"archiveProjectV2Item": {"item": {"id": "PVTI_123"}}}}
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
-            # This call pattern matches how Daemon calls the method
-            result = github_client.archive_item("PVT_project", "PVTI_123", hostname="github.com")
+        graphql_stub(github_client).response = mock_response
+        # This call pattern matches how Daemon calls the method
+        result = github_client.archive_item("PVT_project", "PVTI_123", hostname="github.com")
 
         assert result is True
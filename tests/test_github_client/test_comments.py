@@ -8,6 +8,9 @@ import pytest
 
 from src.interfaces import Comment
 
+# Serialized empty gh response, shared across tests
+_EMPTY_JSON_ARRAY = "[]"
+
 
 @pytest.mark.unit
 class TestGetCommentsSince:
@@ -28,7 +31,9 @@ class TestGetCommentsSince:
             ]
         )
 
-        with patch.object(github_client, "_run_gh_command", return_value=mock_response):
+        with patch.object(
+            github_client, "_run_gh_command", autospec=True, return_value=mock_response
+        ):
             comments = github_client.get_comments_since(
                 "owner/repo", 42, "2024-01-15T10:30:00+00:00"
             )
@@ -61,7 +66,9 @@ class TestGetCommentsSince:
             ]
         )
 
-        with patch.object(github_client, "_run_gh_command", return_value=mock_response) as mock_cmd:
+        with patch.object(
+            github_client, "_run_gh_command", autospec=True, return_value=mock_response
+        ) as mock_cmd:
             comments = github_client.get_comments_since("owner/repo", 42, None)
 
             # Verify no ?since= parameter in the endpoint
@@ -72,10 +79,12 @@ class TestGetCommentsSince:
 
     def test_get_comments_since_includes_since_in_url(self, github_client):
         """Test that the since parameter is correctly added to the URL."""
-        mock_response = json.dumps([])
+        mock_response = _EMPTY_JSON_ARRAY
         timestamp = "2024-01-15T10:30:00+00:00"
 
-        with patch.object(github_client, "_run_gh_command", return_value=mock_response) as mock_cmd:
+        with patch.object(
+            github_client, "_run_gh_command", autospec=True, return_value=mock_response
+        ) as mock_cmd:
             github_client.get_comments_since("owner/repo", 42, timestamp)
 
             call_args = mock_cmd.call_args[0][0]
@@ -97,7 +106,9 @@ class TestGetCommentsSince:
             ]
         )
 
-        with patch.object(github_client, "_run_gh_command", return_value=mock_response):
+        with patch.object(
+            github_client, "_run_gh_command", autospec=True, return_value=mock_response
+        ):
             comments = github_client.get_comments_since("owner/repo", 42, None)
 
         assert len(comments) == 1
@@ -132,7 +143,9 @@ class TestGetCommentsSince:
             ]
         )
 
-        with patch.object(github_client, "_run_gh_command", return_value=mock_response):
+        with patch.object(
+            github_client, "_run_gh_command", autospec=True, return_value=mock_response
+        ):
             comments = github_client.get_comments_since("owner/repo", 42, None)
 
         assert comments[0].is_processed is True
@@ -161,7 +174,9 @@ class TestGetCommentsSince:
             ]
         )
 
-        with patch.object(github_client, "_run_gh_command", return_value=mock_response):
+        with patch.object(
+            github_client, "_run_gh_command", autospec=True, return_value=mock_response
+        ):
             comments = github_client.get_comments_since("owner/repo", 42, None)
 
         assert comments[0].is_processing is True
@@ -190,7 +205,9 @@ class TestGetCommentsSince:
             ]
         )
 
-        with patch.object(github_client, "_run_gh_command", return_value=mock_response):
+        with patch.object(
+            github_client, "_run_gh_command", autospec=True, return_value=mock_response
+        ):
             comments = github_client.get_comments_since("owner/repo", 42, None)
 
         # Should only have one comment (the one with a valid user)
@@ -199,9 +216,11 @@ class TestGetCommentsSince:
 
     def test_get_comments_since_empty_response(self, github_client):
         """Test handling empty response (no new comments)."""
-        mock_response = json.dumps([])
+        mock_response = _EMPTY_JSON_ARRAY
 
-        with patch.object(github_client, "_run_gh_command", return_value=mock_response):
+        with patch.object(
+            github_client, "_run_gh_command", autospec=True, return_value=mock_response
+        ):
             comments = github_client.get_comments_since(
                 "owner/repo", 42, "2024-01-15T10:30:00+00:00"
             )
@@ -212,16 +231,20 @@ class TestGetCommentsSince:
         """Test handling invalid JSON response."""
         mock_response = "not valid json"
 
-        with patch.object(github_client, "_run_gh_command", return_value=mock_response):
+        with patch.object(
+            github_client, "_run_gh_command", autospec=True, return_value=mock_response
+        ):
             comments = github_client.get_comments_since("owner/repo", 42, None)
 
         assert comments == []
 
     def test_get_comments_since_uses_paginate(self, github_client):
         """Test that --paginate flag is used for complete results."""
-        mock_response = json.dumps([])
+        mock_response = _EMPTY_JSON_ARRAY
 
-        with patch.object(github_client, "_run_gh_command", return_value=mock_response) as mock_cmd:
+        with patch.object(
+            github_client, "_run_gh_command", autospec=True, return_value=mock_response
+        ) as mock_cmd:
             github_client.get_comments_since("owner/repo", 42, None)
 
             call_args = mock_cmd.call_args[0][0]
@@ -322,7 +345,7 @@ class TestAddComment:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query") as mock_query:
+        with patch.object(github_client, "_execute_graphql_query", autospec=True) as mock_query:
             mock_query.side_effect = [issue_response, comment_response]
             result = github_client.add_comment("owner/repo", 42, "Test comment body")
 
@@ -352,7 +375,7 @@ class TestAddComment:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query") as mock_query:
+        with patch.object(github_client, "_execute_graphql_query", autospec=True) as mock_query:
             mock_query.side_effect = [issue_response, comment_response]
             result = github_client.add_comment("owner/repo", 42, "Test")
 
@@ -382,7 +405,7 @@ class TestAddComment:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query") as mock_query:
+        with patch.object(github_client, "_execute_graphql_query", autospec=True) as mock_query:
             mock_query.side_effect = [issue_response, comment_response]
             github_client.add_comment("test-owner/test-repo", 99, "New comment")
 
@@ -409,7 +432,7 @@ class TestAddReaction:
         mock_response = {"data": {"addReaction": {"reaction": {"content": "THUMBS_UP"}}}}
 
         with patch.object(
-            github_client, "_execute_graphql_query", return_value=mock_response
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
         ) as mock_query:
             github_client.add_reaction("IC_comment123", "THUMBS_UP")
 
@@ -423,7 +446,7 @@ class TestAddReaction:
         mock_response = {"data": {"addReaction": {"reaction": {"content": "EYES"}}}}
 
         with patch.object(
-            github_client, "_execute_graphql_query", return_value=mock_response
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
         ) as mock_query:
             github_client.add_reaction("IC_comment123", "EYES")
 
@@ -440,7 +463,7 @@ class TestRemoveReaction:
         mock_response = {"data": {"removeReaction": {"reaction": {"content": "THUMBS_UP"}}}}
 
         with patch.object(
-            github_client, "_execute_graphql_query", return_value=mock_response
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
         ) as mock_query:
             github_client.remove_reaction("IC_comment123", "THUMBS_UP")
 
@@ -454,7 +477,7 @@ class TestRemoveReaction:
         mock_response = {"data": {"removeReaction": {"reaction": {"content": "EYES"}}}}
 
         with patch.object(
-            github_client, "_execute_graphql_query", return_value=mock_response
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
         ) as mock_query:
             github_client.remove_reaction("IC_comment123", "EYES")
 
@@ -466,7 +489,7 @@ class TestRemoveReaction:
         mock_response = {"data": {"removeReaction": {"reaction": {"content": "EYES"}}}}
 
         with patch.object(
-            github_client, "_execute_graphql_query", return_value=mock_response
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
         ) as mock_query:
             github_client.remove_reaction(
                 "IC_comment123", "EYES", repo="github.example.com/owner/repo"
@@ -514,7 +537,9 @@ class TestGetComments:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
+        ):
             comments = github_client.get_comments("github.com/owner/repo", 42)
 
         assert len(comments) == 2
@@ -570,7 +595,7 @@ class TestGetComments:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query") as mock_query:
+        with patch.object(github_client, "_execute_graphql_query", autospec=True) as mock_query:
             mock_query.side_effect = [page1, page2]
             comments = github_client.get_comments("github.com/owner/repo", 42)
 
@@ -610,7 +635,9 @@ class TestGetComments:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
+        ):
             comments = github_client.get_comments("github.com/owner/repo", 42)
 
         assert len(comments) == 1
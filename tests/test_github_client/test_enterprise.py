@@ -1,5 +1,6 @@
 """Unit tests for GitHub Enterprise client functionality."""
 
+import json
 from unittest.mock import patch
 
 import pytest
@@ -7,22 +8,21 @@ import pytest
 from src.ticket_clients.github_enterprise_3_14 import GitHubEnterprise314Client
 from src.ticket_clients.github_enterprise_3_18 import GitHubEnterprise318Client
 
+# Canonical empty sub-issues response shared across tests
+_EMPTY_SUB_ISSUES = {"data": {"repository": {"issue": {"subIssues": {"nodes": []}}}}}
+
 
 @pytest.mark.unit
 class TestGitHubEnterprise318Client:
     """Tests for GitHubEnterprise318Client behavior and capabilities."""
 
-    def test_supports_sub_issues_returns_true(self, enterprise_318_client):
-        """Test that supports_sub_issues property returns True for GHES 3.18."""
-        assert enterprise_318_client.supports_sub_issues is True
-
-    def test_supports_linked_prs_returns_true(self, enterprise_318_client):
-        """Test that supports_linked_prs property returns True (inherited from 3.14)."""
-        assert enterprise_318_client.supports_linked_prs is True
-
-    def test_supports_status_actor_check_returns_true(self, enterprise_318_client):
-        """Test that supports_status_actor_check property returns True (inherited from 3.14)."""
-        assert enterprise_318_client.supports_status_actor_check is True
+    @pytest.mark.parametrize(
+        "attr",
+        ["supports_sub_issues", "supports_linked_prs", "supports_status_actor_check"],
+    )
+    def test_supports_flags_return_true(self, enterprise_318_client, attr):
+        """Test that the feature-support properties all return True for GHES 3.18."""
+        assert getattr(enterprise_318_client, attr) is True
 
     def test_client_description_returns_correct_string(self, enterprise_318_client):
         """Test that client_description returns 'GitHub Enterprise Server 3.18'."""
@@ -37,7 +37,10 @@ class TestGitHubEnterprise318Client:
         mock_response = {"data": {"repository": {"issue": {"parent": {"number": 42}}}}}
 
         with patch.object(
-            enterprise_318_client, "_execute_graphql_query_with_headers", return_value=mock_response
+            enterprise_318_client,
+            "_execute_graphql_query_with_headers",
+            autospec=True,
+            return_value=mock_response,
         ):
             result = enterprise_318_client.get_parent_issue("github.mycompany.com/owner/repo", 123)
 
@@ -48,7 +51,10 @@ class TestGitHubEnterprise318Client:
         mock_response = {"data": {"repository": {"issue": {"parent": None}}}}
 
         with patch.object(
-            enterprise_318_client, "_execute_graphql_query_with_headers", return_value=mock_response
+            enterprise_318_client,
+            "_execute_graphql_query_with_headers",
+            autospec=True,
+            return_value=mock_response,
         ):
             result = enterprise_318_client.get_parent_issue("github.mycompany.com/owner/repo", 123)
 
@@ -59,7 +65,10 @@ class TestGitHubEnterprise318Client:
         mock_response = {"data": {"repository": {"issue": None}}}
 
         with patch.object(
-            enterprise_318_client, "_execute_graphql_query_with_headers", return_value=mock_response
+            enterprise_318_client,
+            "_execute_graphql_query_with_headers",
+            autospec=True,
+            return_value=mock_response,
         ):
             result = enterprise_318_client.get_parent_issue(
                 "github.mycompany.com/owner/repo", 99999
@@ -72,7 +81,10 @@ class TestGitHubEnterprise318Client:
         mock_response = {"data": {"repository": {"issue": {"parent": None}}}}
 
         with patch.object(
-            enterprise_318_client, "_execute_graphql_query_with_headers", return_value=mock_response
+            enterprise_318_client,
+            "_execute_graphql_query_with_headers",
+            autospec=True,
+            return_value=mock_response,
         ) as mock_query:
             enterprise_318_client.get_parent_issue("github.mycompany.com/owner/repo", 123)
 
@@ -89,12 +101,50 @@ class TestGitHubEnterprise318Client:
         with patch.object(
             enterprise_318_client,
             "_execute_graphql_query_with_headers",
+            autospec=True,
             side_effect=Exception("API error"),
         ):
             result = enterprise_318_client.get_parent_issue("github.mycompany.com/owner/repo", 123)
 
         assert result is None
 
+    def test_get_parent_issue_command_assembly(self, enterprise_318_client, gh_transport):
+        """Exercise the full gh command assembly down to the subprocess boundary."""
+        gh_transport.respond(
+            json.dumps({"data": {"repository": {"issue": {"parent": {"number": 7}}}}})
+        )
+
+        result = enterprise_318_client.get_parent_issue("github.mycompany.com/owner/repo", 123)
+
+        assert result == 7
+        call = gh_transport.calls[0]
+        # --hostname is injected for GHES api commands; the sub_issues header
+        # and stdin payload travel through the real argument assembly
+        assert call.cmd[:4] == ["gh", "api", "--hostname", "github.mycompany.com"]
+        assert "graphql" in call.cmd
+        header_idx = call.cmd.index("-H") + 1
+        assert call.cmd[header_idx] == "GraphQL-Features: sub_issues"
+        payload = json.loads(call.kwargs["input"])
+        assert payload["variables"]["issueNumber"] == 123
+
+    def test_set_labels_batches_single_gh_invocation(self, enterprise_318_client, monkeypatch):
+        """Test that the base-family set_labels also batches into one command."""
+        calls = []
+
+        def fake_run(args, **kwargs):
+            calls.append(args)
+            return ""
+
+        monkeypatch.setattr(enterprise_318_client, "_run_gh_command", fake_run)
+
+        enterprise_318_client.set_labels(
+            "github.mycompany.com/org/repo", 7, add=["a", "b"], remove=["c"]
+        )
+
+        assert len(calls) == 1
+        assert calls[0].count("--add-label") == 2
+        assert calls[0].count("--remove-label") == 1
+
     def test_get_child_issues_with_children(self, enterprise_318_client):
         """Test get_child_issues returns list of child issues."""
         mock_response = {
@@ -114,7 +164,10 @@ class TestGitHubEnterprise318Client:
         }
 
         with patch.object(
-            enterprise_318_client, "_execute_graphql_query_with_headers", return_value=mock_response
+            enterprise_318_client,
+            "_execute_graphql_query_with_headers",
+            autospec=True,
+            return_value=mock_response,
         ):
             result = enterprise_318_client.get_child_issues("github.mycompany.com/owner/repo", 42)
 
@@ -125,10 +178,13 @@ class TestGitHubEnterprise318Client:
 
     def test_get_child_issues_without_children(self, enterprise_318_client):
         """Test get_child_issues returns empty list when no children."""
-        mock_response = {"data": {"repository": {"issue": {"subIssues": {"nodes": []}}}}}
+        mock_response = _EMPTY_SUB_ISSUES
 
         with patch.object(
-            enterprise_318_client, "_execute_graphql_query_with_headers", return_value=mock_response
+            enterprise_318_client,
+            "_execute_graphql_query_with_headers",
+            autospec=True,
+            return_value=mock_response,
         ):
             result = enterprise_318_client.get_child_issues("github.mycompany.com/owner/repo", 42)
 
@@ -139,7 +195,10 @@ class TestGitHubEnterprise318Client:
         mock_response = {"data": {"repository": {"issue": None}}}
 
         with patch.object(
-            enterprise_318_client, "_execute_graphql_query_with_headers", return_value=mock_response
+            enterprise_318_client,
+            "_execute_graphql_query_with_headers",
+            autospec=True,
+            return_value=mock_response,
         ):
             result = enterprise_318_client.get_child_issues(
                 "github.mycompany.com/owner/repo", 99999
@@ -149,10 +208,13 @@ class TestGitHubEnterprise318Client:
 
     def test_get_child_issues_uses_sub_issues_header(self, enterprise_318_client):
         """Test get_child_issues uses the GraphQL-Features: sub_issues header."""
-        mock_response = {"data": {"repository": {"issue": {"subIssues": {"nodes": []}}}}}
+        mock_response = _EMPTY_SUB_ISSUES
 
         with patch.object(
-            enterprise_318_client, "_execute_graphql_query_with_headers", return_value=mock_response
+            enterprise_318_client,
+            "_execute_graphql_query_with_headers",
+            autospec=True,
+            return_value=mock_response,
         ) as mock_query:
             enterprise_318_client.get_child_issues("github.mycompany.com/owner/repo", 42)
 
@@ -169,6 +231,7 @@ class TestGitHubEnterprise318Client:
         with patch.object(
             enterprise_318_client,
             "_execute_graphql_query_with_headers",
+            autospec=True,
             side_effect=Exception("API error"),
         ):
             result = enterprise_318_client.get_child_issues("github.mycompany.com/owner/repo", 42)
@@ -194,7 +257,10 @@ class TestGitHubEnterprise318Client:
         }
 
         with patch.object(
-            enterprise_318_client, "_execute_graphql_query_with_headers", return_value=mock_response
+            enterprise_318_client,
+            "_execute_graphql_query_with_headers",
+            autospec=True,
+            return_value=mock_response,
         ):
             result = enterprise_318_client.get_child_issues("github.mycompany.com/owner/repo", 42)
 
@@ -1,149 +1,156 @@
 """Tests for GitHub client issue-related functionality."""
 
-from unittest.mock import patch
-
 import pytest
 
-
-@pytest.mark.unit
-class TestGetIssueBody:
-    """Tests for GitHubTicketClient.get_ticket_body()."""
-
-    def test_get_ticket_body_returns_body_text(self, github_client):
-        """Test fetching issue body returns the body text."""
-        mock_response = {
-            "data": {
-                "repository": {
-                    "issue": {"body": "This is the issue description.\n\nWith multiple lines."}
+pytestmark = pytest.mark.unit
+
+# Repo identifier shared by most tests in this module
+REPO_SHORT = "owner/repo"
+
+# Required fragments of the GraphQL queries under test, checked in one pass so
+# a failure lists every missing fragment at once.
+_ISSUE_BODY_QUERY_FRAGMENTS = (
+    "repository(owner: $owner, name: $repo)",
+    "issue(number: $issueNumber)",
+    "body",
+)
+
+_STATUS_ACTOR_QUERY_FRAGMENTS = (
+    "repository(owner: $owner, name: $repo)",
+    "issue(number: $issueNumber)",
+    "timelineItems",
+    "ADDED_TO_PROJECT_V2_EVENT",
+    "PROJECT_V2_ITEM_STATUS_CHANGED_EVENT",
+    "actor",
+    "login",
+)
+
+# Canonical timeline/label-event responses shared across tests; read-only
+# from the code under test.
+_STATUS_TIMELINE_RESPONSE = {
+    "data": {
+        "repository": {
+            "issue": {
+                "timelineItems": {
+                    "nodes": [
+                        {
+                            "__typename": "AddedToProjectV2Event",
+                            "actor": {"login": "user1"},
+                            "createdAt": "2024-01-10T10:00:00Z",
+                        },
+                        {
+                            "__typename": "ProjectV2ItemStatusChangedEvent",
+                            "actor": {"login": "user2"},
+                            "createdAt": "2024-01-15T10:00:00Z",
+                        },
+                    ]
+                }
+            }
+        }
+    }
+}
+
+_LABEL_EVENTS_RESPONSE = {
+    "data": {
+        "repository": {
+            "issue": {
+                "timelineItems": {
+                    "nodes": [
+                        {
+                            "actor": {"login": "user1"},
+                            "label": {"name": "bug"},
+                            "createdAt": "2024-01-15T09:00:00Z",
+                        },
+                        {
+                            "actor": {"login": "user2"},
+                            "label": {"name": "yolo"},
+                            "createdAt": "2024-01-15T10:00:00Z",
+                        },
+                    ]
                 }
             }
         }
+    }
+}
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
-            body = github_client.get_ticket_body("owner/repo", 42)
+_EMPTY_TIMELINE_RESPONSE = {"data": {"repository": {"issue": {"timelineItems": {"nodes": []}}}}}
 
-        assert body == "This is the issue description.\n\nWith multiple lines."
 
-    def test_get_ticket_body_returns_none_for_nonexistent_issue(self, github_client):
+class TestGetIssueBody:
+    """Tests for GitHubTicketClient.get_ticket_body()."""
+
+    @pytest.mark.parametrize(
+        "body,expected",
+        [
+            (
+                "This is the issue description.\n\nWith multiple lines.",
+                "This is the issue description.\n\nWith multiple lines.",
+            ),
+            (None, None),
+            ("", ""),
+        ],
+        ids=["text", "none", "empty-string"],
+    )
+    def test_get_ticket_body_returns_body_value(self, github_client, graphql_stub, body, expected):
+        """Test that the issue body value (text, missing, or empty) is passed through."""
+        graphql_stub(github_client).response = {"data": {"repository": {"issue": {"body": body}}}}
+
+        assert github_client.get_ticket_body(REPO_SHORT, 42) == expected
+
+    def test_get_ticket_body_returns_none_for_nonexistent_issue(self, github_client, graphql_stub):
         """Test that None is returned when issue doesn't exist."""
         mock_response = {"data": {"repository": {"issue": None}}}
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
-            body = github_client.get_ticket_body("owner/repo", 99999)
-
-        assert body is None
-
-    def test_get_ticket_body_returns_none_on_empty_body(self, github_client):
-        """Test handling of issue with no body."""
-        mock_response = {"data": {"repository": {"issue": {"body": None}}}}
-
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
-            body = github_client.get_ticket_body("owner/repo", 42)
+        graphql_stub(github_client).response = mock_response
+        body = github_client.get_ticket_body(REPO_SHORT, 99999)
 
         assert body is None
 
-    def test_get_ticket_body_returns_empty_string(self, github_client):
-        """Test handling of issue with empty string body."""
-        mock_response = {"data": {"repository": {"issue": {"body": ""}}}}
-
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
-            body = github_client.get_ticket_body("owner/repo", 42)
-
-        assert body == ""
-
-    def test_get_ticket_body_handles_api_error(self, github_client):
-        """Test that API errors return None."""
-        with patch.object(
-            github_client, "_execute_graphql_query", side_effect=Exception("API error")
-        ):
-            body = github_client.get_ticket_body("owner/repo", 42)
-
-        assert body is None
-
-    def test_get_ticket_body_makes_correct_api_call(self, github_client):
+    def test_get_ticket_body_makes_correct_api_call(self, github_client, graphql_stub):
         """Test that the correct GraphQL query is made."""
-        mock_response = {"data": {"repository": {"issue": {"body": "Test body"}}}}
+        stub = graphql_stub(github_client)
+        stub.response = {"data": {"repository": {"issue": {"body": "Test body"}}}}
 
-        with patch.object(
-            github_client, "_execute_graphql_query", return_value=mock_response
-        ) as mock_query:
-            github_client.get_ticket_body("test-owner/test-repo", 123)
+        github_client.get_ticket_body("test-owner/test-repo", 123)
 
-            call_args = mock_query.call_args
-            query = call_args[0][0]
-            variables = call_args[0][1]
+        call = stub.calls[0]
+        missing = [frag for frag in _ISSUE_BODY_QUERY_FRAGMENTS if frag not in call.query]
+        assert not missing, f"query is missing fragments: {missing}"
+        assert call.variables["owner"] == "test-owner"
+        assert call.variables["repo"] == "test-repo"
+        assert call.variables["issueNumber"] == 123
 
-            assert "repository(owner: $owner, name: $repo)" in query
-            assert "issue(number: $issueNumber)" in query
-            assert "body" in query
-            assert variables["owner"] == "test-owner"
-            assert variables["repo"] == "test-repo"
-            assert variables["issueNumber"] == 123
 
-
-@pytest.mark.unit
 class TestGetLastProjectStatusActor:
     """Tests for GitHubTicketClient.get_last_status_actor()."""
 
-    def test_get_last_status_actor_returns_actor(self, github_client):
+    def test_get_last_status_actor_returns_actor(self, github_client, graphql_stub):
         """Test that the actor from the most recent timeline event is returned."""
-        mock_response = {
-            "data": {
-                "repository": {
-                    "issue": {
-                        "timelineItems": {
-                            "nodes": [
-                                {
-                                    "__typename": "AddedToProjectV2Event",
-                                    "actor": {"login": "user1"},
-                                    "createdAt": "2024-01-10T10:00:00Z",
-                                },
-                                {
-                                    "__typename": "ProjectV2ItemStatusChangedEvent",
-                                    "actor": {"login": "user2"},
-                                    "createdAt": "2024-01-15T10:00:00Z",
-                                },
-                            ]
-                        }
-                    }
-                }
-            }
-        }
-
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
-            actor = github_client.get_last_status_actor("owner/repo", 42)
+        graphql_stub(github_client).response = _STATUS_TIMELINE_RESPONSE
+        actor = github_client.get_last_status_actor(REPO_SHORT, 42)
 
         # Should return the last actor (most recent is last in list since we used 'last: 10')
         assert actor == "user2"
 
-    def test_get_last_status_actor_returns_none_when_no_events(self, github_client):
+    def test_get_last_status_actor_returns_none_when_no_events(self, github_client, graphql_stub):
         """Test that None is returned when there are no timeline events."""
-        mock_response = {"data": {"repository": {"issue": {"timelineItems": {"nodes": []}}}}}
-
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
-            actor = github_client.get_last_status_actor("owner/repo", 42)
-
-        assert actor is None
-
-    def test_get_last_status_actor_returns_none_on_api_error(self, github_client):
-        """Test that None is returned and error is logged on API failure."""
-        with patch.object(
-            github_client, "_execute_graphql_query", side_effect=Exception("API error")
-        ):
-            actor = github_client.get_last_status_actor("owner/repo", 42)
+        graphql_stub(github_client).response = _EMPTY_TIMELINE_RESPONSE
+        actor = github_client.get_last_status_actor(REPO_SHORT, 42)
 
         assert actor is None
 
-    def test_get_last_status_actor_returns_none_for_nonexistent_issue(self, github_client):
+    def test_get_last_status_actor_returns_none_for_nonexistent_issue(
+        self, github_client, graphql_stub
+    ):
         """Test that None is returned when issue doesn't exist."""
         mock_response = {"data": {"repository": {"issue": None}}}
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
-            actor = github_client.get_last_status_actor("owner/repo", 99999)
+        graphql_stub(github_client).response = mock_response
+        actor = github_client.get_last_status_actor(REPO_SHORT, 99999)
 
         assert actor is None
 
-    def test_get_last_status_actor_skips_events_without_actor(self, github_client):
+    def test_get_last_status_actor_skips_events_without_actor(self, github_client, graphql_stub):
         """Test that events without actor field are skipped."""
         mock_response = {
             "data": {
@@ -168,13 +175,13 @@ class TestGetLastProjectStatusActor:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
-            actor = github_client.get_last_status_actor("owner/repo", 42)
+        graphql_stub(github_client).response = mock_response
+        actor = github_client.get_last_status_actor(REPO_SHORT, 42)
 
         # Should return the previous valid actor since the most recent has None
         assert actor == "valid_user"
 
-    def test_get_last_status_actor_makes_correct_api_call(self, github_client):
+    def test_get_last_status_actor_makes_correct_api_call(self, github_client, graphql_stub):
         """Test that the correct GraphQL query is made."""
         mock_response = {
             "data": {
@@ -194,65 +201,33 @@ class TestGetLastProjectStatusActor:
             }
         }
 
-        with patch.object(
-            github_client, "_execute_graphql_query", return_value=mock_response
-        ) as mock_query:
-            github_client.get_last_status_actor("test-owner/test-repo", 123)
+        stub = graphql_stub(github_client)
+        stub.response = mock_response
 
-            call_args = mock_query.call_args
-            query = call_args[0][0]
-            variables = call_args[0][1]
+        github_client.get_last_status_actor("test-owner/test-repo", 123)
 
-            # Verify query structure
-            assert "repository(owner: $owner, name: $repo)" in query
-            assert "issue(number: $issueNumber)" in query
-            assert "timelineItems" in query
-            assert "ADDED_TO_PROJECT_V2_EVENT" in query
-            assert "PROJECT_V2_ITEM_STATUS_CHANGED_EVENT" in query
-            assert "actor" in query
-            assert "login" in query
+        call = stub.calls[0]
+        # Verify query structure
+        missing = [frag for frag in _STATUS_ACTOR_QUERY_FRAGMENTS if frag not in call.query]
+        assert not missing, f"query is missing fragments: {missing}"
 
-            # Verify variables
-            assert variables["owner"] == "test-owner"
-            assert variables["repo"] == "test-repo"
-            assert variables["issueNumber"] == 123
+        # Verify variables
+        assert call.variables["owner"] == "test-owner"
+        assert call.variables["repo"] == "test-repo"
+        assert call.variables["issueNumber"] == 123
 
 
-@pytest.mark.unit
 class TestGetLabelActor:
     """Tests for GitHubTicketClient.get_label_actor() method."""
 
-    def test_get_label_actor_returns_actor(self, github_client):
+    def test_get_label_actor_returns_actor(self, github_client, graphql_stub):
         """Test that the actor who added a specific label is returned."""
-        mock_response = {
-            "data": {
-                "repository": {
-                    "issue": {
-                        "timelineItems": {
-                            "nodes": [
-                                {
-                                    "actor": {"login": "user1"},
-                                    "label": {"name": "bug"},
-                                    "createdAt": "2024-01-15T09:00:00Z",
-                                },
-                                {
-                                    "actor": {"login": "user2"},
-                                    "label": {"name": "yolo"},
-                                    "createdAt": "2024-01-15T10:00:00Z",
-                                },
-                            ]
-                        }
-                    }
-                }
-            }
-        }
-
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
-            actor = github_client.get_label_actor("owner/repo", 42, "yolo")
+        graphql_stub(github_client).response = _LABEL_EVENTS_RESPONSE
+        actor = github_client.get_label_actor(REPO_SHORT, 42, "yolo")
 
         assert actor == "user2"
 
-    def test_get_label_actor_returns_none_when_label_not_found(self, github_client):
+    def test_get_label_actor_returns_none_when_label_not_found(self, github_client, graphql_stub):
         """Test that None is returned when the label was never added."""
         mock_response = {
             "data": {
@@ -272,30 +247,19 @@ class TestGetLabelActor:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
-            actor = github_client.get_label_actor("owner/repo", 42, "yolo")
+        graphql_stub(github_client).response = mock_response
+        actor = github_client.get_label_actor(REPO_SHORT, 42, "yolo")
 
         assert actor is None
 
-    def test_get_label_actor_returns_none_when_no_events(self, github_client):
+    def test_get_label_actor_returns_none_when_no_events(self, github_client, graphql_stub):
         """Test that None is returned when there are no label events."""
-        mock_response = {"data": {"repository": {"issue": {"timelineItems": {"nodes": []}}}}}
-
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
-            actor = github_client.get_label_actor("owner/repo", 42, "yolo")
-
-        assert actor is None
-
-    def test_get_label_actor_returns_none_on_api_error(self, github_client):
-        """Test that None is returned on API error."""
-        with patch.object(
-            github_client, "_execute_graphql_query", side_effect=Exception("API error")
-        ):
-            actor = github_client.get_label_actor("owner/repo", 42, "yolo")
+        graphql_stub(github_client).response = _EMPTY_TIMELINE_RESPONSE
+        actor = github_client.get_label_actor(REPO_SHORT, 42, "yolo")
 
         assert actor is None
 
-    def test_get_label_actor_returns_most_recent(self, github_client):
+    def test_get_label_actor_returns_most_recent(self, github_client, graphql_stub):
         """Test that the most recent addition of the label is returned."""
         mock_response = {
             "data": {
@@ -320,8 +284,23 @@ class TestGetLabelActor:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
-            actor = github_client.get_label_actor("owner/repo", 42, "yolo")
+        graphql_stub(github_client).response = mock_response
+        actor = github_client.get_label_actor(REPO_SHORT, 42, "yolo")
 
         # Should return the most recent (last in list)
         assert actor == "user2"
+
+
+@pytest.mark.parametrize(
+    "method,args",
+    [
+        ("get_ticket_body", (REPO_SHORT, 42)),
+        ("get_last_status_actor", (REPO_SHORT, 42)),
+        ("get_label_actor", (REPO_SHORT, 42, "yolo")),
+    ],
+)
+def test_issue_lookups_return_none_on_api_error(github_client, graphql_stub, method, args):
+    """Test that issue lookup helpers return None on API errors."""
+    graphql_stub(github_client).error = Exception("API error")
+
+    assert getattr(github_client, method)(*args) is None
@@ -2,62 +2,129 @@
 
 import json
 import subprocess
-from unittest.mock import patch
+from unittest.mock import Mock
 
 import pytest
 
+pytestmark = pytest.mark.unit
+
+# Serialized gh responses, shared across tests
+_EMPTY_JSON_ARRAY = "[]"
+_THREE_LABELS_JSON = json.dumps(
+    [
+        {"name": "bug"},
+        {"name": "enhancement"},
+        {"name": "researching"},
+    ]
+)
+
 
-@pytest.mark.unit
 class TestGetRepoLabels:
     """Tests for GitHubTicketClient.get_repo_labels()."""
 
-    def test_get_repo_labels_returns_list(self, github_client):
+    def test_get_repo_labels_returns_list(self, github_client, gh_command_recorder):
         """Test fetching repository labels."""
-        mock_response = json.dumps(
-            [
-                {"name": "bug"},
-                {"name": "enhancement"},
-                {"name": "researching"},
-            ]
-        )
+        gh_command_recorder.stdout = _THREE_LABELS_JSON
 
-        with patch.object(github_client, "_run_gh_command", return_value=mock_response):
-            labels = github_client.get_repo_labels("owner/repo")
+        labels = github_client.get_repo_labels("owner/repo")
 
         assert labels == ["bug", "enhancement", "researching"]
 
-    def test_get_repo_labels_empty_repo(self, github_client):
+    def test_get_repo_labels_empty_repo(self, github_client, gh_command_recorder):
         """Test fetching labels from repo with no labels."""
-        mock_response = json.dumps([])
+        gh_command_recorder.stdout = _EMPTY_JSON_ARRAY
 
-        with patch.object(github_client, "_run_gh_command", return_value=mock_response):
-            labels = github_client.get_repo_labels("owner/repo")
+        labels = github_client.get_repo_labels("owner/repo")
 
         assert labels == []
 
-    def test_get_repo_labels_handles_error(self, github_client):
+    def test_get_repo_labels_handles_error(self, github_client, gh_command_recorder):
         """Test error handling when fetching labels fails."""
-        with patch.object(
-            github_client, "_run_gh_command", side_effect=subprocess.CalledProcessError(1, "gh")
-        ):
-            labels = github_client.get_repo_labels("owner/repo")
+        gh_command_recorder.error = subprocess.CalledProcessError(1, "gh")
+
+        labels = github_client.get_repo_labels("owner/repo")
 
         assert labels == []
 
 
-@pytest.mark.unit
+class TestRepoLabelCache:
+    """Tests for the TTL label cache behind get_repo_labels."""
+
+    def test_second_lookup_within_ttl_skips_subprocess(self, github_client, gh_command_recorder):
+        """Test that a repeat lookup inside the TTL serves from the cache."""
+        gh_command_recorder.stdout = _THREE_LABELS_JSON
+
+        first = github_client.get_repo_labels("owner/repo")
+        second = github_client.get_repo_labels("owner/repo")
+
+        assert first == second == ["bug", "enhancement", "researching"]
+        assert len(gh_command_recorder.calls) == 1
+
+    def test_expired_entry_is_refetched(self, github_client, gh_command_recorder, monkeypatch):
+        """Test that an entry older than the TTL triggers a fresh fetch."""
+        gh_command_recorder.stdout = _THREE_LABELS_JSON
+        github_client.get_repo_labels("owner/repo")
+
+        fetched_at, labels = github_client._label_cache["owner/repo"]
+        monkeypatch.setitem(
+            github_client._label_cache,
+            "owner/repo",
+            (fetched_at - github_client._LABEL_CACHE_TTL - 1, labels),
+        )
+
+        github_client.get_repo_labels("owner/repo")
+
+        assert len(gh_command_recorder.calls) == 2
+
+    def test_failed_fetches_are_not_cached(self, github_client, gh_command_recorder):
+        """Test that a failed lookup is retried on the next call."""
+        gh_command_recorder.error = subprocess.CalledProcessError(1, "gh")
+
+        assert github_client.get_repo_labels("owner/repo") == []
+        assert github_client.get_repo_labels("owner/repo") == []
+
+        assert len(gh_command_recorder.calls) == 2
+
+    def test_create_repo_label_updates_cached_list(self, github_client, gh_command_recorder):
+        """Test that creating a label keeps the cache coherent without a refetch."""
+        gh_command_recorder.stdout = _THREE_LABELS_JSON
+        github_client.get_repo_labels("owner/repo")
+
+        gh_command_recorder.stdout = ""
+        github_client.create_repo_label("owner/repo", "planning")
+
+        labels = github_client.get_repo_labels("owner/repo")
+
+        assert "planning" in labels
+        # One label list plus one label create - no second list fetch
+        assert [c[:2] for c in gh_command_recorder.calls] == [
+            ["label", "list"],
+            ["label", "create"],
+        ]
+
+    def test_returned_list_is_a_copy(self, github_client, gh_command_recorder):
+        """Test that mutating a returned list does not corrupt the cache."""
+        gh_command_recorder.stdout = _THREE_LABELS_JSON
+
+        first = github_client.get_repo_labels("owner/repo")
+        first.append("tampered")
+
+        assert "tampered" not in github_client.get_repo_labels("owner/repo")
+
+
 class TestCreateRepoLabel:
     """Tests for GitHubTicketClient.create_repo_label()."""
 
-    def test_create_repo_label_success(self, github_client):
+    def test_create_repo_label_success(self, github_client, gh_command_recorder):
         """Test creating a label successfully."""
-        with patch.object(github_client, "_run_gh_command", return_value="") as mock_cmd:
-            result = github_client.create_repo_label(
-                "github.com/owner/repo", "researching", "Research in progress", "1D76DB"
-            )
+        gh_command_recorder.stdout = ""
+
+        result = github_client.create_repo_label(
+            "github.com/owner/repo", "researching", "Research in progress", "1D76DB"
+        )
 
         assert result is True
-        call_args = mock_cmd.call_args[0][0]
+        call_args = gh_command_recorder.calls[0]
         assert "label" in call_args
         assert "create" in call_args
         assert "researching" in call_args
@@ -68,72 +135,81 @@ class TestCreateRepoLabel:
         assert "--color" in call_args
         assert "1D76DB" in call_args
 
-    def test_create_repo_label_no_description(self, github_client):
+    def test_create_repo_label_no_description(self, github_client, gh_command_recorder):
         """Test creating a label without description."""
-        with patch.object(github_client, "_run_gh_command", return_value="") as mock_cmd:
-            result = github_client.create_repo_label("owner/repo", "test-label")
+        gh_command_recorder.stdout = ""
+
+        result = github_client.create_repo_label("owner/repo", "test-label")
 
         assert result is True
-        call_args = mock_cmd.call_args[0][0]
+        call_args = gh_command_recorder.calls[0]
         assert "--description" not in call_args
         assert "--color" not in call_args
 
-    def test_create_repo_label_uses_force_flag(self, github_client):
+    def test_create_repo_label_uses_force_flag(self, github_client, gh_command_recorder):
         """Test that create uses --force to handle existing labels."""
-        with patch.object(github_client, "_run_gh_command", return_value="") as mock_cmd:
-            github_client.create_repo_label("owner/repo", "test-label")
+        gh_command_recorder.stdout = ""
+
+        github_client.create_repo_label("owner/repo", "test-label")
 
-        call_args = mock_cmd.call_args[0][0]
-        assert "--force" in call_args
+        assert "--force" in gh_command_recorder.calls[0]
 
-    def test_create_repo_label_handles_error(self, github_client):
+    def test_create_repo_label_handles_error(self, github_client, gh_command_recorder):
         """Test error handling when label creation fails."""
-        with patch.object(
-            github_client, "_run_gh_command", side_effect=subprocess.CalledProcessError(1, "gh")
-        ):
-            result = github_client.create_repo_label("owner/repo", "test-label")
+        gh_command_recorder.error = subprocess.CalledProcessError(1, "gh")
+
+        result = github_client.create_repo_label("owner/repo", "test-label")
 
         assert result is False
 
 
-@pytest.mark.unit
+def _fail_once_then_succeed(error):
+    """Build a _run_gh_command stand-in that raises on the first call only."""
+    calls = {"count": 0}
+
+    def mock_run_gh(args, **kwargs):
+        calls["count"] += 1
+        if calls["count"] == 1:
+            raise error
+        return ""
+
+    return mock_run_gh, calls
+
+
+def _label_not_found_error(message):
+    error = subprocess.CalledProcessError(1, "gh")
+    error.stderr = message
+    error.stdout = ""
+    return error
+
+
 class TestAddLabel:
     """Tests for GitHubTicketClient.add_label()."""
 
-    def test_add_label_success(self, github_client):
+    def test_add_label_success(self, github_client, gh_command_recorder):
         """Test adding a label successfully."""
-        with patch.object(github_client, "_run_gh_command", return_value="") as mock_cmd:
-            github_client.add_label("github.com/owner/repo", 123, "researching")
+        gh_command_recorder.stdout = ""
+
+        github_client.add_label("github.com/owner/repo", 123, "researching")
 
-        call_args = mock_cmd.call_args[0][0]
+        call_args = gh_command_recorder.calls[0]
         assert "issue" in call_args
         assert "edit" in call_args
         assert "123" in call_args
         assert "--add-label" in call_args
         assert "researching" in call_args
 
-    def test_add_label_creates_missing_label_with_metadata(self, github_client):
+    def test_add_label_creates_missing_label_with_metadata(self, github_client, monkeypatch):
         """Test that add_label creates missing label with REQUIRED_LABELS metadata."""
         # First call fails with "label not found", second call succeeds
-        error = subprocess.CalledProcessError(1, "gh")
-        error.stderr = "label 'researching' not found"
-        error.stdout = ""
-
-        call_count = 0
-
-        def mock_run_gh(args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                # First add_label attempt fails
-                raise error
-            return ""
-
-        with (
-            patch.object(github_client, "_run_gh_command", side_effect=mock_run_gh),
-            patch.object(github_client, "create_repo_label", return_value=True) as mock_create,
-        ):
-            github_client.add_label("github.com/owner/repo", 123, "researching")
+        mock_run_gh, calls = _fail_once_then_succeed(
+            _label_not_found_error("label 'researching' not found")
+        )
+        mock_create = Mock(return_value=True)
+        monkeypatch.setattr(github_client, "_run_gh_command", mock_run_gh)
+        monkeypatch.setattr(github_client, "create_repo_label", mock_create)
+
+        github_client.add_label("github.com/owner/repo", 123, "researching")
 
         # Verify create_repo_label was called with metadata from REQUIRED_LABELS
         mock_create.assert_called_once_with(
@@ -143,30 +219,19 @@ class TestAddLabel:
             color="FFA500",
         )
         # Verify add_label was retried
-        assert call_count == 2
+        assert calls["count"] == 2
 
-    def test_add_label_creates_unknown_label_without_metadata(self, github_client):
+    def test_add_label_creates_unknown_label_without_metadata(self, github_client, monkeypatch):
         """Test that add_label creates unknown labels with empty metadata."""
         # First call fails with "label not found", second call succeeds
-        error = subprocess.CalledProcessError(1, "gh")
-        error.stderr = "label 'custom-label' not found"
-        error.stdout = ""
-
-        call_count = 0
-
-        def mock_run_gh(args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                # First add_label attempt fails
-                raise error
-            return ""
-
-        with (
-            patch.object(github_client, "_run_gh_command", side_effect=mock_run_gh),
-            patch.object(github_client, "create_repo_label", return_value=True) as mock_create,
-        ):
-            github_client.add_label("github.com/owner/repo", 123, "custom-label")
+        mock_run_gh, calls = _fail_once_then_succeed(
+            _label_not_found_error("label 'custom-label' not found")
+        )
+        mock_create = Mock(return_value=True)
+        monkeypatch.setattr(github_client, "_run_gh_command", mock_run_gh)
+        monkeypatch.setattr(github_client, "create_repo_label", mock_create)
+
+        github_client.add_label("github.com/owner/repo", 123, "custom-label")
 
         # Verify create_repo_label was called with empty metadata (not in REQUIRED_LABELS)
         mock_create.assert_called_once_with(
@@ -176,89 +241,188 @@ class TestAddLabel:
             color="",
         )
         # Verify add_label was retried
-        assert call_count == 2
+        assert calls["count"] == 2
 
-    def test_add_label_raises_when_label_creation_fails(self, github_client):
+    def test_add_label_raises_when_label_creation_fails(self, github_client, monkeypatch):
         """Test that add_label raises when label creation fails."""
-        error = subprocess.CalledProcessError(1, "gh")
-        error.stderr = "label 'researching' not found"
-        error.stdout = ""
-
-        with (
-            patch.object(github_client, "_run_gh_command", side_effect=error),
-            patch.object(github_client, "create_repo_label", return_value=False),
-        ):
-            with pytest.raises(RuntimeError, match="Failed to create label"):
-                github_client.add_label("github.com/owner/repo", 123, "researching")
-
-    def test_add_label_raises_on_other_errors(self, github_client):
+        error = _label_not_found_error("label 'researching' not found")
+
+        def raise_error(args, **kwargs):
+            raise error
+
+        monkeypatch.setattr(github_client, "_run_gh_command", raise_error)
+        monkeypatch.setattr(github_client, "create_repo_label", Mock(return_value=False))
+
+        with pytest.raises(RuntimeError, match="Failed to create label"):
+            github_client.add_label("github.com/owner/repo", 123, "researching")
+
+    def test_add_label_raises_on_other_errors(self, github_client, gh_command_recorder):
         """Test that add_label re-raises non-label errors."""
-        error = subprocess.CalledProcessError(1, "gh")
-        error.stderr = "permission denied"
-        error.stdout = ""
+        gh_command_recorder.error = _label_not_found_error("permission denied")
 
-        with patch.object(github_client, "_run_gh_command", side_effect=error):
-            with pytest.raises(subprocess.CalledProcessError):
-                github_client.add_label("github.com/owner/repo", 123, "researching")
+        with pytest.raises(subprocess.CalledProcessError):
+            github_client.add_label("github.com/owner/repo", 123, "researching")
 
-    def test_add_label_handles_does_not_exist_error(self, github_client):
+    def test_add_label_handles_does_not_exist_error(self, github_client, monkeypatch):
         """Test that add_label handles 'does not exist' error variant."""
-        error = subprocess.CalledProcessError(1, "gh")
-        error.stderr = "label does not exist"
-        error.stdout = ""
+        mock_run_gh, calls = _fail_once_then_succeed(_label_not_found_error("label does not exist"))
+        mock_create = Mock(return_value=True)
+        monkeypatch.setattr(github_client, "_run_gh_command", mock_run_gh)
+        monkeypatch.setattr(github_client, "create_repo_label", mock_create)
+
+        github_client.add_label("github.com/owner/repo", 123, "test-label")
+
+        mock_create.assert_called_once()
+
+
+class TestAddLabelCachePrecheck:
+    """Tests for add_label's cache-first label creation."""
+
+    @staticmethod
+    def _warm_cache(github_client, labels):
+        import time
+
+        github_client._label_cache["github.com/owner/repo"] = (time.monotonic(), list(labels))
 
-        call_count = 0
+    def test_add_label_skips_error_retry_when_label_cached(
+        self, github_client, gh_command_recorder
+    ):
+        """Test that a warm cache containing the label means one plain edit."""
+        self._warm_cache(github_client, ["bug", "researching"])
+        gh_command_recorder.stdout = ""
 
-        def mock_run_gh(args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                raise error
-            return ""
+        github_client.add_label("github.com/owner/repo", 123, "researching")
 
-        with (
-            patch.object(github_client, "_run_gh_command", side_effect=mock_run_gh),
-            patch.object(github_client, "create_repo_label", return_value=True) as mock_create,
-        ):
-            github_client.add_label("github.com/owner/repo", 123, "test-label")
+        assert len(gh_command_recorder.calls) == 1
+        assert gh_command_recorder.calls[0][:2] == ["issue", "edit"]
 
+    def test_add_label_creates_up_front_when_cache_lacks_label(
+        self, github_client, gh_command_recorder, monkeypatch
+    ):
+        """Test that a warm cache missing the label creates it before the edit."""
+        self._warm_cache(github_client, ["bug"])
+        mock_create = Mock(return_value=True)
+        monkeypatch.setattr(github_client, "create_repo_label", mock_create)
+        gh_command_recorder.stdout = ""
+
+        github_client.add_label("github.com/owner/repo", 123, "researching")
+
+        mock_create.assert_called_once_with(
+            "github.com/owner/repo",
+            "researching",
+            description="Research workflow in progress",
+            color="FFA500",
+        )
+        # A single successful edit - no failed optimistic attempt
+        assert len(gh_command_recorder.calls) == 1
+        assert gh_command_recorder.calls[0][:2] == ["issue", "edit"]
+
+    def test_add_label_falls_back_to_error_path_when_cache_stale(self, github_client, monkeypatch):
+        """Test that a stale cache entry keeps the optimistic edit-then-create path."""
+        import time
+
+        github_client._label_cache["github.com/owner/repo"] = (
+            time.monotonic() - github_client._LABEL_CACHE_TTL - 1,
+            ["bug"],
+        )
+        mock_run_gh, calls = _fail_once_then_succeed(
+            _label_not_found_error("label 'researching' not found")
+        )
+        mock_create = Mock(return_value=True)
+        monkeypatch.setattr(github_client, "_run_gh_command", mock_run_gh)
+        monkeypatch.setattr(github_client, "create_repo_label", mock_create)
+
+        github_client.add_label("github.com/owner/repo", 123, "researching")
+
+        # Stale cache is ignored: optimistic edit fails, label created, retried
         mock_create.assert_called_once()
+        assert calls["count"] == 2
 
 
-@pytest.mark.unit
 class TestRemoveLabel:
     """Tests for GitHubTicketClient.remove_label() method."""
 
-    def test_remove_label_success(self, github_client):
+    def test_remove_label_success(self, github_client, gh_command_recorder):
         """Test successfully removing a label."""
-        with patch.object(github_client, "_run_gh_command", return_value="") as mock_cmd:
-            github_client.remove_label("github.com/owner/repo", 123, "bug")
+        gh_command_recorder.stdout = ""
 
-        call_args = mock_cmd.call_args[0][0]
+        github_client.remove_label("github.com/owner/repo", 123, "bug")
+
+        call_args = gh_command_recorder.calls[0]
         assert "issue" in call_args
         assert "edit" in call_args
         assert "123" in call_args
         assert "--remove-label" in call_args
         assert "bug" in call_args
 
-    def test_remove_label_handles_missing_label(self, github_client):
+    def test_remove_label_handles_missing_label(self, github_client, gh_command_recorder):
         """Test that removing a non-existent label doesn't raise."""
-        error = subprocess.CalledProcessError(1, "gh")
-        error.stderr = "label not found"
-        error.stdout = ""
+        gh_command_recorder.error = _label_not_found_error("label not found")
+
+        # Should not raise
+        github_client.remove_label("github.com/owner/repo", 123, "nonexistent")
+
+
+class TestSetLabels:
+    """Tests for GitHubTicketClient.set_labels()."""
+
+    def test_add_labels_batches_single_subprocess_call(self, github_client, gh_command_recorder):
+        """Test that multiple label changes compose one gh issue edit call."""
+        gh_command_recorder.stdout = ""
+
+        github_client.set_labels(
+            "github.com/owner/repo", 123, add=["yolo_failed", "bug"], remove=["yolo"]
+        )
 
-        with patch.object(github_client, "_run_gh_command", side_effect=error):
-            # Should not raise
-            github_client.remove_label("github.com/owner/repo", 123, "nonexistent")
+        assert len(gh_command_recorder.calls) == 1
+        call_args = gh_command_recorder.calls[0]
+        assert call_args[:3] == ["issue", "edit", "123"]
+        assert call_args.count("--add-label") == 2
+        assert "yolo_failed" in call_args
+        assert "bug" in call_args
+        assert call_args.count("--remove-label") == 1
+        assert "yolo" in call_args
+
+    def test_set_labels_no_op_for_empty_changes(self, github_client, gh_command_recorder):
+        """Test that empty add and remove lists skip the subprocess entirely."""
+        github_client.set_labels("github.com/owner/repo", 123)
+
+        assert gh_command_recorder.calls == []
+
+    def test_set_labels_creates_missing_labels_and_retries(self, github_client, monkeypatch):
+        """Test that a missing-label failure creates the added labels and retries once."""
+        mock_run_gh, calls = _fail_once_then_succeed(
+            _label_not_found_error("label 'yolo_failed' not found")
+        )
+        mock_create = Mock(return_value=True)
+        monkeypatch.setattr(github_client, "_run_gh_command", mock_run_gh)
+        monkeypatch.setattr(github_client, "create_repo_label", mock_create)
+
+        github_client.set_labels("github.com/owner/repo", 123, add=["yolo_failed"], remove=["yolo"])
+
+        # yolo_failed is a REQUIRED_LABELS entry, so its metadata is used
+        mock_create.assert_called_once_with(
+            "github.com/owner/repo",
+            "yolo_failed",
+            description="YOLO auto-progression failed",
+            color="DC2626",
+        )
+        assert calls["count"] == 2
+
+    def test_set_labels_reraises_other_errors(self, github_client, gh_command_recorder):
+        """Test that non-label errors are re-raised unchanged."""
+        gh_command_recorder.error = _label_not_found_error("permission denied")
+
+        with pytest.raises(subprocess.CalledProcessError):
+            github_client.set_labels("github.com/owner/repo", 123, add=["bug"])
 
 
-@pytest.mark.unit
 class TestGetTicketLabels:
     """Tests for GitHubTicketClient.get_ticket_labels()."""
 
-    def test_get_ticket_labels_returns_multiple_labels(self, github_client):
+    def test_get_ticket_labels_returns_multiple_labels(self, github_client, graphql_stub):
         """Test fetching issue labels returns a set of label names."""
-        mock_response = {
+        graphql_stub(github_client).response = {
             "data": {
                 "repository": {
                     "issue": {
@@ -274,65 +438,60 @@ class TestGetTicketLabels:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
-            labels = github_client.get_ticket_labels("owner/repo", 42)
+        labels = github_client.get_ticket_labels("owner/repo", 42)
 
         assert labels == {"bug", "priority:high", "yolo"}
 
-    def test_get_ticket_labels_returns_empty_set_for_no_labels(self, github_client):
+    def test_get_ticket_labels_returns_empty_set_for_no_labels(self, github_client, graphql_stub):
         """Test that an empty set is returned when issue has no labels."""
-        mock_response = {"data": {"repository": {"issue": {"labels": {"nodes": []}}}}}
+        graphql_stub(github_client).response = {
+            "data": {"repository": {"issue": {"labels": {"nodes": []}}}}
+        }
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
-            labels = github_client.get_ticket_labels("owner/repo", 42)
+        labels = github_client.get_ticket_labels("owner/repo", 42)
 
         assert labels == set()
 
-    def test_get_ticket_labels_returns_empty_set_for_nonexistent_issue(self, github_client):
+    def test_get_ticket_labels_returns_empty_set_for_nonexistent_issue(
+        self, github_client, graphql_stub
+    ):
         """Test that empty set is returned when issue doesn't exist."""
-        mock_response = {"data": {"repository": {"issue": None}}}
+        graphql_stub(github_client).response = {"data": {"repository": {"issue": None}}}
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
-            labels = github_client.get_ticket_labels("owner/repo", 99999)
+        labels = github_client.get_ticket_labels("owner/repo", 99999)
 
         assert labels == set()
 
-    def test_get_ticket_labels_returns_empty_set_on_api_error(self, github_client):
+    def test_get_ticket_labels_returns_empty_set_on_api_error(self, github_client, graphql_stub):
         """Test that API errors return empty set."""
-        with patch.object(
-            github_client, "_execute_graphql_query", side_effect=Exception("API error")
-        ):
-            labels = github_client.get_ticket_labels("owner/repo", 42)
+        graphql_stub(github_client).error = Exception("API error")
+
+        labels = github_client.get_ticket_labels("owner/repo", 42)
 
         assert labels == set()
 
-    def test_get_ticket_labels_makes_correct_api_call(self, github_client):
+    def test_get_ticket_labels_makes_correct_api_call(self, github_client, graphql_stub):
         """Test that the correct GraphQL query is made with proper structure."""
-        mock_response = {
+        stub = graphql_stub(github_client)
+        stub.response = {
             "data": {"repository": {"issue": {"labels": {"nodes": [{"name": "test"}]}}}}
         }
 
-        with patch.object(
-            github_client, "_execute_graphql_query", return_value=mock_response
-        ) as mock_query:
-            github_client.get_ticket_labels("test-owner/test-repo", 123)
-
-            call_args = mock_query.call_args
-            query = call_args[0][0]
-            variables = call_args[0][1]
-
-            assert "repository(owner: $owner, name: $repo)" in query
-            assert "issue(number: $issueNumber)" in query
-            assert "labels(first: 100)" in query
-            assert "nodes" in query
-            assert "name" in query
-            assert variables["owner"] == "test-owner"
-            assert variables["repo"] == "test-repo"
-            assert variables["issueNumber"] == 123
-
-    def test_get_ticket_labels_handles_null_label_nodes(self, github_client):
+        github_client.get_ticket_labels("test-owner/test-repo", 123)
+
+        call = stub.calls[0]
+        assert "repository(owner: $owner, name: $repo)" in call.query
+        assert "issue(number: $issueNumber)" in call.query
+        assert "labels(first: 100)" in call.query
+        assert "nodes" in call.query
+        assert "name" in call.query
+        assert call.variables["owner"] == "test-owner"
+        assert call.variables["repo"] == "test-repo"
+        assert call.variables["issueNumber"] == 123
+
+    def test_get_ticket_labels_handles_null_label_nodes(self, github_client, graphql_stub):
         """Test handling of null entries in label nodes."""
-        mock_response = {
+        graphql_stub(github_client).response = {
             "data": {
                 "repository": {
                     "issue": {
@@ -344,7 +503,55 @@ class TestGetTicketLabels:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
-            labels = github_client.get_ticket_labels("owner/repo", 42)
+        labels = github_client.get_ticket_labels("owner/repo", 42)
 
         assert labels == {"valid-label", "another-label"}
+
+
+class TestGetTicketLabelsBulk:
+    """Tests for GitHubTicketClient.get_ticket_labels_bulk()."""
+
+    def test_bulk_returns_labels_per_issue(self, github_client, graphql_stub):
+        """Test that labels are returned keyed by issue number."""
+        stub = graphql_stub(github_client)
+        stub.response = {
+            "data": {
+                "repository": {
+                    "i42": {"labels": {"nodes": [{"name": "bug"}, {"name": "yolo"}]}},
+                    "i43": {"labels": {"nodes": []}},
+                    "i44": None,  # nonexistent issue
+                }
+            }
+        }
+
+        result = github_client.get_ticket_labels_bulk("owner/repo", [42, 43, 44])
+
+        assert result == {42: {"bug", "yolo"}, 43: set(), 44: set()}
+
+    def test_bulk_builds_single_aliased_query(self, github_client, graphql_stub):
+        """Test that all issues are fetched through one aliased query."""
+        stub = graphql_stub(github_client)
+        stub.response = {"data": {"repository": {"i1": None, "i2": None}}}
+
+        github_client.get_ticket_labels_bulk("owner/repo", [1, 2])
+
+        assert stub.call_count == 1
+        call = stub.calls[0]
+        assert "i1: issue(number: 1)" in call.query
+        assert "i2: issue(number: 2)" in call.query
+        assert call.variables == {"owner": "owner", "repo": "repo"}
+
+    def test_bulk_returns_empty_dict_for_no_issues(self, github_client, graphql_stub):
+        """Test that no query is made for an empty issue list."""
+        stub = graphql_stub(github_client)
+
+        assert github_client.get_ticket_labels_bulk("owner/repo", []) == {}
+        assert stub.call_count == 0
+
+    def test_bulk_returns_empty_sets_on_api_error(self, github_client, graphql_stub):
+        """Test that all issues map to empty sets on query error."""
+        graphql_stub(github_client).error = Exception("API error")
+
+        result = github_client.get_ticket_labels_bulk("owner/repo", [42, 43])
+
+        assert result == {42: set(), 43: set()}
@@ -12,38 +12,32 @@ from src.interfaces import LinkedPullRequest
 class TestGetLinkedPRs:
     """Tests for GitHubTicketClient.get_linked_prs() method."""
 
-    def test_get_linked_prs_returns_pr_list(self, github_client):
+    def test_get_linked_prs_returns_pr_list(self, github_client, graphql_linked_prs_response):
         """Test that linked PRs are returned correctly."""
-        mock_response = {
-            "data": {
-                "repository": {
-                    "issue": {
-                        "closedByPullRequestsReferences": {
-                            "nodes": [
-                                {
-                                    "number": 123,
-                                    "url": "https://github.com/owner/repo/pull/123",
-                                    "body": "Closes #42\n\nSome description",
-                                    "state": "OPEN",
-                                    "merged": False,
-                                    "headRefName": "42-feature-branch",
-                                },
-                                {
-                                    "number": 456,
-                                    "url": "https://github.com/owner/repo/pull/456",
-                                    "body": "Fixes #42",
-                                    "state": "MERGED",
-                                    "merged": True,
-                                    "headRefName": "42-other-branch",
-                                },
-                            ]
-                        }
-                    }
-                }
-            }
-        }
+        mock_response = graphql_linked_prs_response(
+            [
+                {
+                    "number": 123,
+                    "url": "https://github.com/owner/repo/pull/123",
+                    "body": "Closes #42\n\nSome description",
+                    "state": "OPEN",
+                    "merged": False,
+                    "headRefName": "42-feature-branch",
+                },
+                {
+                    "number": 456,
+                    "url": "https://github.com/owner/repo/pull/456",
+                    "body": "Fixes #42",
+                    "state": "MERGED",
+                    "merged": True,
+                    "headRefName": "42-other-branch",
+                },
+            ]
+        )
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
+        ):
             prs = github_client.get_linked_prs("github.com/owner/repo", 42)
 
         assert len(prs) == 2
@@ -57,13 +51,15 @@ class TestGetLinkedPRs:
         assert prs[1].merged is True
         assert prs[1].branch_name == "42-other-branch"
 
-    def test_get_linked_prs_returns_empty_list_when_no_prs(self, github_client):
+    def test_get_linked_prs_returns_empty_list_when_no_prs(
+        self, github_client, graphql_linked_prs_response
+    ):
         """Test that empty list is returned when there are no linked PRs."""
-        mock_response = {
-            "data": {"repository": {"issue": {"closedByPullRequestsReferences": {"nodes": []}}}}
-        }
+        mock_response = graphql_linked_prs_response([])
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
+        ):
             prs = github_client.get_linked_prs("github.com/owner/repo", 42)
 
         assert prs == []
@@ -72,7 +68,9 @@ class TestGetLinkedPRs:
         """Test that empty list is returned when issue doesn't exist."""
         mock_response = {"data": {"repository": {"issue": None}}}
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
+        ):
             prs = github_client.get_linked_prs("github.com/owner/repo", 99999)
 
         assert prs == []
@@ -80,38 +78,35 @@ class TestGetLinkedPRs:
     def test_get_linked_prs_returns_empty_list_on_api_error(self, github_client):
         """Test that empty list is returned on API error."""
         with patch.object(
-            github_client, "_execute_graphql_query", side_effect=Exception("API error")
+            github_client,
+            "_execute_graphql_query",
+            autospec=True,
+            side_effect=Exception("API error"),
         ):
             prs = github_client.get_linked_prs("github.com/owner/repo", 42)
 
         assert prs == []
 
-    def test_get_linked_prs_skips_null_nodes(self, github_client):
+    def test_get_linked_prs_skips_null_nodes(self, github_client, graphql_linked_prs_response):
         """Test that null nodes in the response are skipped."""
-        mock_response = {
-            "data": {
-                "repository": {
-                    "issue": {
-                        "closedByPullRequestsReferences": {
-                            "nodes": [
-                                None,
-                                {
-                                    "number": 123,
-                                    "url": "https://github.com/owner/repo/pull/123",
-                                    "body": "Closes #42",
-                                    "state": "OPEN",
-                                    "merged": False,
-                                    "headRefName": "42-branch",
-                                },
-                                None,
-                            ]
-                        }
-                    }
-                }
-            }
-        }
+        mock_response = graphql_linked_prs_response(
+            [
+                None,
+                {
+                    "number": 123,
+                    "url": "https://github.com/owner/repo/pull/123",
+                    "body": "Closes #42",
+                    "state": "OPEN",
+                    "merged": False,
+                    "headRefName": "42-branch",
+                },
+                None,
+            ]
+        )
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
+        ):
             prs = github_client.get_linked_prs("github.com/owner/repo", 42)
 
         assert len(prs) == 1
@@ -132,8 +127,10 @@ class TestRemovePRIssueLink:
         }
 
         with (
-            patch.object(github_client, "_execute_graphql_query", return_value=pr_response),
-            patch.object(github_client, "_run_gh_command") as mock_run,
+            patch.object(
+                github_client, "_execute_graphql_query", autospec=True, return_value=pr_response
+            ),
+            patch.object(github_client, "_run_gh_command", autospec=True) as mock_run,
         ):
             result = github_client.remove_pr_issue_link("github.com/owner/repo", 123, 42)
 
@@ -150,22 +147,21 @@ class TestRemovePRIssueLink:
         assert "closes" not in new_body.lower()
         assert "#42" in new_body
 
-    def test_remove_pr_issue_link_handles_various_keywords(self, github_client):
-        """Test that various linking keywords are removed."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "original,expected",
+        [
             ("Fixes #42", "#42"),
             ("fixes: #42", "#42"),
             ("CLOSES #42", "#42"),
             ("Resolves #42", "#42"),
             ("This PR closes #42", "This PR #42"),
             ("Fix #42 and close #99", "#42 and close #99"),  # Removes "Fix" keyword for #42
-        ]
-
-        for original, expected in test_cases:
-            result = github_client._remove_closes_keyword(original, 42)
-            assert result == expected, (
-                f"Failed for '{original}': got '{result}' expected '{expected}'"
-            )
+        ],
+    )
+    def test_remove_pr_issue_link_handles_various_keywords(self, github_client, original, expected):
+        """Test that various linking keywords are removed."""
+        result = github_client._remove_closes_keyword(original, 42)
+        assert result == expected
 
     def test_remove_pr_issue_link_returns_false_when_no_keyword(self, github_client):
         """Test that False is returned when no linking keyword is found."""
@@ -177,7 +173,9 @@ class TestRemovePRIssueLink:
             }
         }
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=pr_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=pr_response
+        ):
             result = github_client.remove_pr_issue_link("github.com/owner/repo", 123, 42)
 
         assert result is False
@@ -186,7 +184,9 @@ class TestRemovePRIssueLink:
         """Test that False is returned when PR doesn't exist."""
         pr_response = {"data": {"repository": {"pullRequest": None}}}
 
-        with patch.object(github_client, "_execute_graphql_query", return_value=pr_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=pr_response
+        ):
             result = github_client.remove_pr_issue_link("github.com/owner/repo", 99999, 42)
 
         assert result is False
@@ -194,7 +194,10 @@ class TestRemovePRIssueLink:
     def test_remove_pr_issue_link_returns_false_on_api_error(self, github_client):
         """Test that False is returned on API error."""
         with patch.object(
-            github_client, "_execute_graphql_query", side_effect=Exception("API error")
+            github_client,
+            "_execute_graphql_query",
+            autospec=True,
+            side_effect=Exception("API error"),
         ):
             result = github_client.remove_pr_issue_link("github.com/owner/repo", 123, 42)
 
@@ -205,49 +208,23 @@ class TestRemovePRIssueLink:
 class TestRemoveClosesKeyword:
     """Tests for GitHubTicketClient._remove_closes_keyword() helper method."""
 
-    def test_remove_closes_keyword_close(self, github_client):
-        """Test removing 'close' keyword."""
-        result = github_client._remove_closes_keyword("close #123", 123)
-        assert result == "#123"
-
-    def test_remove_closes_keyword_closes(self, github_client):
-        """Test removing 'closes' keyword."""
-        result = github_client._remove_closes_keyword("closes #123", 123)
-        assert result == "#123"
-
-    def test_remove_closes_keyword_closed(self, github_client):
-        """Test removing 'closed' keyword."""
-        result = github_client._remove_closes_keyword("closed #123", 123)
-        assert result == "#123"
-
-    def test_remove_closes_keyword_fix(self, github_client):
-        """Test removing 'fix' keyword."""
-        result = github_client._remove_closes_keyword("fix #123", 123)
-        assert result == "#123"
-
-    def test_remove_closes_keyword_fixes(self, github_client):
-        """Test removing 'fixes' keyword."""
-        result = github_client._remove_closes_keyword("fixes #123", 123)
-        assert result == "#123"
-
-    def test_remove_closes_keyword_fixed(self, github_client):
-        """Test removing 'fixed' keyword."""
-        result = github_client._remove_closes_keyword("fixed #123", 123)
-        assert result == "#123"
-
-    def test_remove_closes_keyword_resolve(self, github_client):
-        """Test removing 'resolve' keyword."""
-        result = github_client._remove_closes_keyword("resolve #123", 123)
-        assert result == "#123"
-
-    def test_remove_closes_keyword_resolves(self, github_client):
-        """Test removing 'resolves' keyword."""
-        result = github_client._remove_closes_keyword("resolves #123", 123)
-        assert result == "#123"
-
-    def test_remove_closes_keyword_resolved(self, github_client):
-        """Test removing 'resolved' keyword."""
-        result = github_client._remove_closes_keyword("resolved #123", 123)
+    @pytest.mark.parametrize(
+        "keyword",
+        [
+            "close",
+            "closes",
+            "closed",
+            "fix",
+            "fixes",
+            "fixed",
+            "resolve",
+            "resolves",
+            "resolved",
+        ],
+    )
+    def test_remove_closes_keyword_variants(self, github_client, keyword):
+        """Test removing each GitHub linking keyword variant."""
+        result = github_client._remove_closes_keyword(f"{keyword} #123", 123)
         assert result == "#123"
 
     def test_remove_closes_keyword_with_colon(self, github_client):
@@ -294,7 +271,7 @@ class TestClosePr:
 
     def test_close_pr_success(self, github_client):
         """Test successfully closing a PR."""
-        with patch.object(github_client, "_run_gh_command") as mock_run:
+        with patch.object(github_client, "_run_gh_command", autospec=True) as mock_run:
             result = github_client.close_pr("github.com/owner/repo", 123)
 
         assert result is True
@@ -302,18 +279,19 @@ class TestClosePr:
         call_args = mock_run.call_args[0][0]
         assert call_args == ["pr", "close", "123", "--repo", "https://github.com/owner/repo"]
 
-    def test_close_pr_returns_false_on_error(self, github_client):
+    @pytest.mark.parametrize("stderr", ["PR is already closed", "API error"])
+    def test_close_pr_returns_false_on_error(self, github_client, stderr):
         """Test that False is returned when gh command fails."""
         error = subprocess.CalledProcessError(1, "gh")
-        error.stderr = "PR is already closed"
-        with patch.object(github_client, "_run_gh_command", side_effect=error):
+        error.stderr = stderr
+        with patch.object(github_client, "_run_gh_command", autospec=True, side_effect=error):
             result = github_client.close_pr("github.com/owner/repo", 123)
 
         assert result is False
 
     def test_close_pr_uses_correct_repo_reference(self, github_client):
         """Test that the full repo URL is used for GHES compatibility."""
-        with patch.object(github_client, "_run_gh_command") as mock_run:
+        with patch.object(github_client, "_run_gh_command", autospec=True) as mock_run:
             github_client.close_pr("github.example.com/myorg/myrepo", 456)
 
         call_args = mock_run.call_args[0][0]
@@ -323,7 +301,7 @@ class TestClosePr:
 
     def test_close_pr_passes_repo_for_hostname_lookup(self, github_client):
         """Test that repo is passed for hostname lookup."""
-        with patch.object(github_client, "_run_gh_command") as mock_run:
+        with patch.object(github_client, "_run_gh_command", autospec=True) as mock_run:
             github_client.close_pr("github.com/owner/repo", 99)
 
         mock_run.assert_called_once()
@@ -336,7 +314,7 @@ class TestDeleteBranch:
 
     def test_delete_branch_success(self, github_client):
         """Test successfully deleting a branch."""
-        with patch.object(github_client, "_run_gh_command") as mock_run:
+        with patch.object(github_client, "_run_gh_command", autospec=True) as mock_run:
             result = github_client.delete_branch("github.com/owner/repo", "feature-branch")
 
         assert result is True
@@ -349,27 +327,26 @@ class TestDeleteBranch:
             "DELETE",
         ]
 
-    def test_delete_branch_returns_false_when_not_found(self, github_client):
-        """Test that False is returned when branch doesn't exist."""
+    @pytest.mark.parametrize(
+        "stderr,branch",
+        [
+            ("HTTP 404: Not Found", "nonexistent-branch"),
+            ("API error", "feature-branch"),
+        ],
+        ids=["not-found", "api-error"],
+    )
+    def test_delete_branch_returns_false_on_error(self, github_client, stderr, branch):
+        """Test that False is returned when the branch is missing or the API errors."""
         error = subprocess.CalledProcessError(1, "gh")
-        error.stderr = "HTTP 404: Not Found"
-        with patch.object(github_client, "_run_gh_command", side_effect=error):
-            result = github_client.delete_branch("github.com/owner/repo", "nonexistent-branch")
-
-        assert result is False
-
-    def test_delete_branch_returns_false_on_error(self, github_client):
-        """Test that False is returned on API error."""
-        error = subprocess.CalledProcessError(1, "gh")
-        error.stderr = "API error"
-        with patch.object(github_client, "_run_gh_command", side_effect=error):
-            result = github_client.delete_branch("github.com/owner/repo", "feature-branch")
+        error.stderr = stderr
+        with patch.object(github_client, "_run_gh_command", autospec=True, side_effect=error):
+            result = github_client.delete_branch("github.com/owner/repo", branch)
 
         assert result is False
 
     def test_delete_branch_handles_slashes_in_name(self, github_client):
         """Test that branch names with slashes are URL-encoded."""
-        with patch.object(github_client, "_run_gh_command") as mock_run:
+        with patch.object(github_client, "_run_gh_command", autospec=True) as mock_run:
             github_client.delete_branch("github.com/owner/repo", "feature/my-feature")
 
         call_args = mock_run.call_args[0][0]
@@ -383,7 +360,7 @@ class TestDeleteBranch:
 
     def test_delete_branch_uses_hostname_for_ghes(self, github_client):
         """Test that hostname is passed for GHES compatibility."""
-        with patch.object(github_client, "_run_gh_command") as mock_run:
+        with patch.object(github_client, "_run_gh_command", autospec=True) as mock_run:
             github_client.delete_branch("github.example.com/myorg/myrepo", "feature-branch")
 
         mock_run.assert_called_once()
@@ -391,7 +368,7 @@ class TestDeleteBranch:
 
     def test_delete_branch_parses_repo_correctly(self, github_client):
         """Test that repo is parsed correctly for API endpoint."""
-        with patch.object(github_client, "_run_gh_command") as mock_run:
+        with patch.object(github_client, "_run_gh_command", autospec=True) as mock_run:
             github_client.delete_branch("github.com/my-org/my-repo", "fix-bug")
 
         call_args = mock_run.call_args[0][0]
@@ -402,61 +379,32 @@ class TestDeleteBranch:
 class TestGetPrState:
     """Tests for GitHubTicketClient.get_pr_state() method."""
 
-    def test_get_pr_state_returns_open(self, github_client):
-        """Test that OPEN state is returned for an open PR."""
-        mock_response = {
-            "data": {
-                "repository": {
-                    "pullRequest": {
-                        "state": "OPEN",
-                        "merged": False,
-                    }
-                }
-            }
-        }
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
-            result = github_client.get_pr_state("github.com/owner/repo", 123)
-
-        assert result == "OPEN"
-
-    def test_get_pr_state_returns_closed(self, github_client):
-        """Test that CLOSED state is returned for a closed PR."""
-        mock_response = {
-            "data": {
-                "repository": {
-                    "pullRequest": {
-                        "state": "CLOSED",
-                        "merged": False,
-                    }
-                }
-            }
-        }
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
-            result = github_client.get_pr_state("github.com/owner/repo", 123)
-
-        assert result == "CLOSED"
-
-    def test_get_pr_state_returns_merged(self, github_client):
-        """Test that MERGED state is returned for a merged PR."""
-        mock_response = {
-            "data": {
-                "repository": {
-                    "pullRequest": {
-                        "state": "CLOSED",
-                        "merged": True,
-                    }
-                }
-            }
-        }
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
+    @pytest.mark.parametrize(
+        "state,merged,expected",
+        [
+            ("OPEN", False, "OPEN"),
+            ("CLOSED", False, "CLOSED"),
+            ("CLOSED", True, "MERGED"),
+        ],
+    )
+    def test_get_pr_state_returns_state(
+        self, github_client, graphql_pr_response, state, merged, expected
+    ):
+        """Test that the PR state (including merged) is derived correctly."""
+        mock_response = graphql_pr_response(state=state, merged=merged)
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
+        ):
             result = github_client.get_pr_state("github.com/owner/repo", 123)
 
-        assert result == "MERGED"
+        assert result == expected
 
     def test_get_pr_state_returns_none_when_pr_not_found(self, github_client):
         """Test that None is returned when PR doesn't exist."""
         mock_response = {"data": {"repository": {"pullRequest": None}}}
-        with patch.object(github_client, "_execute_graphql_query", return_value=mock_response):
+        with patch.object(
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
+        ):
             result = github_client.get_pr_state("github.com/owner/repo", 999)
 
         assert result is None
@@ -464,26 +412,20 @@ class TestGetPrState:
     def test_get_pr_state_returns_none_on_error(self, github_client):
         """Test that None is returned on API error (fail-safe)."""
         with patch.object(
-            github_client, "_execute_graphql_query", side_effect=Exception("API error")
+            github_client,
+            "_execute_graphql_query",
+            autospec=True,
+            side_effect=Exception("API error"),
         ):
             result = github_client.get_pr_state("github.com/owner/repo", 123)
 
         assert result is None
 
-    def test_get_pr_state_queries_correct_repo(self, github_client):
+    def test_get_pr_state_queries_correct_repo(self, github_client, graphql_pr_response):
         """Test that the correct repo is queried."""
-        mock_response = {
-            "data": {
-                "repository": {
-                    "pullRequest": {
-                        "state": "OPEN",
-                        "merged": False,
-                    }
-                }
-            }
-        }
+        mock_response = graphql_pr_response()
         with patch.object(
-            github_client, "_execute_graphql_query", return_value=mock_response
+            github_client, "_execute_graphql_query", autospec=True, return_value=mock_response
         ) as mock_query:
             github_client.get_pr_state("github.com/myorg/myrepo", 456)
 
@@ -499,46 +441,30 @@ class TestGetPrState:
 class TestLinkedPullRequest:
     """Tests for LinkedPullRequest dataclass."""
 
-    def test_linked_pr_creation(self):
-        """Test creating a LinkedPullRequest instance."""
+    @pytest.mark.parametrize(
+        "kwargs,expected_branch",
+        [
+            ({"state": "OPEN", "merged": False}, None),
+            (
+                {"state": "OPEN", "merged": False, "branch_name": "42-feature-branch"},
+                "42-feature-branch",
+            ),
+            ({"state": "MERGED", "merged": True}, None),
+        ],
+        ids=["defaults", "with-branch-name", "merged"],
+    )
+    def test_linked_pr_fields(self, kwargs, expected_branch):
+        """Smoke test the dataclass fields, including the branch_name default."""
         pr = LinkedPullRequest(
             number=123,
             url="https://github.com/owner/repo/pull/123",
             body="Closes #42",
-            state="OPEN",
-            merged=False,
+            **kwargs,
         )
 
         assert pr.number == 123
         assert pr.url == "https://github.com/owner/repo/pull/123"
         assert pr.body == "Closes #42"
-        assert pr.state == "OPEN"
-        assert pr.merged is False
-        assert pr.branch_name is None
-
-    def test_linked_pr_with_branch_name(self):
-        """Test creating a LinkedPullRequest with branch_name."""
-        pr = LinkedPullRequest(
-            number=123,
-            url="https://github.com/owner/repo/pull/123",
-            body="Closes #42",
-            state="OPEN",
-            merged=False,
-            branch_name="42-feature-branch",
-        )
-
-        assert pr.number == 123
-        assert pr.branch_name == "42-feature-branch"
-
-    def test_linked_pr_merged_state(self):
-        """Test LinkedPullRequest with merged state."""
-        pr = LinkedPullRequest(
-            number=456,
-            url="https://github.com/owner/repo/pull/456",
-            body="Fixes #99",
-            state="MERGED",
-            merged=True,
-        )
-
-        assert pr.state == "MERGED"
-        assert pr.merged is True
+        assert pr.state == kwargs["state"]
+        assert pr.merged is kwargs["merged"]
+        assert pr.branch_name == expected_branch
@@ -1450,14 +1450,12 @@ class TestYoloLabelRemovalDuringWorkflow:
             with pytest.raises(Exception, match="Workflow failed"):
                 daemon._process_item_workflow(item)
 
-            # Verify YOLO label was removed
-            daemon.ticket_client.remove_label.assert_any_call(
-                "github.com/owner/repo", 42, Labels.YOLO
-            )
-
-            # Verify yolo_failed label was added
-            daemon.ticket_client.add_label.assert_any_call(
-                "github.com/owner/repo", 42, Labels.YOLO_FAILED
+            # Verify YOLO was removed and yolo_failed added in one batched call
+            daemon.ticket_client.set_labels.assert_any_call(
+                "github.com/owner/repo",
+                42,
+                add=[Labels.YOLO_FAILED],
+                remove=[Labels.YOLO],
             )
 
 
@@ -12,13 +12,19 @@ import pytest
 from src.ticket_clients.github import GitHubTicketClient
 
 
+@pytest.fixture(scope="module")
+def gh_client():
+    """Shared GitHubTicketClient; tests never mutate it directly."""
+    return GitHubTicketClient({"github.com": "fake_token"})
+
+
 @pytest.mark.integration
 class TestGitHubTicketClientIntegration:
     """Integration tests for GitHubTicketClient."""
 
-    def test_parse_board_url_valid_formats(self):
+    def test_parse_board_url_valid_formats(self, gh_client):
         """Test _parse_board_url with various valid URL formats."""
-        client = GitHubTicketClient({"github.com": "fake_token"})
+        client = gh_client
 
         # Standard org format
         hostname, entity_type, login, num = client._parse_board_url(
@@ -56,9 +62,9 @@ class TestGitHubTicketClientIntegration:
         assert login == "myuser"
         assert num == 5
 
-    def test_parse_board_url_invalid_formats(self):
+    def test_parse_board_url_invalid_formats(self, gh_client):
         """Test _parse_board_url raises ValueError for invalid URLs."""
-        client = GitHubTicketClient({"github.com": "fake_token"})
+        client = gh_client
 
         # Invalid URLs
         with pytest.raises(ValueError, match="Invalid project URL format"):
@@ -70,9 +76,9 @@ class TestGitHubTicketClientIntegration:
         with pytest.raises(ValueError, match="Invalid project URL format"):
             client._parse_board_url("not a url")
 
-    def test_parse_board_item_node_valid_issue(self):
+    def test_parse_board_item_node_valid_issue(self, gh_client):
         """Test _parse_board_item_node with valid issue node data."""
-        client = GitHubTicketClient({"github.com": "fake_token"})
+        client = gh_client
 
         node = {
             "id": "PVTI_item123",
@@ -95,9 +101,9 @@ class TestGitHubTicketClientIntegration:
         assert item.repo == "github.com/owner/repo"
         assert item.status == "Research"
 
-    def test_parse_board_item_node_non_issue(self):
+    def test_parse_board_item_node_non_issue(self, gh_client):
         """Test _parse_board_item_node returns None for non-issue nodes."""
-        client = GitHubTicketClient({"github.com": "fake_token"})
+        client = gh_client
 
         # Node without issue content
         node = {"id": "PVTI_item456", "content": None, "fieldValues": {"nodes": []}}
@@ -106,9 +112,9 @@ class TestGitHubTicketClientIntegration:
         item = client._parse_board_item_node(node, board_url, "github.com")
         assert item is None
 
-    def test_parse_board_item_node_missing_status(self):
+    def test_parse_board_item_node_missing_status(self, gh_client):
         """Test _parse_board_item_node handles missing status field."""
-        client = GitHubTicketClient({"github.com": "fake_token"})
+        client = gh_client
 
         node = {
             "id": "PVTI_item789",
@@ -126,9 +132,9 @@ class TestGitHubTicketClientIntegration:
         assert item is not None
         assert item.status == "Unknown"
 
-    def test_parse_board_item_node_repo_format_always_includes_hostname(self):
+    def test_parse_board_item_node_repo_format_always_includes_hostname(self, gh_client):
         """Test that repo format is always hostname/owner/repo."""
-        client = GitHubTicketClient({"github.com": "fake_token"})
+        client = gh_client
 
         node = {
             "id": "PVTI_item123",
@@ -149,9 +155,9 @@ class TestGitHubTicketClientIntegration:
         # Verify hostname is first segment
         assert item.repo.split("/")[0] == "github.com"
 
-    def test_execute_graphql_query_mocked(self, mock_gh_subprocess):
+    def test_execute_graphql_query_mocked(self, mock_gh_subprocess, gh_client):
         """Test _execute_graphql_query with mocked subprocess."""
-        client = GitHubTicketClient({"github.com": "test_token"})
+        client = gh_client
 
         # Mock response
         mock_response = {"data": {"organization": {"projectV2": {"title": "Test Project"}}}}
@@ -171,9 +177,9 @@ class TestGitHubTicketClientIntegration:
         assert "api" in args
         assert "graphql" in args
 
-    def test_execute_graphql_query_handles_errors(self, mock_gh_subprocess):
+    def test_execute_graphql_query_handles_errors(self, mock_gh_subprocess, gh_client):
         """Test _execute_graphql_query handles GraphQL errors in response."""
-        client = GitHubTicketClient({"github.com": "test_token"})
+        client = gh_client
 
         # Mock response with errors
         mock_response = {
@@ -188,9 +194,9 @@ class TestGitHubTicketClientIntegration:
         with pytest.raises(ValueError, match="GraphQL errors"):
             client._execute_graphql_query(query, variables)
 
-    def test_execute_graphql_query_handles_invalid_json(self, mock_gh_subprocess):
+    def test_execute_graphql_query_handles_invalid_json(self, mock_gh_subprocess, gh_client):
         """Test _execute_graphql_query handles invalid JSON response."""
-        client = GitHubTicketClient({"github.com": "test_token"})
+        client = gh_client
 
         # Mock invalid JSON response
         mock_gh_subprocess.return_value.stdout = "not valid json"
@@ -207,9 +213,9 @@ class TestGitHubTicketClientIntegration:
 class TestGitHubTicketClientLabelMethods:
     """Integration tests for GitHubTicketClient label methods."""
 
-    def test_add_label_mocked(self, mock_gh_subprocess):
+    def test_add_label_mocked(self, mock_gh_subprocess, gh_client):
         """Test add_label uses REST API via gh issue edit."""
-        client = GitHubTicketClient({"github.com": "test_token"})
+        client = gh_client
 
         mock_result = MagicMock()
         mock_result.stdout = ""
@@ -226,9 +232,9 @@ class TestGitHubTicketClientLabelMethods:
         assert "--add-label" in call_args
         assert "researching" in call_args
 
-    def test_remove_label_mocked(self, mock_gh_subprocess):
+    def test_remove_label_mocked(self, mock_gh_subprocess, gh_client):
         """Test remove_label uses REST API via gh issue edit."""
-        client = GitHubTicketClient({"github.com": "test_token"})
+        client = gh_client
 
         mock_result = MagicMock()
         mock_result.stdout = ""
@@ -245,11 +251,11 @@ class TestGitHubTicketClientLabelMethods:
         assert "--remove-label" in call_args
         assert "researching" in call_args
 
-    def test_remove_label_handles_missing_label(self, mock_gh_subprocess):
+    def test_remove_label_handles_missing_label(self, mock_gh_subprocess, gh_client):
         """Test remove_label handles label not on issue gracefully."""
         import subprocess
 
-        client = GitHubTicketClient({"github.com": "test_token"})
+        client = gh_client
 
         # Simulate gh failing when label doesn't exist
         mock_gh_subprocess.side_effect = subprocess.CalledProcessError(1, "gh")
@@ -838,7 +838,7 @@ class TestImplementWorkflow:
             call_kwargs = mock_run_claude.call_args
             assert call_kwargs.kwargs["model"] == "opus"
 
-    def test_execute_creates_pr_when_none_exists(self, workflow_context):
+    def test_execute_creates_pr_when_none_exists(self, workflow_context, gh_version):
         """Test that execute() calls /prepare_implementation_github when no PR exists."""
         from unittest.mock import MagicMock, patch
 
@@ -1446,7 +1446,7 @@ Some other content here.
         # PR should NOT be marked ready (incomplete due to safety exit)
         mock_ready.assert_not_called()
 
-    def test_execute_passes_base_flag_when_parent_branch_set(self, workflow_context):
+    def test_execute_passes_base_flag_when_parent_branch_set(self, workflow_context, gh_version):
         """Test that execute() passes --base flag to /prepare_implementation_github when parent_branch is set."""
         from unittest.mock import MagicMock, patch
 
@@ -1502,7 +1502,7 @@ Some other content here.
         prepare_prompt = prepare_calls[0][0][0]
         assert "--base feature/parent-branch" in prepare_prompt
 
-    def test_execute_no_base_flag_when_parent_branch_not_set(self, workflow_context):
+    def test_execute_no_base_flag_when_parent_branch_not_set(self, workflow_context, gh_version):
         """Test that execute() does NOT pass --base flag when parent_branch is not set."""
         from unittest.mock import MagicMock, patch
 